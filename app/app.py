@@ -11,8 +11,8 @@ from pathlib import Path
 # Add backend to path
 sys.path.insert(0, str(Path(__file__).parent))
 
-from backend.conversation_manager import ConversationManager
 from backend.config import get_config
+from backend.resources import warm_up_in_background
 
 
 # Page configuration
@@ -53,6 +53,15 @@ def render_sidebar():
             session_id = st.session_state.conversation_manager.get_session_id()
             st.code(session_id[:8], language=None)
 
+            # Latency of the most recent turn
+            last_turn = st.session_state.conversation_manager.last_turn
+            if last_turn:
+                metrics = last_turn["metrics"]
+                st.caption(
+                    f"First token: {metrics['time_to_first_token']:.2f}s · "
+                    f"Total: {metrics['total_latency']:.2f}s"
+                )
+
             st.markdown("### Phase")
             phase = st.session_state.conversation_manager.phase
             if phase == "INTAKE":
@@ -83,7 +92,7 @@ def render_sidebar():
                 st.markdown("### Retrieved Scenarios")
                 for scenario in st.session_state.retrieved_scenarios:
                     st.markdown(f"**{scenario['id']}: {scenario['title']}**")
-                    st.caption(f"Similarity: {scenario['similarity_score']:.2f}")
+                    st.caption(format_scenario_score(scenario, "Similarity"))
 
         st.markdown("---")
 
@@ -94,6 +103,63 @@ def render_sidebar():
             st.session_state.retrieved_scenarios = None
             st.rerun()
 
+        render_resume_picker()
+
+
+def format_scenario_score(scenario: dict, label: str) -> str:
+    """Caption for a retrieved scenario (BM25 score when it was found lexically only)."""
+    if scenario.get("similarity_score") is not None:
+        return f"{label}: {scenario['similarity_score']:.2f}"
+    return f"Keyword match (BM25): {scenario.get('lexical_score') or 0:.2f}"
+
+
+def format_catalog_entry(entry: dict) -> str:
+    """Format a session catalog entry as a picker label."""
+    phase = "💬" if entry["phase_transition_at"] else "📝"
+    details = " · ".join(v for v in (entry["diagnosis"], entry["patient_age"]) if v)
+    label = f"{phase} {entry['session_id'][:8]} · {(entry['created_at'] or '')[:10]} · {entry['turn_count']} turns"
+    return f"{label} · {details}" if details else label
+
+
+def render_resume_picker():
+    """Render the "resume session" picker, backed by the session catalog."""
+    from backend.resources import get_session_catalog
+
+    st.markdown("### Resume Session")
+    query = st.text_input(
+        "Search sessions",
+        placeholder="Session ID, diagnosis, age...",
+        label_visibility="collapsed"
+    )
+    entries = get_session_catalog().search(query=query or None, min_turns=1, limit=20)
+    if not entries:
+        st.caption("No saved sessions found")
+        return
+
+    labels = {entry["session_id"]: format_catalog_entry(entry) for entry in entries}
+    session_id = st.selectbox(
+        "Session",
+        options=list(labels),
+        format_func=labels.get,
+        label_visibility="collapsed"
+    )
+
+    if st.button("📂 Resume", use_container_width=True):
+        # Imported here so the first page renders before LangChain is loaded
+        from backend.conversation_manager import ConversationManager
+
+        try:
+            with st.spinner("Loading session..."):
+                manager = ConversationManager(session_id)
+        except Exception as e:
+            st.error(f"Failed to resume: {str(e)}")
+            return
+
+        st.session_state.conversation_manager = manager
+        st.session_state.chat_history = manager.chat_history()
+        st.session_state.retrieved_scenarios = manager.retrieved_scenarios
+        st.rerun()
+
 
 def render_chat_interface():
     """Render the main chat interface."""
@@ -101,6 +167,9 @@ def render_chat_interface():
 
     # Initialize conversation manager if needed
     if st.session_state.conversation_manager is None:
+        # Imported here so the first page renders before LangChain is loaded
+        from backend.conversation_manager import ConversationManager
+
         with st.spinner("Initializing session..."):
             try:
                 st.session_state.conversation_manager = ConversationManager()
@@ -119,7 +188,7 @@ def render_chat_interface():
                 with st.expander("📚 Retrieved Scenarios"):
                     for scenario in message["scenarios"]:
                         st.markdown(f"**{scenario['title']}**")
-                        st.caption(f"Similarity Score: {scenario['similarity_score']:.2f}")
+                        st.caption(format_scenario_score(scenario, "Similarity Score"))
 
     # Chat input
     user_input = st.chat_input("Type your message here...")
@@ -135,30 +204,30 @@ def render_chat_interface():
             "content": user_input
         })
 
-        # Get AI response
+        # Get AI response (streamed chunk by chunk)
         with st.chat_message("assistant"):
-            with st.spinner("Thinking..."):
-                try:
-                    result = st.session_state.conversation_manager.send_message(user_input)
+            try:
+                manager = st.session_state.conversation_manager
+                with st.spinner("Thinking..."):
+                    st.write_stream(manager.stream_message(user_input))
 
-                    # Display response
-                    st.markdown(result["response"])
+                result = manager.last_turn
 
-                    # Add to history
-                    st.session_state.chat_history.append({
-                        "role": "assistant",
-                        "content": result["response"]
-                    })
+                # Add to history
+                st.session_state.chat_history.append({
+                    "role": "assistant",
+                    "content": result["response"]
+                })
 
-                    # Handle phase transition (scenarios only exist after transitioning to MENTORING)
-                    if result["phase"] == "MENTORING" and result["scenarios"]:
-                        st.session_state.retrieved_scenarios = result["scenarios"]
-                        st.success("✨ Context gathering complete! Transitioning to mentoring phase...")
-                        st.rerun()
+                # Handle phase transition (scenarios only exist after transitioning to MENTORING)
+                if result["phase"] == "MENTORING" and result["scenarios"]:
+                    st.session_state.retrieved_scenarios = result["scenarios"]
+                    st.success("✨ Context gathering complete! Transitioning to mentoring phase...")
+                    st.rerun()
 
-                except Exception as e:
-                    st.error(f"Error: {str(e)}")
-                    st.exception(e)
+            except Exception as e:
+                st.error(f"Error: {str(e)}")
+                st.exception(e)
 
 
 def render_welcome_screen():
@@ -197,6 +266,9 @@ def main():
     render_welcome_screen()
     render_chat_interface()
 
+    # Preload LLM/Chroma clients once the page is on screen
+    warm_up_in_background()
+
 
 if __name__ == "__main__":
     main()
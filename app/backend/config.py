@@ -54,9 +54,83 @@ class AppConfig:
     top_k_scenarios: int = 2  # Number of scenarios to retrieve
     chroma_db_path: str = os.path.join(os.path.dirname(os.path.dirname(__file__)), "data", "chroma_db")
     chroma_collection_name: str = "ot_scenarios"
+    # Query path: "chroma" queries the Chroma collection, "numpy" loads its
+    # vectors once into an in-process index (backend.vector_index)
+    vector_backend: Literal["chroma", "numpy"] = os.getenv("VECTOR_BACKEND", "chroma")
+    # Portable scenario-embedding bundle (scripts/scenario_bundle.py); when it
+    # exists the numpy backend memory-maps it instead of opening Chroma
+    vector_bundle_dir: str = os.path.join(os.path.dirname(os.path.dirname(__file__)), "data", "scenario_bundle")
+    # Hybrid retrieval: fuse the dense ranking with a local BM25 index built at
+    # ingestion (reciprocal rank fusion); the BM25 side alone answers when the
+    # embedding call fails or takes longer than dense_timeout_seconds
+    hybrid_retrieval: bool = os.getenv("HYBRID_RETRIEVAL", "1").lower() in ("1", "true", "yes")
+    lexical_index_path: str = os.path.join(os.path.dirname(os.path.dirname(__file__)), "data", "bm25_index.json")
+    hybrid_candidates: int = 10  # Candidates per ranking before fusion
+    rrf_k: int = 60
+    dense_timeout_seconds: float = 5.0
+    # Structured scenario metadata extracted at ingestion (template fields plus
+    # age/setting/diagnosis buckets): "boost" ranks scenarios sharing the
+    # session's buckets higher, "filter" searches only those scenarios
+    scenario_metadata_mode: Literal["off", "boost", "filter"] = os.getenv("SCENARIO_METADATA_MODE", "boost")
+    scenario_metadata_path: str = os.path.join(
+        os.path.dirname(os.path.dirname(__file__)), "data", "scenario_metadata.json"
+    )
+
+    # Disk-backed LLM response cache (opt-in, for replays and benchmarks)
+    llm_cache_enabled: bool = os.getenv("LLM_CACHE_ENABLED", "").lower() in ("1", "true", "yes")
+    llm_cache_path: str = os.path.join(os.path.dirname(os.path.dirname(__file__)), "data", "llm_cache.sqlite3")
+    llm_cache_max_bytes: int = 100 * 1024 * 1024  # LRU eviction above 100 MB of responses
 
-    # Session persistence
+    # Persistent query/document embedding cache (retriever and ingestion)
+    embedding_cache_enabled: bool = os.getenv("EMBEDDING_CACHE_ENABLED", "1").lower() in ("1", "true", "yes")
+    embedding_cache_path: str = os.path.join(os.path.dirname(os.path.dirname(__file__)), "data", "embedding_cache.sqlite3")
+    embedding_cache_max_entries: int = 50_000  # LRU eviction above this many vectors
+
+    # Session persistence: "files" keeps one directory per session under
+    # sessions_dir, "sqlite" keeps all sessions in one database at sessions_db_path
+    session_backend: Literal["files", "sqlite"] = os.getenv("SESSION_BACKEND", "files")
     sessions_dir: str = os.path.join(os.path.dirname(os.path.dirname(__file__)), "sessions")
+    sessions_db_path: str = os.path.join(os.path.dirname(os.path.dirname(__file__)), "data", "sessions.sqlite3")
+    session_catalog_path: str = os.path.join(os.path.dirname(os.path.dirname(__file__)), "data", "session_catalog.sqlite3")
+    prompt_blobs_dir: str = os.path.join(os.path.dirname(os.path.dirname(__file__)), "data", "prompt_blobs")
+    journal_compaction_interval: int = 50  # Journal entries before folding into conversation.json
+    # Cold-session archive: sessions idle longer than the TTL are moved into
+    # compressed per-session bundles (scripts/archive_sessions.py)
+    archive_dir: str = os.path.join(os.path.dirname(os.path.dirname(__file__)), "data", "archive")
+    archive_ttl_days: float = 30.0
+    state_snapshots: bool = True  # Save a bookkeeping state snapshot per session for fast resume
+    write_behind: bool = True  # Flush session files in the background instead of on the request path
+    flush_interval_seconds: float = 1.0  # Background flush period
+
+    # INTAKE turn execution: "sequential" runs template extraction before
+    # reply generation, "concurrent" overlaps the two LLM calls
+    intake_execution_mode: Literal["sequential", "concurrent"] = os.getenv(
+        "INTAKE_EXECUTION_MODE", "sequential"
+    )
+    # Shared background worker pool (concurrent extraction, summary updates,
+    # scenario pre-retrieval)
+    background_workers: int = int(os.getenv("BACKGROUND_WORKERS", "4"))
+
+    # Template extraction: "incremental" sends only the current template plus
+    # the messages since the last extraction, "full" resends the whole dialogue
+    extraction_mode: Literal["incremental", "full"] = "incremental"
+    full_extraction_interval: int = 5  # Every Nth extraction re-reads the full conversation
+
+    # Local fast-path extractor: fill obvious fields with patterns and skip the
+    # extraction LLM call when the user message adds nothing new
+    fast_path_extraction: bool = True
+    fast_path_novelty_threshold: float = 0.2  # Novel content share that still triggers the LLM
+
+    # Rolling summary (MENTORING): keep the last N exchanges verbatim and fold
+    # older ones into a summary, in batches of summary_batch_exchanges
+    rolling_summary: bool = True
+    context_window_exchanges: int = 10
+    summary_batch_exchanges: int = 5
+
+    # Background scenario pre-retrieval once all critical fields are filled;
+    # reused at transition if the summary is at least this similar (word Jaccard)
+    prefetch_scenarios: bool = True
+    prefetch_reuse_similarity: float = 0.8
 
     # Phase transition criteria
     critical_fields_count: int = 5  # Must have all 5 critical fields
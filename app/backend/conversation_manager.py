@@ -4,11 +4,14 @@ Conversation Manager - orchestrates the OT Mentor conversation flow.
 Manages phase transitions, LLM interactions, RAG retrieval, and session persistence.
 """
 
-from typing import List, Dict, Any, Literal, Optional
+import asyncio
+import re
+import time
+from concurrent.futures import Future
+from typing import List, Dict, Any, Generator, Iterator, Literal, Optional
 from datetime import datetime
 from pydantic import BaseModel, Field
 
-from langchain_google_genai import ChatGoogleGenerativeAI
 from langchain_core.messages import SystemMessage, HumanMessage, AIMessage
 
 from backend.config import get_config
@@ -17,15 +20,31 @@ from backend.prompts import (
     PHASE_1_INSTRUCTIONS,
     PHASE_2_INSTRUCTIONS,
     TEMPLATE_EXTRACTION_PROMPT,
-    create_scenario_context_message
+    create_incremental_extraction_prompt,
+    create_scenario_context_message,
+    create_summary_context_message,
+    create_summary_update_prompt,
+    format_transcript
 )
 from backend.tools import (
+    CRITICAL_FIELDS,
     Template,
+    FastPathStats,
     evaluate_context,
-    generate_conversation_summary
+    fast_path_extract,
+    generate_conversation_summary,
+    summary_similarity
+)
+from backend.resources import (
+    get_background_executor,
+    get_chat_model,
+    get_embedding_cache,
+    get_extraction_model,
+    get_llm_cache,
+    get_scenario_retriever
 )
-from backend.rag_retriever import ScenarioRetriever
 from backend.session_manager import SessionManager
+from backend.state_snapshot import LazyMessages
 
 
 # Pydantic model for structured template extraction
@@ -56,6 +75,20 @@ class TemplateExtraction(BaseModel):
 
 Phase = Literal["INTAKE", "MENTORING"]
 
+# Opening markers of the thinking blocks removed by _clean_response
+THINKING_MARKERS = ("(thinking process:", "(internal thought")
+
+# Saved message roles and their LangChain message classes
+MESSAGE_CLASSES = {"system": SystemMessage, "user": HumanMessage, "assistant": AIMessage}
+
+
+def message_role(msg: Any) -> str:
+    """Saved role of a LangChain message."""
+    for role, message_class in MESSAGE_CLASSES.items():
+        if isinstance(msg, message_class):
+            return role
+    raise ValueError(f"Unsupported message type: {type(msg).__name__}")
+
 
 class ConversationManager:
     """
@@ -69,41 +102,119 @@ class ConversationManager:
         Args:
             session_id: Optional existing session ID for resuming
         """
-        config = get_config()
-
-        # Initialize components
+        # Per-session persistence; LLM and retrieval clients are shared
+        # process-wide and created on first use (see the properties below)
         self.session_manager = SessionManager(session_id)
-        self.retriever = ScenarioRetriever()
-
-        # Initialize LLM
-        self.model = ChatGoogleGenerativeAI(
-            model=config.model_config.technical_name,
-            google_api_key=config.google_api_key,
-            temperature=0.7
-        )
-
-        # Initialize extraction model with structured output
-        self.extraction_model = self.model.with_structured_output(TemplateExtraction)
 
-        # Load or initialize state
-        self.template = self.session_manager.load_template()
+        # Initialize state (restored below for resumed sessions)
+        self.template = Template()
         self.phase: Phase = "INTAKE"  # Always start in INTAKE
-        self.messages: List[Any] = []  # LangChain message objects
+        # LangChain messages; restored ones are materialized on first access
+        self.messages = LazyMessages(materialize=self._record_to_message)
         self.retrieved_scenarios: Optional[List[Dict[str, Any]]] = None
+        self.last_turn: Optional[Dict[str, Any]] = None  # Result of the most recent turn
 
-        # Check if this is a resumed session
-        conv_data = self.session_manager.load_conversation()
-        if conv_data["messages"]:
-            self._restore_from_conversation(conv_data)
+        # Incremental extraction bookkeeping: messages already extracted from,
+        # and incremental extractions since the last full one
+        self._extracted_upto = 0
+        self._extractions_since_full = 0
+
+        # Local fast-path extractor counters (hit and skip rates)
+        self.fast_path_stats = FastPathStats()
+
+        # Rolling summary of older MENTORING turns: the summary text, the
+        # message index it covers up to, and a pending background update
+        self._context_summary: Optional[str] = None
+        self._summarized_upto = 0
+        self._pending_summary: Optional[Future] = None
+
+        # Background scenario pre-retrieval: (summary it was made for, future)
+        self._prefetch: Optional[tuple] = None
+
+        # Check if this is a resumed session: restore from the state snapshot
+        # when there is a usable one, else from the session artifacts
+        state = None
+        if session_id is not None and get_config().state_snapshots:
+            state = self.session_manager.load_state_snapshot()
+
+        if state is not None:
+            self._restore_from_snapshot(state)
         else:
-            self._initialize_new_conversation()
+            self.template = self.session_manager.load_template()
+            conv_data = self.session_manager.load_conversation()
+            if conv_data["messages"]:
+                self._restore_from_conversation(conv_data)
+            else:
+                self._initialize_new_conversation()
+
+    @property
+    def model(self) -> Any:
+        """Shared chat model."""
+        return get_chat_model()
+
+    @property
+    def extraction_model(self) -> Any:
+        """Shared extraction model with structured output."""
+        return get_extraction_model(TemplateExtraction)
+
+    @property
+    def retriever(self) -> Any:
+        """Shared scenario retriever."""
+        return get_scenario_retriever()
+
+    @classmethod
+    async def acreate(cls, session_id: Optional[str] = None) -> "ConversationManager":
+        """
+        Construct a conversation manager without blocking the event loop.
+
+        Session loading and client construction run in a worker thread.
+
+        Args:
+            session_id: Optional existing session ID for resuming
+
+        Returns:
+            Initialized ConversationManager
+        """
+        return await asyncio.to_thread(cls, session_id)
 
     def _initialize_new_conversation(self) -> None:
         """Initialize a new conversation with base prompts."""
-        self.messages = [
+        self.messages.extend([
             SystemMessage(content=BASE_SYSTEM_PROMPT),
             SystemMessage(content=PHASE_1_INSTRUCTIONS)
-        ]
+        ])
+
+    def _record_to_message(self, record: Dict[str, Any]) -> Any:
+        """
+        Rebuild a LangChain message from its saved record.
+
+        Args:
+            record: Saved message with 'role' and 'content' (or prompt 'ref')
+
+        Returns:
+            LangChain message
+        """
+        if "ref" in record:
+            content = self.session_manager.load_prompt(record["ref"])
+        else:
+            content = record["content"]
+        return MESSAGE_CLASSES[record["role"]](content=content)
+
+    def _message_record(self, msg: Any) -> Dict[str, Any]:
+        """
+        Convert a LangChain message into its saved record.
+
+        Args:
+            msg: LangChain message
+
+        Returns:
+            Record with 'role' and 'content', or 'ref' for system prompts
+        """
+        role = message_role(msg)
+        if role == "system":
+            # Shared prompt text is saved once and referenced by hash
+            return {"role": role, "ref": self.session_manager.save_prompt(msg.content)}
+        return {"role": role, "content": msg.content}
 
     def _restore_from_conversation(self, conv_data: Dict[str, Any]) -> None:
         """
@@ -112,23 +223,81 @@ class ConversationManager:
         Args:
             conv_data: Loaded conversation data
         """
-        # Reconstruct messages
-        for msg_dict in conv_data["messages"]:
-            role = msg_dict["role"]
-            content = msg_dict["content"]
-
-            if role == "system":
-                self.messages.append(SystemMessage(content=content))
-            elif role == "user":
-                self.messages.append(HumanMessage(content=content))
-            elif role == "assistant":
-                self.messages.append(AIMessage(content=content))
+        # Messages are materialized lazily from their saved records
+        self.messages = LazyMessages(
+            [record for record in conv_data["messages"] if record["role"] in MESSAGE_CLASSES],
+            self._record_to_message
+        )
 
         # Determine phase
         if conv_data.get("phase_transition_at"):
             self.phase = "MENTORING"
             self.retrieved_scenarios = self.session_manager.load_retrieved_scenarios()
 
+        # The saved template already reflects the restored messages
+        self._extracted_upto = len(self.messages)
+
+        # Restore the rolling summary of older turns
+        context_summary = conv_data.get("context_summary")
+        if context_summary:
+            self._context_summary = context_summary["text"]
+            self._summarized_upto = context_summary["summarized_upto"]
+
+    def _state_snapshot(self) -> Dict[str, Any]:
+        """
+        Build the state snapshot saved for fast resume.
+
+        Messages are not included: they are saved as the conversation, and
+        SessionManager.load_state_snapshot() reads them back from there.
+
+        Returns:
+            JSON-compatible state dictionary
+        """
+        return {
+            "session_id": self.session_manager.session_id,
+            "phase": self.phase,
+            "template": self.template.to_dict(),
+            "retrieved_scenarios": [
+                {"id": s["id"], "title": s["title"], "similarity_score": s["similarity_score"]}
+                for s in self.retrieved_scenarios
+            ] if self.retrieved_scenarios else None,
+            "extracted_upto": self._extracted_upto,
+            "extractions_since_full": self._extractions_since_full,
+            "context_summary": self._context_summary,
+            "summarized_upto": self._summarized_upto
+        }
+
+    def _restore_from_snapshot(self, state: Dict[str, Any]) -> None:
+        """
+        Restore conversation state from a state snapshot.
+
+        Args:
+            state: State dictionary from SessionManager.load_state_snapshot()
+        """
+        self.template.update_from_dict(state["template"])
+        self.phase = state["phase"]
+        self.messages = LazyMessages(
+            [record for record in state["messages"] if record["role"] in MESSAGE_CLASSES],
+            self._record_to_message
+        )
+        self.retrieved_scenarios = state["retrieved_scenarios"]
+        self._extracted_upto = state["extracted_upto"]
+        self._extractions_since_full = state["extractions_since_full"]
+        self._context_summary = state["context_summary"]
+        self._summarized_upto = state["summarized_upto"]
+
+    def chat_history(self) -> List[Dict[str, str]]:
+        """
+        Get the user/assistant messages for display, without materializing them.
+
+        Returns:
+            List of dictionaries with 'role' and 'content'
+        """
+        return [
+            record for record in self.messages.to_records(self._message_record)
+            if record["role"] in ("user", "assistant")
+        ]
+
     def send_message(self, user_message: str) -> Dict[str, Any]:
         """
         Process user message and generate response.
@@ -143,39 +312,496 @@ class ConversationManager:
                 - phase_changed: Whether phase transitioned
                 - scenarios: Retrieved scenarios if phase just transitioned
                 - template_status: Template completion status
+                - metrics: Turn latency measurements (see _complete_turn)
         """
-        # Add user message
-        self.messages.append(HumanMessage(content=user_message))
+        started_at = time.perf_counter()
+        pending = self._begin_turn(user_message)
 
-        # Extract template fields and check for transition if in INTAKE (before LLM responds)
-        scenarios = None
-        if self.phase == "INTAKE":
-            self._extract_template_fields()
+        if pending is None:
+            scenarios = self._reconcile_turn(None)
 
-            # Check if context is now sufficient
-            status = evaluate_context(self.template)
+            # Generate response in current phase
+            ai_response = self.model.invoke(self._model_input())
+        else:
+            # Generate a speculative INTAKE reply while extraction runs
+            ai_response = self.model.invoke(self._model_input())
+
+            scenarios = self._reconcile_turn(pending)
+            if scenarios is not None:
+                # Template became complete: the reply must use the Phase 2 context
+                ai_response = self.model.invoke(self._model_input())
+
+        # Clean response content (remove thinking blocks if present)
+        clean_content = self._clean_response(ai_response.content)
+
+        # Without streaming the first token arrives together with the full answer
+        first_token_at = time.perf_counter()
+
+        return self._complete_turn(clean_content, scenarios, started_at, first_token_at)
+
+    def stream_message(self, user_message: str) -> Iterator[str]:
+        """
+        Process user message and stream the response as it is generated.
+
+        Yields cleaned text chunks (thinking blocks are held back until they
+        can be removed). Once the generator is exhausted the full response is
+        persisted and the result dictionary (same shape as send_message) is
+        available as self.last_turn.
+
+        Args:
+            user_message: User's input message
 
-            if status["phase"] == "MENTORING":
-                # Perform phase transition for NEXT interaction
-                scenarios = self._execute_phase_transition()
+        Yields:
+            Cleaned response text chunks
+        """
+        started_at = time.perf_counter()
+        pending = self._begin_turn(user_message)
+
+        raw_content = ""
+        emitted = ""
+        first_token_at = None
+
+        raw_chunks = self._stream_raw_response(pending)
+        while True:
+            try:
+                raw_content += next(raw_chunks)
+            except StopIteration as stop:
+                scenarios = stop.value
+                break
+
+            visible = self._clean_response(self._stream_safe_prefix(raw_content))
+            if len(visible) > len(emitted) and visible.startswith(emitted):
+                if first_token_at is None:
+                    first_token_at = time.perf_counter()
+                yield visible[len(emitted):]
+                emitted = visible
+
+        # Flush whatever was held back (e.g. an unterminated parenthesis)
+        clean_content = self._clean_response(raw_content)
+        if clean_content.startswith(emitted) and len(clean_content) > len(emitted):
+            if first_token_at is None:
+                first_token_at = time.perf_counter()
+            yield clean_content[len(emitted):]
+
+        self._complete_turn(clean_content, scenarios, started_at, first_token_at)
+
+    async def asend_message(self, user_message: str) -> Dict[str, Any]:
+        """
+        Async variant of send_message for serving many sessions on one event loop.
+
+        LLM calls use ainvoke; session file I/O and scenario retrieval run in
+        worker threads so they never block the loop.
+
+        Args:
+            user_message: User's input message
 
-        # Generate response in current phase
-        ai_response = self.model.invoke(self.messages)
+        Returns:
+            Same dictionary as send_message
+        """
+        started_at = time.perf_counter()
+        await self._await_summary()
+        pending = await self._abegin_turn(user_message)
+
+        if pending is None:
+            scenarios = await self._areconcile_turn(None)
+
+            # Generate response in current phase
+            ai_response = await self.model.ainvoke(self._model_input())
+        else:
+            # Generate a speculative INTAKE reply while extraction runs
+            ai_response = await self.model.ainvoke(self._model_input())
+
+            scenarios = await self._areconcile_turn(pending)
+            if scenarios is not None:
+                # Template became complete: the reply must use the Phase 2 context
+                ai_response = await self.model.ainvoke(self._model_input())
 
         # Clean response content (remove thinking blocks if present)
         clean_content = self._clean_response(ai_response.content)
+        first_token_at = time.perf_counter()
 
-        # Add AI response (with cleaned content)
-        self.messages.append(AIMessage(content=clean_content))
+        result = self._record_turn(clean_content, scenarios, started_at, first_token_at)
+
+        # Save conversation (off the event loop)
+        await asyncio.to_thread(self._save_state)
+
+        # Fold older turns into the rolling summary in the background
+        self._schedule_summary_update()
+
+        return result
+
+    def _stream_raw_response(
+        self,
+        pending: Optional[Future]
+    ) -> Generator[str, None, Optional[List[Dict[str, Any]]]]:
+        """
+        Stream raw response text, reconciling a concurrent extraction first.
+
+        With a pending extraction, chunks of a speculative INTAKE reply are
+        buffered until the extraction finishes. If it triggers the phase
+        transition, the speculative reply is dropped and a new one is
+        streamed with the Phase 2 context; otherwise the buffer is released
+        and streaming continues.
+
+        Args:
+            pending: Extraction future from _begin_turn, or None
+
+        Yields:
+            Raw response text chunks
+
+        Returns:
+            Retrieved scenarios if the phase transitioned this turn, else None
+        """
+        if pending is None:
+            scenarios = self._reconcile_turn(None)
+            yield from self._iter_chunk_text(self.model.stream(self._model_input()))
+            return scenarios
+
+        speculative = self._iter_chunk_text(self.model.stream(self._model_input()))
+        buffered = []
+        for text in speculative:
+            buffered.append(text)
+            if pending.done():
+                break
+
+        scenarios = self._reconcile_turn(pending)
+        if scenarios is not None:
+            speculative.close()
+            yield from self._iter_chunk_text(self.model.stream(self._model_input()))
+            return scenarios
+
+        yield from buffered
+        yield from speculative
+        return scenarios
+
+    def _iter_chunk_text(self, chunks: Iterator[Any]) -> Iterator[str]:
+        """Yield the non-empty text content of streamed message chunks."""
+        for chunk in chunks:
+            if isinstance(chunk.content, str) and chunk.content:
+                yield chunk.content
+
+    def _begin_turn(self, user_message: str) -> Optional[Future]:
+        """
+        Record the user message and start INTAKE template extraction.
+
+        In "sequential" mode extraction completes before this returns. In
+        "concurrent" mode it is submitted to a worker thread so the reply can
+        be generated at the same time.
+
+        Args:
+            user_message: User's input message
+
+        Returns:
+            Future of the running extraction in concurrent mode, else None
+        """
+        # Add user message
+        self.messages.append(HumanMessage(content=user_message))
+
+        # Extract template fields if in INTAKE (before LLM responds)
+        if self.phase != "INTAKE":
+            return None
+
+        if not self._run_fast_path(user_message):
+            return None
+
+        if get_config().intake_execution_mode == "concurrent":
+            return get_background_executor().submit(self._extract_template_fields)
+
+        self._extract_template_fields()
+        return None
+
+    def _run_fast_path(self, user_message: str) -> bool:
+        """
+        Fill obvious template fields locally and decide whether to call the extraction model.
+
+        Args:
+            user_message: User's input message
+
+        Returns:
+            True if the LLM extraction call is still needed
+        """
+        config = get_config()
+        if not config.fast_path_extraction:
+            return True
+
+        previous = self._conversation_messages(self.messages[:-1])
+        result = fast_path_extract(
+            user_message,
+            self.template,
+            [msg.content for msg in previous if isinstance(msg, HumanMessage)],
+            last_question=previous[-1].content if previous and isinstance(previous[-1], AIMessage) else None,
+            novelty_threshold=config.fast_path_novelty_threshold
+        )
+        self.fast_path_stats.record(result)
+
+        if result.fields:
+            self.template.update_from_dict(result.fields)
+            self.session_manager.save_template(self.template)
+
+        return result.call_llm
+
+    async def _abegin_turn(self, user_message: str) -> Optional["asyncio.Task"]:
+        """
+        Async variant of _begin_turn.
+
+        Args:
+            user_message: User's input message
+
+        Returns:
+            Task of the running extraction in concurrent mode, else None
+        """
+        # Add user message
+        self.messages.append(HumanMessage(content=user_message))
+
+        # Extract template fields if in INTAKE (before LLM responds)
+        if self.phase != "INTAKE":
+            return None
+
+        if not await asyncio.to_thread(self._run_fast_path, user_message):
+            return None
+
+        if get_config().intake_execution_mode == "concurrent":
+            return asyncio.create_task(self._aextract_template_fields())
+
+        await self._aextract_template_fields()
+        return None
+
+    def _reconcile_turn(self, pending: Optional[Future]) -> Optional[List[Dict[str, Any]]]:
+        """
+        Wait for extraction and perform the phase transition if now due.
+
+        Args:
+            pending: Extraction future from _begin_turn, or None
+
+        Returns:
+            Retrieved scenarios if the phase transitioned this turn, else None
+        """
+        if pending is not None:
+            pending.result()
+
+        if self.phase != "INTAKE":
+            return None
+
+        # Check if context is now sufficient
+        status = evaluate_context(self.template)
+
+        if status["phase"] == "MENTORING":
+            # Perform phase transition before the reply is committed
+            return self._execute_phase_transition()
+
+        self._maybe_prefetch_scenarios()
+        return None
+
+    def _complete_turn(
+        self,
+        clean_content: str,
+        scenarios: Optional[List[Dict[str, Any]]],
+        started_at: float,
+        first_token_at: Optional[float]
+    ) -> Dict[str, Any]:
+        """
+        Commit the AI response, persist state and build the turn result.
+
+        Args:
+            clean_content: Cleaned AI response text
+            scenarios: Scenarios retrieved this turn, if any
+            started_at: perf_counter() value when the turn started
+            first_token_at: perf_counter() value when the first visible text was available
+
+        Returns:
+            Result dictionary returned by send_message
+        """
+        result = self._record_turn(clean_content, scenarios, started_at, first_token_at)
 
         # Save conversation
         self._save_state()
 
-        return {
+        # Fold older turns into the rolling summary in the background
+        self._schedule_summary_update()
+
+        return result
+
+    def _record_turn(
+        self,
+        clean_content: str,
+        scenarios: Optional[List[Dict[str, Any]]],
+        started_at: float,
+        first_token_at: Optional[float]
+    ) -> Dict[str, Any]:
+        """
+        Add the AI response to the conversation and build the turn result.
+
+        Args:
+            clean_content: Cleaned AI response text
+            scenarios: Scenarios retrieved this turn, if any
+            started_at: perf_counter() value when the turn started
+            first_token_at: perf_counter() value when the first visible text was available
+
+        Returns:
+            Result dictionary returned by send_message
+        """
+        finished_at = time.perf_counter()
+        config = get_config()
+
+        # Add AI response (with cleaned content)
+        self.messages.append(AIMessage(content=clean_content))
+
+        self.last_turn = {
             "response": clean_content,
             "phase": self.phase,
-            "scenarios": scenarios
+            "scenarios": scenarios,
+            "metrics": {
+                "intake_execution_mode": config.intake_execution_mode,
+                "fast_path": self.fast_path_stats.to_dict(),
+                "llm_cache": get_llm_cache().stats() if config.llm_cache_enabled else None,
+                "embedding_cache": get_embedding_cache().stats() if config.embedding_cache_enabled else None,
+                "time_to_first_token": (first_token_at or finished_at) - started_at,
+                "total_latency": finished_at - started_at
+            }
         }
+        return self.last_turn
+
+    async def _areconcile_turn(self, pending: Optional["asyncio.Task"]) -> Optional[List[Dict[str, Any]]]:
+        """
+        Async variant of _reconcile_turn.
+
+        Args:
+            pending: Extraction task from _abegin_turn, or None
+
+        Returns:
+            Retrieved scenarios if the phase transitioned this turn, else None
+        """
+        if pending is not None:
+            await pending
+
+        if self.phase != "INTAKE":
+            return None
+
+        # Check if context is now sufficient
+        status = evaluate_context(self.template)
+
+        if status["phase"] == "MENTORING":
+            # Perform phase transition before the reply is committed
+            return await self._aexecute_phase_transition()
+
+        self._maybe_prefetch_scenarios()
+        return None
+
+    def _model_input(self) -> List[Any]:
+        """
+        Build the message list sent to the chat model.
+
+        Once older turns are folded into the rolling summary, the input is the
+        system prefix, the summary message and the recent dialogue; otherwise
+        it is a copy of the full history.
+
+        Returns:
+            List of LangChain messages
+        """
+        self._wait_for_summary()
+
+        if not self._context_summary:
+            return list(self.messages)
+
+        # Only the system messages of the summarized part are materialized
+        cut = self._summarized_upto
+        return (
+            [self.messages[i] for i in range(cut) if self.messages.role(i, message_role) == "system"]
+            + [SystemMessage(content=create_summary_context_message(self._context_summary))]
+            + self.messages[cut:]
+        )
+
+    def _schedule_summary_update(self) -> None:
+        """
+        Fold MENTORING turns outside the verbatim window into the rolling summary.
+
+        Runs in the shared background pool once at least
+        `summary_batch_exchanges` exchanges have left the window of the last
+        `context_window_exchanges` exchanges, so summarization is batched and
+        never delays the reply that was just committed.
+        """
+        config = get_config()
+        if not config.rolling_summary or self.phase != "MENTORING" or self._pending_summary is not None:
+            return
+
+        dialogue_indices = [
+            i for i in range(self._summarized_upto, len(self.messages))
+            if self.messages.role(i, message_role) != "system"
+        ]
+        keep = 2 * config.context_window_exchanges
+        if len(dialogue_indices) < keep + 2 * config.summary_batch_exchanges:
+            return
+
+        new_cut = dialogue_indices[-keep] if keep else len(self.messages)
+        to_fold = self._conversation_messages(self.messages[self._summarized_upto:new_cut])
+
+        self._pending_summary = get_background_executor().submit(
+            self._update_summary, self._context_summary, to_fold, new_cut
+        )
+
+    def _update_summary(self, previous: Optional[str], to_fold: List[Any], new_cut: int) -> None:
+        """
+        Fold messages into the rolling summary (runs in a worker thread).
+
+        Args:
+            previous: Current summary text, if any
+            to_fold: User/assistant messages leaving the verbatim window
+            new_cut: Message index the new summary covers up to
+        """
+        try:
+            response = self.model.invoke([
+                SystemMessage(content=create_summary_update_prompt(previous)),
+                HumanMessage(content=format_transcript(to_fold))
+            ])
+            self._context_summary = self._clean_response(response.content)
+            self._summarized_upto = new_cut
+        except Exception as e:
+            # Keep sending the full window - summarization is best-effort
+            print(f"Summary update error: {e}")
+
+    def _wait_for_summary(self) -> None:
+        """Block until a pending summary update has finished."""
+        if self._pending_summary is not None:
+            self._pending_summary.result()
+            self._pending_summary = None
+
+    async def _await_summary(self) -> None:
+        """Async variant of _wait_for_summary."""
+        if self._pending_summary is not None:
+            await asyncio.wrap_future(self._pending_summary)
+            self._pending_summary = None
+
+    def _stream_safe_prefix(self, content: str) -> str:
+        """
+        Return the part of a partial response that is safe to display.
+
+        Cuts the text at an unclosed parenthesis that starts (or may still
+        turn into) a thinking block, so it never flashes on screen before
+        _clean_response can remove it.
+
+        Args:
+            content: Raw response text received so far
+
+        Returns:
+            Displayable prefix of the content
+        """
+        cut = len(content)
+        lowered = content.lower()
+
+        # A thinking block that has started but not yet closed
+        for marker in THINKING_MARKERS:
+            start = lowered.rfind(marker)
+            if start != -1 and ")" not in content[start:]:
+                cut = min(cut, start)
+
+        # A trailing parenthesis that may still become a thinking block
+        start = lowered.rfind("(")
+        if start != -1 and ")" not in content[start:]:
+            tail = lowered[start:]
+            if any(marker.startswith(tail) for marker in THINKING_MARKERS):
+                cut = min(cut, start)
+
+        return content[:cut]
 
     def _clean_response(self, content: str) -> str:
         """
@@ -187,8 +813,6 @@ class ConversationManager:
         Returns:
             Cleaned content
         """
-        import re
-
         # Remove thinking blocks (pattern: "(Thinking Process: ... )")
         content = re.sub(r'\(Thinking Process:.*?\)', '', content, flags=re.DOTALL)
 
@@ -200,31 +824,24 @@ class ConversationManager:
 
         return content
 
-    def _extract_template_fields(self) -> None:
+    def _extract_template_fields(self, force_full: bool = False) -> None:
         """
         Extract template fields from conversation using structured output.
 
         Uses LangChain's with_structured_output to reliably extract fields.
-        """
-        try:
-            # Get all user/assistant messages (exclude system prompts)
-            conversation_msgs = [
-                msg for msg in self.messages
-                if isinstance(msg, (HumanMessage, AIMessage))
-            ]
+        In "incremental" extraction mode only the current template and the
+        messages since the last successful extraction are sent; a full
+        re-extraction over the whole conversation runs on request, on the
+        first extraction, and every `full_extraction_interval` extractions.
 
-            # Invoke extraction model with full conversation context
-            extraction_messages = [
-                SystemMessage(content=TEMPLATE_EXTRACTION_PROMPT)
-            ] + conversation_msgs
+        Args:
+            force_full: Re-extract from the full conversation
+        """
+        full, message_count, extraction_messages = self._prepare_extraction(force_full)
 
+        try:
             extracted: TemplateExtraction = self.extraction_model.invoke(extraction_messages)
-
-            # Update template with extracted fields (only non-null values)
-            for field, value in extracted.model_dump().items():
-                if value is not None and hasattr(self.template, field):
-                    # Update field (allows corrections/updates)
-                    setattr(self.template, field, value)
+            self._apply_extraction(extracted, full, message_count)
 
             # Save updated template
             self.session_manager.save_template(self.template)
@@ -233,6 +850,93 @@ class ConversationManager:
             # Log but don't crash - extraction is best-effort
             print(f"Template extraction error: {e}")
 
+    async def _aextract_template_fields(self, force_full: bool = False) -> None:
+        """
+        Async variant of _extract_template_fields.
+
+        Args:
+            force_full: Re-extract from the full conversation
+        """
+        full, message_count, extraction_messages = self._prepare_extraction(force_full)
+
+        try:
+            extracted: TemplateExtraction = await self.extraction_model.ainvoke(extraction_messages)
+            self._apply_extraction(extracted, full, message_count)
+
+            # Save updated template (off the event loop)
+            await asyncio.to_thread(self.session_manager.save_template, self.template)
+
+        except Exception as e:
+            # Log but don't crash - extraction is best-effort
+            print(f"Template extraction error: {e}")
+
+    def _prepare_extraction(self, force_full: bool) -> tuple:
+        """
+        Choose full or incremental extraction and build the extraction messages.
+
+        Args:
+            force_full: Re-extract from the full conversation
+
+        Returns:
+            Tuple of (is_full, message count covered, extraction messages)
+        """
+        config = get_config()
+        full = (
+            force_full
+            or config.extraction_mode == "full"
+            or self._extracted_upto == 0
+            or self._extractions_since_full + 1 >= config.full_extraction_interval
+        )
+        message_count = len(self.messages)
+
+        if full:
+            # Invoke extraction model with full conversation context
+            extraction_messages = [
+                SystemMessage(content=TEMPLATE_EXTRACTION_PROMPT)
+            ] + self._conversation_messages(self.messages)
+        else:
+            # Only the current template plus the messages since the last extraction
+            extraction_messages = [
+                SystemMessage(content=create_incremental_extraction_prompt(self.template.to_dict()))
+            ] + self._conversation_messages(self.messages[self._extracted_upto:message_count])
+
+        return full, message_count, extraction_messages
+
+    def _apply_extraction(self, extracted: TemplateExtraction, full: bool, message_count: int) -> None:
+        """
+        Merge an extraction result into the template.
+
+        Args:
+            extracted: Structured extraction result
+            full: Whether it was a full re-extraction
+            message_count: Number of messages the extraction covered
+        """
+        # Update template with extracted fields (only non-null values)
+        for field, value in extracted.model_dump().items():
+            if value is not None and hasattr(self.template, field):
+                # Update field (allows corrections/updates)
+                setattr(self.template, field, value)
+
+        self._extracted_upto = message_count
+        self._extractions_since_full = 0 if full else self._extractions_since_full + 1
+
+    def _conversation_messages(self, messages: List[Any]) -> List[Any]:
+        """Get the user/assistant messages (exclude system prompts)."""
+        return [
+            msg for msg in messages
+            if isinstance(msg, (HumanMessage, AIMessage))
+        ]
+
+    def reextract_template(self) -> Dict[str, Any]:
+        """
+        Re-extract the whole template from the full conversation.
+
+        Returns:
+            Template evaluation status after re-extraction
+        """
+        self._extract_template_fields(force_full=True)
+        return evaluate_context(self.template)
+
     def _execute_phase_transition(self) -> List[Dict[str, Any]]:
         """
         Execute transition from INTAKE to MENTORING phase.
@@ -243,8 +947,106 @@ class ConversationManager:
         # Generate conversation summary from template
         summary = generate_conversation_summary(self.template)
 
-        # Retrieve scenarios
-        scenarios = self.retriever.retrieve_scenarios(summary)
+        # Retrieve scenarios (reusing the background pre-retrieval if still valid)
+        scenarios = None
+        prefetched = self._take_prefetched_scenarios(summary)
+        if prefetched is not None:
+            try:
+                scenarios = prefetched.result()
+            except Exception as e:
+                # The transition must not fail with it - retrieve again
+                print(f"Scenario pre-retrieval error: {e}")
+        if scenarios is None:
+            scenarios = self.retriever.retrieve_scenarios(summary, self.template.to_dict())
+
+        self._apply_phase_transition(scenarios)
+        self._save_phase_transition(scenarios)
+
+        return scenarios
+
+    async def _aexecute_phase_transition(self) -> List[Dict[str, Any]]:
+        """
+        Async variant of _execute_phase_transition.
+
+        Returns:
+            List of retrieved scenarios
+        """
+        # Generate conversation summary from template
+        summary = generate_conversation_summary(self.template)
+
+        # Retrieve scenarios (reusing the background pre-retrieval if still valid)
+        scenarios = None
+        prefetched = self._take_prefetched_scenarios(summary)
+        if prefetched is not None:
+            try:
+                scenarios = await asyncio.wrap_future(prefetched)
+            except Exception as e:
+                # The transition must not fail with it - retrieve again
+                print(f"Scenario pre-retrieval error: {e}")
+        if scenarios is None:
+            # Off the event loop
+            scenarios = await self.retriever.aretrieve_scenarios(summary, self.template.to_dict())
+
+        self._apply_phase_transition(scenarios)
+        await asyncio.to_thread(self._save_phase_transition, scenarios)
+
+        return scenarios
+
+    def _maybe_prefetch_scenarios(self) -> None:
+        """
+        Start retrieving scenarios in the background once all critical fields are filled.
+
+        The transition turn can then reuse the result instead of embedding the
+        summary and querying Chroma on the request path. A new pre-retrieval is
+        started whenever the summary has changed meaningfully since the last one.
+        """
+        config = get_config()
+        if not config.prefetch_scenarios:
+            return
+        if self.template.get_critical_filled_count() < len(CRITICAL_FIELDS):
+            return
+
+        summary = generate_conversation_summary(self.template)
+        if self._prefetch is not None:
+            prefetched_summary, future = self._prefetch
+            still_valid = not (future.done() and future.exception() is not None)
+            if still_valid and summary_similarity(summary, prefetched_summary) >= config.prefetch_reuse_similarity:
+                return
+
+        self._prefetch = (
+            summary,
+            get_background_executor().submit(self.retriever.retrieve_scenarios, summary, self.template.to_dict())
+        )
+
+    def _take_prefetched_scenarios(self, summary: str) -> Optional[Future]:
+        """
+        Claim the background pre-retrieval for the transition, if it still matches.
+
+        Args:
+            summary: Conversation summary at transition time
+
+        Returns:
+            Future with the retrieved scenarios, or None if they must be recomputed
+        """
+        prefetch, self._prefetch = self._prefetch, None
+        if prefetch is None:
+            return None
+
+        prefetched_summary, future = prefetch
+        if summary_similarity(summary, prefetched_summary) < get_config().prefetch_reuse_similarity:
+            return None
+        if future.done() and future.exception() is not None:
+            return None
+
+        return future
+
+    def _apply_phase_transition(self, scenarios: List[Dict[str, Any]]) -> None:
+        """
+        Switch the in-memory state to MENTORING with the retrieved scenarios.
+
+        Args:
+            scenarios: Retrieved scenarios
+        """
         self.retrieved_scenarios = scenarios
 
         # Add Phase 2 instructions and scenarios to messages
@@ -256,12 +1058,17 @@ class ConversationManager:
         # Update phase
         self.phase = "MENTORING"
 
+    def _save_phase_transition(self, scenarios: List[Dict[str, Any]]) -> None:
+        """
+        Persist the phase transition.
+
+        Args:
+            scenarios: Retrieved scenarios
+        """
         # Save scenario metadata
         self.session_manager.save_retrieved_scenarios(scenarios)
         self.session_manager.mark_phase_transition()
 
-        return scenarios
-
     def update_template_field(self, field: str, value: str) -> Dict[str, Any]:
         """
         Manually update a template field.
@@ -291,15 +1098,9 @@ class ConversationManager:
 
     def _save_state(self) -> None:
         """Save current conversation state to disk."""
-        # Convert messages to serializable format
-        msg_dicts = []
-        for msg in self.messages:
-            if isinstance(msg, SystemMessage):
-                msg_dicts.append({"role": "system", "content": msg.content})
-            elif isinstance(msg, HumanMessage):
-                msg_dicts.append({"role": "user", "content": msg.content})
-            elif isinstance(msg, AIMessage):
-                msg_dicts.append({"role": "assistant", "content": msg.content})
+        # Convert messages to serializable format (records not yet
+        # materialized are reused as they are)
+        msg_dicts = self.messages.to_records(self._message_record)
 
         # Save conversation
         config = get_config()
@@ -309,15 +1110,26 @@ class ConversationManager:
             else None
         )
 
+        context_summary = (
+            {"text": self._context_summary, "summarized_upto": self._summarized_upto}
+            if self._context_summary
+            else None
+        )
+
         self.session_manager.save_conversation(
             messages=msg_dicts,
             model=config.model_config.technical_name,
-            phase_transition_at=phase_transition_at
+            phase_transition_at=phase_transition_at,
+            context_summary=context_summary
         )
 
         # Save template
         self.session_manager.save_template(self.template)
 
+        # Snapshot of the bookkeeping for fast resume
+        if config.state_snapshots:
+            self.session_manager.save_state_snapshot(self._state_snapshot())
+
     def get_session_id(self) -> str:
         """Get the current session ID."""
         return self.session_manager.session_id
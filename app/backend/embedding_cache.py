@@ -0,0 +1,246 @@
+"""
+Persistent embedding cache.
+
+Wraps the embedding model used by the scenario retriever and the ingestion
+script, so an identical text (replays, resumed sessions, evaluation runs,
+re-ingestion) is never embedded twice. Entries are keyed by embedding model,
+call kind (query or document embeddings differ for Gemini) and a hash of the
+normalized text, stored as float32 vectors in a single SQLite file, and
+evicted in least-recently-used order above `embedding_cache_max_entries`.
+
+Concurrent requests for the same uncached text are coalesced: the first
+caller embeds it and the others wait for its result.
+"""
+
+import asyncio
+import hashlib
+import sqlite3
+import threading
+import time
+import unicodedata
+from array import array
+from concurrent.futures import Future
+from pathlib import Path
+from typing import Any, Dict, List
+
+
+def normalize_text(text: str) -> str:
+    """Normalize a text for cache keys (Unicode NFC, collapsed whitespace)."""
+    return " ".join(unicodedata.normalize("NFC", text).split())
+
+
+class EmbeddingCache:
+    """Entry-bounded LRU store of embedding vectors in SQLite."""
+
+    def __init__(self, path: str, max_entries: int):
+        """
+        Open (or create) the cache database.
+
+        Args:
+            path: SQLite file path
+            max_entries: Number of vectors above which LRU entries are evicted
+        """
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS embeddings ("
+            " key TEXT PRIMARY KEY,"
+            " model TEXT NOT NULL,"
+            " vector BLOB NOT NULL,"
+            " hits INTEGER NOT NULL DEFAULT 0,"
+            " last_access REAL NOT NULL)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_embeddings_last_access ON embeddings(last_access)")
+        self._conn.commit()
+        self._entries = self._conn.execute("SELECT COUNT(*) FROM embeddings").fetchone()[0]
+
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self.evictions = 0
+
+    @staticmethod
+    def make_key(model: str, kind: str, text: str) -> str:
+        """
+        Build the cache key for one text.
+
+        Args:
+            model: Embedding model name
+            kind: "query" or "document"
+            text: Text to embed
+
+        Returns:
+            Hex digest identifying the embedding
+        """
+        payload = f"{model}\0{kind}\0{normalize_text(text)}"
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get_many(self, keys: List[str]) -> Dict[str, List[float]]:
+        """
+        Look up cached vectors and mark them as recently used.
+
+        Args:
+            keys: Cache keys from make_key
+
+        Returns:
+            Dictionary of key -> vector for the keys that were cached
+        """
+        if not keys:
+            return {}
+        unique = list(dict.fromkeys(keys))
+        with self._lock:
+            rows = []
+            # Chunked to stay under SQLite's bound-parameter limit
+            for i in range(0, len(unique), 500):
+                chunk = unique[i:i + 500]
+                rows += self._conn.execute(
+                    f"SELECT key, vector FROM embeddings WHERE key IN ({', '.join('?' * len(chunk))})", chunk
+                ).fetchall()
+            if rows:
+                self._conn.executemany(
+                    "UPDATE embeddings SET hits = hits + 1, last_access = ? WHERE key = ?",
+                    [(time.time(), key) for key, _ in rows]
+                )
+                self._conn.commit()
+            found = {key: array("f", vector).tolist() for key, vector in rows}
+            self.hits += sum(1 for key in keys if key in found)
+            self.misses += sum(1 for key in keys if key not in found)
+        return found
+
+    def put_many(self, model: str, vectors: Dict[str, List[float]]) -> None:
+        """
+        Store vectors and evict least-recently-used entries over the bound.
+
+        Args:
+            model: Embedding model name
+            vectors: Dictionary of key -> vector
+        """
+        if not vectors:
+            return
+        now = time.time()
+        with self._lock:
+            before = self._conn.total_changes
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO embeddings (key, model, vector, last_access) VALUES (?, ?, ?, ?)",
+                [(key, model, array("f", vector).tobytes(), now) for key, vector in vectors.items()]
+            )
+            self._entries += self._conn.total_changes - before
+
+            excess = self._entries - self.max_entries
+            if excess > 0:
+                self._conn.execute(
+                    "DELETE FROM embeddings WHERE key IN "
+                    "(SELECT key FROM embeddings ORDER BY last_access LIMIT ?)",
+                    (excess,)
+                )
+                self._entries -= excess
+                self.evictions += excess
+
+            self._conn.commit()
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get hit/miss statistics.
+
+        Returns:
+            Dictionary with hits, misses, hit_rate, coalesced, evictions and entries
+        """
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "coalesced": self.coalesced,
+            "evictions": self.evictions,
+            "entries": self._entries,
+        }
+
+
+class CachedEmbeddings:
+    """Embedding model wrapper that serves embed_query/embed_documents from an EmbeddingCache."""
+
+    def __init__(self, embeddings: Any, cache: EmbeddingCache, model_name: str):
+        """
+        Args:
+            embeddings: Underlying LangChain embedding model
+            cache: Embedding cache
+            model_name: Model name used in cache keys
+        """
+        self.embeddings = embeddings
+        self.cache = cache
+        self.model_name = model_name
+        self._lock = threading.Lock()
+        self._in_flight: Dict[str, Future] = {}
+
+    def _embed(self, kind: str, texts: List[str]) -> List[List[float]]:
+        """
+        Embed texts through the cache, coalescing concurrent misses.
+
+        Args:
+            kind: "query" or "document"
+            texts: Texts to embed
+
+        Returns:
+            One vector per text
+        """
+        keys = [self.cache.make_key(self.model_name, kind, text) for text in texts]
+        vectors = self.cache.get_many(keys)
+
+        # Claim the misses nobody is embedding yet; wait for the others
+        owned: Dict[str, Future] = {}
+        waiting: Dict[str, Future] = {}
+        with self._lock:
+            for key in keys:
+                if key in vectors or key in owned or key in waiting:
+                    continue
+                future = self._in_flight.get(key)
+                if future is None:
+                    owned[key] = self._in_flight[key] = Future()
+                else:
+                    waiting[key] = future
+            self.cache.coalesced += len(waiting)
+
+        if owned:
+            texts_by_key = {key: text for key, text in zip(keys, texts) if key in owned}
+            try:
+                owned_texts = list(texts_by_key.values())
+                if kind == "query":
+                    computed = [self.embeddings.embed_query(text) for text in owned_texts]
+                else:
+                    computed = self.embeddings.embed_documents(owned_texts)
+                fresh = dict(zip(texts_by_key, computed))
+                self.cache.put_many(self.model_name, fresh)
+            except BaseException as e:
+                with self._lock:
+                    for key, future in owned.items():
+                        del self._in_flight[key]
+                        future.set_exception(e)
+                raise
+            with self._lock:
+                for key, future in owned.items():
+                    del self._in_flight[key]
+                    future.set_result(fresh[key])
+            vectors.update(fresh)
+
+        for key, future in waiting.items():
+            vectors[key] = future.result()
+        return [vectors[key] for key in keys]
+
+    def embed_query(self, text: str) -> List[float]:
+        """Cached embeddings.embed_query()."""
+        return self._embed("query", [text])[0]
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        """Cached embeddings.embed_documents()."""
+        return self._embed("document", list(texts))
+
+    async def aembed_query(self, text: str) -> List[float]:
+        """Cached embeddings.aembed_query() (the lookup and call run in a worker thread)."""
+        return await asyncio.to_thread(self.embed_query, text)
+
+    async def aembed_documents(self, texts: List[str]) -> List[List[float]]:
+        """Cached embeddings.aembed_documents() (the lookup and call run in a worker thread)."""
+        return await asyncio.to_thread(self.embed_documents, texts)
@@ -0,0 +1,269 @@
+"""
+Local BM25 index over the scenario texts.
+
+Dense retrieval over the English/Hebrew conversation summary can miss
+scenarios that share specific terms with the case (diagnosis names, "חד
+הורי", setting keywords). This inverted index scores those terms with BM25
+and ScenarioRetriever fuses its ranking with the dense one (reciprocal rank
+fusion). It is built by scripts/ingest_scenarios.py, stored as one JSON file
+and answers a query in microseconds without any API call, so it is also the
+offline fallback when the embedding API is slow or unavailable.
+
+Tokenization is Hebrew-aware: niqqud and geresh/gershayim are removed, final
+letter forms are normalized, and each Hebrew word is indexed both as written
+and with its attached prefix letters (ו, ה, ב, כ, ל, מ, ש) stripped, so
+"והמטופל" and "למטופל" both match "מטופל". Adjacent-word bigrams are indexed
+too, so multi-word terms like "חד הורי" outrank documents that only contain
+one of the words. Function words are dropped using the index's own stopword
+list; its hash is saved with the index, so an index built with another list
+is rejected instead of silently missing query terms.
+"""
+
+import hashlib
+import json
+import math
+import re
+from collections import Counter
+from pathlib import Path
+from typing import Any, Collection, Dict, List, Optional, Tuple
+
+from backend.persistence import atomic_write_json
+
+LEXICAL_INDEX_FORMAT_VERSION = 1
+
+HEBREW_PREFIX_LETTERS = "והבלמשכ"
+MAX_PREFIX_LETTERS = 3  # e.g. "וכש"
+MIN_STEM_LETTERS = 3  # a stripped word keeps at least this many letters
+
+# Function words left out of the index (changing them requires a rebuild)
+LEXICAL_STOPWORDS = frozenset({
+    # English
+    "the", "a", "an", "and", "or", "but", "if", "of", "in", "on", "at", "to", "for", "with", "from", "by",
+    "as", "into", "about", "is", "are", "was", "were", "be", "been", "has", "have", "had", "do", "does", "did",
+    "he", "she", "it", "they", "his", "her", "its", "their", "him", "them", "i", "you", "we", "my", "your",
+    "our", "that", "this", "these", "those", "which", "who", "so", "also", "very", "just", "not",
+    # Hebrew
+    "של", "את", "עם", "על", "אל", "גם", "רק", "אבל", "או", "אם", "כי", "זה", "זאת", "זו", "הוא", "היא",
+    "הם", "הן", "אני", "אנחנו", "אתה", "יש", "אין", "היה", "הייתה", "היו", "לא", "כן", "מאוד",
+    "כל", "מה", "אז", "שלו", "שלה", "שלהם", "לו", "לה", "להם", "בו", "בה", "עוד", "כמו", "אחרי", "לפני",
+})
+
+
+def stopwords_hash() -> str:
+    """SHA-256 of LEXICAL_STOPWORDS, saved with the index."""
+    return hashlib.sha256("\n".join(sorted(LEXICAL_STOPWORDS)).encode("utf-8")).hexdigest()
+
+# Niqqud and cantillation marks (not maqaf, which separates words)
+_NIQQUD_PATTERN = re.compile("[\u0591-\u05bd\u05bf\u05c1\u05c2\u05c4\u05c5\u05c7]")
+_FINAL_LETTERS = str.maketrans("\u05da\u05dd\u05df\u05e3\u05e5", "\u05db\u05de\u05e0\u05e4\u05e6")
+_WORD_PATTERN = re.compile(r"[^\W_]+", re.UNICODE)
+
+
+def _is_hebrew(word: str) -> bool:
+    return "\u05d0" <= word[0] <= "\u05ea"
+
+
+def normalize_text(text: str) -> str:
+    """Lowercase, drop niqqud and geresh/gershayim, and normalize final letters."""
+    text = _NIQQUD_PATTERN.sub("", text.lower())
+    text = re.sub("[\"'\u05f3\u05f4]", "", text)
+    return text.translate(_FINAL_LETTERS)
+
+
+# Stopwords as tokenize() sees them (final letters normalized)
+_STOPWORD_TERMS = frozenset(normalize_text(word) for word in LEXICAL_STOPWORDS)
+
+
+def prefix_variants(word: str) -> List[str]:
+    """
+    The word with 1..MAX_PREFIX_LETTERS leading prefix letters stripped.
+
+    Args:
+        word: Normalized Hebrew word
+
+    Returns:
+        Stripped variants (empty for non-Hebrew words)
+    """
+    variants = []
+    for i in range(1, MAX_PREFIX_LETTERS + 1):
+        if len(word) - i < MIN_STEM_LETTERS or word[i - 1] not in HEBREW_PREFIX_LETTERS:
+            break
+        variants.append(word[i:])
+    return variants
+
+
+def tokenize(text: str) -> List[str]:
+    """
+    Split text into index terms.
+
+    Args:
+        text: Scenario text or query
+
+    Returns:
+        Terms: words (plus prefix-stripped variants of Hebrew words) and
+        "first_second" bigrams of adjacent content words
+    """
+    words = [
+        word for word in _WORD_PATTERN.findall(normalize_text(text))
+        if word not in _STOPWORD_TERMS and not word.isdigit()
+    ]
+    terms = []
+    for word in words:
+        terms.append(word)
+        if _is_hebrew(word):
+            terms.extend(variant for variant in prefix_variants(word) if variant not in _STOPWORD_TERMS)
+    terms.extend(f"{first}_{second}" for first, second in zip(words, words[1:]))
+    return terms
+
+
+class BM25Index:
+    """Okapi BM25 inverted index over a small document collection."""
+
+    def __init__(self, k1: float = 1.5, b: float = 0.75):
+        """
+        Args:
+            k1: Term frequency saturation
+            b: Document length normalization
+        """
+        self.k1 = k1
+        self.b = b
+        self.documents: List[Dict[str, Any]] = []
+        self.doc_lengths: List[int] = []
+        self.postings: Dict[str, List[Tuple[int, int]]] = {}
+        self._idf: Dict[str, float] = {}
+        self._avg_length = 0.0
+
+    def build(self, documents: List[Dict[str, Any]]) -> "BM25Index":
+        """
+        Index documents.
+
+        Args:
+            documents: Dictionaries with 'id', 'title' and 'content'
+
+        Returns:
+            self
+        """
+        self.documents = [
+            {"id": document["id"], "title": document["title"], "content": document["content"]}
+            for document in documents
+        ]
+        self.doc_lengths = []
+        self.postings = {}
+        for row, document in enumerate(self.documents):
+            terms = tokenize(f"{document['title']}\n{document['content']}")
+            self.doc_lengths.append(len(terms))
+            for term, count in Counter(terms).items():
+                self.postings.setdefault(term, []).append((row, count))
+        self._prepare()
+        return self
+
+    def _prepare(self) -> None:
+        """Precompute IDF values and the average document length."""
+        count = len(self.documents)
+        self._avg_length = sum(self.doc_lengths) / count if count else 0.0
+        self._idf = {
+            term: math.log(1 + (count - len(postings) + 0.5) / (len(postings) + 0.5))
+            for term, postings in self.postings.items()
+        }
+
+    def __len__(self) -> int:
+        return len(self.documents)
+
+    def search(self, query: str, k: int, rows: Optional[Collection[int]] = None) -> List[Tuple[int, float]]:
+        """
+        Score documents against a query.
+
+        Args:
+            query: Query text
+            k: Maximum number of results
+            rows: Only score these document rows (all when None)
+
+        Returns:
+            (document row, BM25 score) pairs, best first; documents without
+            any query term are left out
+        """
+        if rows is not None:
+            rows = set(rows)
+        scores: Dict[int, float] = {}
+        for term, query_count in Counter(tokenize(query)).items():
+            postings = self.postings.get(term)
+            if not postings:
+                continue
+            idf = self._idf[term]
+            for row, count in postings:
+                if rows is not None and row not in rows:
+                    continue
+                length_norm = 1 - self.b + self.b * self.doc_lengths[row] / self._avg_length
+                scores[row] = scores.get(row, 0.0) + query_count * idf * count * (self.k1 + 1) / (
+                    count + self.k1 * length_norm
+                )
+        return sorted(scores.items(), key=lambda item: (-item[1], item[0]))[:k]
+
+    def save(self, path: str) -> None:
+        """
+        Write the index to a JSON file (atomically).
+
+        Args:
+            path: Target file path
+        """
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        atomic_write_json(path, {
+            "format": LEXICAL_INDEX_FORMAT_VERSION,
+            "stopwords_sha256": stopwords_hash(),
+            "k1": self.k1,
+            "b": self.b,
+            "documents": self.documents,
+            "doc_lengths": self.doc_lengths,
+            "postings": self.postings,
+        }, indent=None)
+
+    @classmethod
+    def load(cls, path: str) -> "BM25Index":
+        """
+        Read an index written by save().
+
+        Args:
+            path: Index file path
+
+        Returns:
+            BM25Index instance
+
+        Raises:
+            ValueError: If the file has another format version or was built
+                with another stopword list
+        """
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        if data.get("format") != LEXICAL_INDEX_FORMAT_VERSION:
+            raise ValueError(f"Unsupported lexical index format: {data.get('format')}")
+        if data.get("stopwords_sha256") != stopwords_hash():
+            raise ValueError(
+                f"Lexical index {path} was built with other stopwords; "
+                "rebuild it with scripts/ingest_scenarios.py --lexical-only"
+            )
+        index = cls(data["k1"], data["b"])
+        index.documents = data["documents"]
+        index.doc_lengths = data["doc_lengths"]
+        index.postings = {term: [tuple(posting) for posting in postings] for term, postings in data["postings"].items()}
+        index._prepare()
+        return index
+
+
+def reciprocal_rank_fusion(rankings: List[List[str]], k: int = 60) -> List[Tuple[str, float]]:
+    """
+    Fuse several rankings of the same items (reciprocal rank fusion).
+
+    Args:
+        rankings: Item IDs per ranking, best first
+        k: Rank smoothing constant (60 in the original RRF paper)
+
+    Returns:
+        (item ID, fused score) pairs, best first; ties keep the order of
+        first appearance
+    """
+    scores: Dict[str, float] = {}
+    for ranking in rankings:
+        for rank, item in enumerate(ranking, start=1):
+            scores[item] = scores.get(item, 0.0) + 1.0 / (k + rank)
+    return sorted(scores.items(), key=lambda item: -item[1])
@@ -0,0 +1,258 @@
+"""
+Disk-backed LLM response cache.
+
+Opt-in cache around the chat and extraction model calls, used to replay saved
+transcripts (regression checks, prompt tweaks, demos) without re-billing Gemini.
+Entries are keyed by call kind, model name, temperature and a hash of the
+serialized message list, stored in a single SQLite file, and evicted in
+least-recently-used order once the store exceeds its size bound.
+"""
+
+import asyncio
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+
+def _serialize_messages(messages: List[Any]) -> List[List[str]]:
+    """Reduce LangChain messages to (type, content) pairs for hashing."""
+    return [[msg.type, msg.content if isinstance(msg.content, str) else json.dumps(msg.content)]
+            for msg in messages]
+
+
+class LLMResponseCache:
+    """Size-bounded LRU store of LLM responses in SQLite."""
+
+    def __init__(self, path: str, max_bytes: int):
+        """
+        Open (or create) the cache database.
+
+        Args:
+            path: SQLite file path
+            max_bytes: Total response size above which LRU entries are evicted
+        """
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            " key TEXT PRIMARY KEY,"
+            " value TEXT NOT NULL,"
+            " size INTEGER NOT NULL,"
+            " last_access REAL NOT NULL)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_responses_last_access ON responses(last_access)")
+        self._conn.commit()
+        self._total_bytes = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def make_key(kind: str, model: str, temperature: float, messages: List[Any]) -> str:
+        """
+        Build the cache key for one call.
+
+        Args:
+            kind: Call kind ("chat" or "structured:<Schema>")
+            model: Model name
+            temperature: Sampling temperature
+            messages: LangChain messages sent to the model
+
+        Returns:
+            Hex digest identifying the call
+        """
+        payload = json.dumps(
+            {"kind": kind, "model": model, "temperature": temperature,
+             "messages": _serialize_messages(messages)},
+            ensure_ascii=False,
+            sort_keys=True
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[Any]:
+        """
+        Look up a cached response and mark it as recently used.
+
+        Args:
+            key: Cache key from make_key
+
+        Returns:
+            The cached JSON value, or None on a miss
+        """
+        with self._lock:
+            row = self._conn.execute("SELECT value FROM responses WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            self._conn.execute("UPDATE responses SET last_access = ? WHERE key = ?", (time.time(), key))
+            self._conn.commit()
+            self.hits += 1
+        return json.loads(row[0])
+
+    def put(self, key: str, value: Any) -> None:
+        """
+        Store a response and evict least-recently-used entries over the size bound.
+
+        Args:
+            key: Cache key from make_key
+            value: JSON-serializable response
+        """
+        encoded = json.dumps(value, ensure_ascii=False)
+        size = len(encoded.encode("utf-8"))
+        with self._lock:
+            old = self._conn.execute("SELECT size FROM responses WHERE key = ?", (key,)).fetchone()
+            if old:
+                self._total_bytes -= old[0]
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses (key, value, size, last_access) VALUES (?, ?, ?, ?)",
+                (key, encoded, size, time.time())
+            )
+            self._total_bytes += size
+
+            while self._total_bytes > self.max_bytes:
+                oldest = self._conn.execute(
+                    "SELECT key, size FROM responses ORDER BY last_access LIMIT 1"
+                ).fetchone()
+                if oldest is None:
+                    break
+                self._conn.execute("DELETE FROM responses WHERE key = ?", (oldest[0],))
+                self._total_bytes -= oldest[1]
+                self.evictions += 1
+
+            self._conn.commit()
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get hit/miss statistics.
+
+        Returns:
+            Dictionary with hits, misses, hit_rate, evictions, entries and bytes
+        """
+        with self._lock:
+            entries = self._conn.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "evictions": self.evictions,
+            "entries": entries,
+            "bytes": self._total_bytes,
+        }
+
+
+class CachedChatModel:
+    """Chat model wrapper that serves invoke/ainvoke/stream from an LLMResponseCache."""
+
+    def __init__(self, model: Any, cache: LLMResponseCache, model_name: str, temperature: float):
+        """
+        Args:
+            model: Underlying chat model
+            cache: Response cache
+            model_name: Model name used in cache keys
+            temperature: Sampling temperature used in cache keys
+        """
+        self.model = model
+        self.cache = cache
+        self.model_name = model_name
+        self.temperature = temperature
+
+    def _key(self, messages: List[Any]) -> str:
+        return self.cache.make_key("chat", self.model_name, self.temperature, messages)
+
+    def invoke(self, messages: List[Any]) -> Any:
+        """Cached model.invoke()."""
+        from langchain_core.messages import AIMessage
+
+        key = self._key(messages)
+        cached = self.cache.get(key)
+        if cached is not None:
+            return AIMessage(content=cached)
+
+        response = self.model.invoke(messages)
+        self.cache.put(key, response.content)
+        return response
+
+    async def ainvoke(self, messages: List[Any]) -> Any:
+        """Cached model.ainvoke()."""
+        from langchain_core.messages import AIMessage
+
+        key = self._key(messages)
+        cached = await asyncio.to_thread(self.cache.get, key)
+        if cached is not None:
+            return AIMessage(content=cached)
+
+        response = await self.model.ainvoke(messages)
+        await asyncio.to_thread(self.cache.put, key, response.content)
+        return response
+
+    def stream(self, messages: List[Any]) -> Iterator[Any]:
+        """Cached model.stream(); a hit is replayed as a single chunk."""
+        from langchain_core.messages import AIMessageChunk
+
+        key = self._key(messages)
+        cached = self.cache.get(key)
+        if cached is not None:
+            yield AIMessageChunk(content=cached)
+            return
+
+        content = ""
+        for chunk in self.model.stream(messages):
+            if isinstance(chunk.content, str):
+                content += chunk.content
+            yield chunk
+
+        # Only complete responses are cached (an abandoned stream is not)
+        self.cache.put(key, content)
+
+
+class CachedStructuredModel:
+    """Structured-output model wrapper that serves invoke/ainvoke from an LLMResponseCache."""
+
+    def __init__(self, model: Any, schema: type, cache: LLMResponseCache, model_name: str, temperature: float):
+        """
+        Args:
+            model: Underlying structured-output runnable
+            schema: Pydantic model class the runnable returns
+            cache: Response cache
+            model_name: Model name used in cache keys
+            temperature: Sampling temperature used in cache keys
+        """
+        self.model = model
+        self.schema = schema
+        self.cache = cache
+        self.model_name = model_name
+        self.temperature = temperature
+
+    def _key(self, messages: List[Any]) -> str:
+        kind = f"structured:{self.schema.__name__}"
+        return self.cache.make_key(kind, self.model_name, self.temperature, messages)
+
+    def invoke(self, messages: List[Any]) -> Any:
+        """Cached model.invoke()."""
+        key = self._key(messages)
+        cached = self.cache.get(key)
+        if cached is not None:
+            return self.schema(**cached)
+
+        result = self.model.invoke(messages)
+        self.cache.put(key, result.model_dump())
+        return result
+
+    async def ainvoke(self, messages: List[Any]) -> Any:
+        """Cached model.ainvoke()."""
+        key = self._key(messages)
+        cached = await asyncio.to_thread(self.cache.get, key)
+        if cached is not None:
+            return self.schema(**cached)
+
+        result = await self.model.ainvoke(messages)
+        await asyncio.to_thread(self.cache.put, key, result.model_dump())
+        return result
@@ -0,0 +1,209 @@
+"""
+Crash-safe file writes and write-behind flushing for session persistence.
+
+- atomic_write_bytes / atomic_write_text / atomic_write_json: write to a temp
+  file, fsync, then rename over the target, so readers never see a truncated file
+- SessionFlusher: one background thread shared by all sessions that flushes
+  dirty SessionManagers every `flush_interval_seconds`, coalescing repeated
+  saves of the same artifact into one write
+"""
+
+import atexit
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from backend.config import get_config
+
+
+def atomic_write_bytes(path: Path, data: bytes) -> None:
+    """
+    Write bytes atomically (temp file + fsync + rename).
+
+    Args:
+        path: Target file path
+        data: File content
+    """
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    finally:
+        if tmp_path.exists():
+            tmp_path.unlink()
+
+
+def atomic_write_text(path: Path, text: str) -> None:
+    """
+    Write text atomically (temp file + fsync + rename).
+
+    Args:
+        path: Target file path
+        text: File content
+    """
+    atomic_write_bytes(path, text.encode("utf-8"))
+
+
+def atomic_write_json(path: Path, data: Any, indent: Optional[int] = 2) -> None:
+    """
+    Write JSON atomically (temp file + fsync + rename).
+
+    Args:
+        path: Target file path
+        data: JSON-serializable data
+        indent: JSON indentation (None for compact output)
+    """
+    atomic_write_text(path, json.dumps(data, indent=indent, ensure_ascii=False))
+
+
+def append_jsonl(path: Path, entries: List[Dict[str, Any]], header: Optional[Dict[str, Any]] = None) -> None:
+    """
+    Append entries to a JSON Lines file and fsync.
+
+    A crash can at worst leave a partial last line. It is cut off before the
+    next append, so entries written after a crash stay readable.
+
+    Args:
+        path: Journal file path
+        entries: JSON-serializable entries, one per line
+        header: Entry written first when the file is new (or empty)
+    """
+    with open(path, 'ab+') as f:
+        size = f.seek(0, os.SEEK_END)
+        end = _last_line_end(f, size)
+        if end != size:
+            f.truncate(end)
+        if end == 0 and header is not None:
+            entries = [header] + entries
+        f.write("".join(json.dumps(entry, ensure_ascii=False) + "\n" for entry in entries).encode("utf-8"))
+        f.flush()
+        os.fsync(f.fileno())
+
+
+def _last_line_end(f: Any, size: int, chunk_size: int = 64 * 1024) -> int:
+    """
+    Offset just past the last newline of a file (0 if it has none).
+
+    Args:
+        f: File opened for binary reading
+        size: File size
+        chunk_size: Bytes read per step, scanning backwards from the end
+
+    Returns:
+        `size` when the file ends with a complete line
+    """
+    position = size
+    while position > 0:
+        start = max(0, position - chunk_size)
+        f.seek(start)
+        newline = f.read(position - start).rfind(b"\n")
+        if newline != -1:
+            return start + newline + 1
+        position = start
+    return 0
+
+
+class SessionFlusher:
+    """Background thread that flushes dirty sessions periodically."""
+
+    def __init__(self, interval: float):
+        """
+        Start the flusher thread.
+
+        Args:
+            interval: Seconds between flushes
+        """
+        self.interval = interval
+        self._dirty: Dict[str, Any] = {}  # session_id -> SessionManager
+        self._flushing: Dict[str, List[Any]] = {}  # Taken by a running flush(), not yet written
+        self._lock = threading.Lock()
+        self._thread = threading.Thread(target=self._run, name="ot-mentor-flusher", daemon=True)
+        self._thread.start()
+
+    def mark_dirty(self, session_manager: Any) -> None:
+        """
+        Schedule a session for the next flush.
+
+        Args:
+            session_manager: SessionManager with pending writes
+        """
+        with self._lock:
+            self._dirty[session_manager.session_id] = session_manager
+
+    def flush_session(self, session_id: str) -> None:
+        """
+        Flush one session now, if it has pending writes.
+
+        If the background thread is flushing the session right now, waits
+        for that flush to finish (SessionManager.flush() is serialized per
+        manager), so a read afterwards sees every write.
+
+        Args:
+            session_id: Session to flush
+        """
+        with self._lock:
+            session_managers = list(self._flushing.get(session_id, []))
+            session_manager = self._dirty.pop(session_id, None)
+        if session_manager is not None:
+            session_managers.append(session_manager)
+        for session_manager in session_managers:
+            session_manager.flush()
+
+    def flush(self) -> None:
+        """Flush all dirty sessions now."""
+        with self._lock:
+            dirty, self._dirty = self._dirty, {}
+            for session_id, session_manager in dirty.items():
+                self._flushing.setdefault(session_id, []).append(session_manager)
+        for session_id, session_manager in dirty.items():
+            try:
+                session_manager.flush()
+            except Exception as e:
+                # Keep the session queued and retry on the next cycle
+                print(f"Session flush error ({session_id}): {e}")
+                self.mark_dirty(session_manager)
+            finally:
+                with self._lock:
+                    self._flushing[session_id].remove(session_manager)
+                    if not self._flushing[session_id]:
+                        del self._flushing[session_id]
+
+    def _run(self) -> None:
+        """Flush loop."""
+        while True:
+            time.sleep(self.interval)
+            self.flush()
+
+
+_flusher: Optional[SessionFlusher] = None
+_flusher_lock = threading.Lock()
+
+
+def get_session_flusher() -> SessionFlusher:
+    """
+    Get (or start) the process-wide session flusher.
+
+    Pending writes are flushed at interpreter exit.
+
+    Returns:
+        SessionFlusher instance
+    """
+    global _flusher
+    if _flusher is None:
+        with _flusher_lock:
+            if _flusher is None:
+                _flusher = SessionFlusher(get_config().flush_interval_seconds)
+                atexit.register(_flusher.flush)
+    return _flusher
+
+
+def flush_all_sessions() -> None:
+    """Flush every session with pending writes (call on shutdown)."""
+    if _flusher is not None:
+        _flusher.flush()
@@ -0,0 +1,116 @@
+"""
+Content-addressed store for system prompts.
+
+System messages (base prompt, phase instructions, scenario context) are the
+same text in every session. Instead of saving that text in each conversation,
+sessions save a reference - the SHA-256 of the text plus the reference format
+version - and the text itself is written once to the session store's blob
+area (backend.session_store) and shared by all sessions.
+
+Recently used prompts are cached in memory by hash. The cache is a small LRU:
+scenario context prompts differ per session, so an unbounded cache would keep
+every session's prompt for the life of the process.
+"""
+
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Any, Dict
+
+# Format version of saved prompt references
+PROMPT_REF_VERSION = 1
+
+# Prompts kept in memory (shared prompts plus the scenario contexts of the
+# sessions active right now)
+PROMPT_CACHE_ENTRIES = 128
+
+
+def content_hash(content: str) -> str:
+    """
+    Hash prompt text.
+
+    Args:
+        content: Prompt text
+
+    Returns:
+        SHA-256 hex digest
+    """
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+
+class PromptStore:
+    """Deduplicating prompt blob store with an in-memory LRU cache."""
+
+    def __init__(self, store: Any, cache_entries: int = PROMPT_CACHE_ENTRIES):
+        """
+        Args:
+            store: SessionStore holding the blobs
+            cache_entries: Prompts kept in memory (least recently used are dropped)
+        """
+        self.store = store
+        self.cache_entries = cache_entries
+        self._lock = threading.Lock()
+        self._contents: "OrderedDict[str, str]" = OrderedDict()  # hash -> content, oldest first
+
+    def _cached(self, digest: str) -> bool:
+        """Check whether a prompt is cached, marking it as recently used."""
+        with self._lock:
+            if digest not in self._contents:
+                return False
+            self._contents.move_to_end(digest)
+            return True
+
+    def _remember(self, digest: str, content: str) -> None:
+        """Cache a prompt, dropping the least recently used beyond the limit."""
+        with self._lock:
+            self._contents[digest] = content
+            self._contents.move_to_end(digest)
+            while len(self._contents) > self.cache_entries:
+                self._contents.popitem(last=False)
+
+    def put(self, content: str) -> Dict[str, Any]:
+        """
+        Store prompt text (once per distinct text) and return its reference.
+
+        Args:
+            content: Prompt text
+
+        Returns:
+            Reference dictionary with 'hash' and 'version'
+        """
+        digest = content_hash(content)
+        if not self._cached(digest):
+            # Written before any conversation can reference it
+            self.store.write_blob(digest, content)
+            self._remember(digest, content)
+        return {"hash": digest, "version": PROMPT_REF_VERSION}
+
+    def get(self, ref: Dict[str, Any]) -> str:
+        """
+        Resolve a reference to its prompt text.
+
+        Args:
+            ref: Reference dictionary from put()
+
+        Returns:
+            Prompt text
+
+        Raises:
+            ValueError: If the reference version is unknown, or the blob is
+                missing or does not match its hash
+        """
+        if ref.get("version") != PROMPT_REF_VERSION:
+            raise ValueError(f"Unsupported prompt reference version: {ref.get('version')}")
+
+        digest = ref["hash"]
+        with self._lock:
+            content = self._contents.get(digest)
+            if content is not None:
+                self._contents.move_to_end(digest)
+                return content
+
+        content = self.store.read_blob(digest)
+        if content is None or content_hash(content) != digest:
+            raise ValueError(f"Prompt blob {digest[:12]} is missing or corrupt")
+        self._remember(digest, content)
+        return content
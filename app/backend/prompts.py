@@ -5,6 +5,9 @@ Contains the base system prompt and phase-specific instructions that will be
 appended to the conversation at different stages.
 """
 
+import json
+from typing import Optional
+
 # Base system prompt - used throughout the entire conversation
 BASE_SYSTEM_PROMPT = """
 # ROLE AND OBJECTIVE
@@ -235,6 +238,49 @@ Important:
 Leave fields as null if not mentioned."""
 
 
+INCREMENTAL_TEMPLATE_EXTRACTION_PROMPT = """Update the case template using only the latest conversation messages.
+
+The template filled so far (from earlier messages) is:
+
+{template_json}
+
+Return values ONLY for fields that the latest messages newly state, clearly imply, or correct.
+Leave every other field as null - null means "no change", not "unknown".
+
+Important:
+- marital_status/family structure can be inferred from parent information (e.g., "father died" = single parent/widowed)
+- diagnosis can include functional descriptions, not just formal diagnoses
+- cultural_background includes ethnicity, religion, and origin
+- Short answers ("yes", "7", "at school") refer to the assistant question right before them"""
+
+
+SCENARIO_METADATA_EXTRACTION_PROMPT = """Extract the case template from this training scenario.
+The scenario describes an occupational therapist (the therapist fields) and a patient (the patient fields).
+Only include fields that are explicitly stated or clearly implied in the scenario.
+
+Important:
+- patient_age should be the age in years when it is given (e.g. "16")
+- treatment_setting is where the session in the scenario takes place
+- diagnosis can include functional descriptions, not just formal diagnoses
+- Write the values in English
+
+Leave fields as null if not mentioned."""
+
+
+def create_incremental_extraction_prompt(template: dict) -> str:
+    """
+    Create the system prompt for delta-based template extraction.
+
+    Args:
+        template: Filled template fields (Template.to_dict())
+
+    Returns:
+        Extraction prompt embedding the current template state
+    """
+    template_json = json.dumps(template, indent=2, ensure_ascii=False) if template else "{}"
+    return INCREMENTAL_TEMPLATE_EXTRACTION_PROMPT.format(template_json=template_json)
+
+
 def create_scenario_context_message(scenarios: list[dict]) -> str:
     """
     Create the system message containing retrieved scenarios.
@@ -257,3 +303,72 @@ The following scenarios match the current case context. Use them as reference fo
 
 {scenario_text}
 """
+
+
+CONVERSATION_SUMMARY_PROMPT = """You maintain a running summary of an ongoing mentoring conversation between an Occupational Therapy mentor and a trainee.
+
+Current summary of the earlier conversation:
+
+{previous_summary}
+
+Update the summary with the transcript excerpt the user provides. The excerpt continues right after the current summary.
+
+The summary must preserve:
+- Case facts the trainee shared (patient, setting, difficulty) that are not obvious from the system context
+- Which professional reasoning types (Scientific, Narrative, Pragmatic, Ethical, Interactive) were explored and what the trainee concluded
+- Insights, reflections and gaps in the trainee's reasoning
+- Open questions and the mentor's current line of inquiry
+
+Write in the language of the conversation. Use concise bullet points, at most 300 words.
+Return only the updated summary."""
+
+
+def create_summary_update_prompt(previous_summary: Optional[str]) -> str:
+    """
+    Create the system prompt for folding turns into the rolling summary.
+
+    Args:
+        previous_summary: Current summary text, or None for the first summary
+
+    Returns:
+        Summary update prompt
+    """
+    return CONVERSATION_SUMMARY_PROMPT.format(
+        previous_summary=previous_summary or "(none yet - this is the beginning of the conversation)"
+    )
+
+
+def create_summary_context_message(summary: str) -> str:
+    """
+    Create the system message that stands in for summarized earlier turns.
+
+    Args:
+        summary: Rolling summary text
+
+    Returns:
+        Formatted system message with the summary
+    """
+    return f"""
+## CONVERSATION SUMMARY
+
+Earlier turns of this conversation are summarized below. The most recent messages follow verbatim.
+
+{summary}
+"""
+
+
+def format_transcript(messages: list) -> str:
+    """
+    Render user/assistant messages as a plain transcript.
+
+    Args:
+        messages: LangChain HumanMessage/AIMessage objects
+
+    Returns:
+        Transcript with one "Trainee:"/"Mentor:" entry per message
+    """
+    lines = []
+    for msg in messages:
+        speaker = "Trainee" if msg.type == "human" else "Mentor"
+        lines.append(f"{speaker}: {msg.content}")
+    return "\n\n".join(lines)
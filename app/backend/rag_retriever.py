@@ -2,69 +2,315 @@
 RAG Retriever for scenario similarity search using ChromaDB.
 
 Handles embedding and retrieval of relevant scenarios based on conversation context.
+Queries go either through Chroma or, with `vector_backend = "numpy"`, through
+an in-process NumPy index loaded once from the Chroma collection or from an
+exported scenario bundle (backend.vector_index); both return the same
+scenarios in the same order. With `hybrid_retrieval` the dense ranking is
+fused with a local Hebrew-aware BM25 index (backend.lexical_index), which
+also answers alone when the embedding API fails or is too slow. Scenario
+metadata extracted at ingestion (backend.scenario_metadata) pre-filters the
+searched scenarios or boosts those matching the session template.
 """
 
-from typing import List, Dict, Any, Optional
-from langchain_chroma import Chroma
-from langchain_google_genai import GoogleGenerativeAIEmbeddings
+import asyncio
+from concurrent.futures import TimeoutError as FuturesTimeoutError
+from typing import List, Dict, Any, Optional, Tuple
 from backend.config import get_config
+from backend.lexical_index import reciprocal_rank_fusion
+from backend.resources import (
+    get_dense_executor,
+    get_embeddings,
+    get_lexical_index,
+    get_scenario_metadata,
+    get_vector_index,
+    get_vector_store
+)
+from backend.scenario_metadata import matching_buckets, template_buckets
 
 
 class ScenarioRetriever:
     """
     Retrieves relevant scenarios from ChromaDB based on conversation summary.
+
+    Share one instance across sessions via backend.resources.get_scenario_retriever().
     """
 
     def __init__(self):
         """Initialize the retriever with embedding model and vector store."""
         config = get_config()
 
-        # Initialize embedding model (Gemini Embedding 001)
-        self.embeddings = GoogleGenerativeAIEmbeddings(
-            model=config.embedding_model,
-            google_api_key=config.google_api_key
-        )
+        # Shared embedding model (Gemini Embedding 001), and either the
+        # ChromaDB vector store or the in-process index over the same
+        # collection (which needs no Chroma when loaded from a bundle)
+        self.embeddings = get_embeddings()
+        self.backend = config.vector_backend
+        self.vector_store = get_vector_store() if self.backend == "chroma" else None
+        self.vector_index = get_vector_index() if self.backend == "numpy" else None
+
+        # Local BM25 index fused with the dense ranking (None until ingestion
+        # has built it); dense calls then run in the shared dense pool so they
+        # can time out without blocking the lexical fallback
+        self.lexical_index = get_lexical_index() if config.hybrid_retrieval else None
 
-        # Initialize ChromaDB vector store
-        self.vector_store = Chroma(
-            collection_name=config.chroma_collection_name,
-            embedding_function=self.embeddings,
-            persist_directory=config.chroma_db_path
+        # Structured scenario metadata (None until ingestion has extracted it)
+        self.metadata_mode = config.scenario_metadata_mode
+        self.scenario_metadata = get_scenario_metadata() if self.metadata_mode != "off" else None
+
+        # Scenario ID -> row lookups for pre-filtered searches
+        self._index_rows = (
+            {document["id"]: row for row, document in enumerate(self.vector_index.documents)}
+            if self.vector_index is not None else {}
         )
+        lexical_documents = self.lexical_index.documents if self.lexical_index is not None else []
+        self._lexical_rows = {document["id"]: row for row, document in enumerate(lexical_documents)}
+        self._lexical_documents = {document["id"]: document for document in lexical_documents}
 
         self.top_k = config.top_k_scenarios
 
-    def retrieve_scenarios(self, query_text: str) -> List[Dict[str, Any]]:
+    @staticmethod
+    def _format_scenario(scenario_id: str, title: str, content: str, score: Optional[float]) -> Dict[str, Any]:
+        return {
+            "id": scenario_id,
+            "title": title,
+            "content": content,
+            "similarity_score": float(score) if score is not None else None
+        }
+
+    def _search_index(
+        self, query_vectors: List[List[float]], k: int, rows: Optional[List[int]] = None
+    ) -> List[List[Dict[str, Any]]]:
+        """Top-k scenarios per query vector from the NumPy index (optionally only the given rows)."""
+        documents = self.vector_index.documents
+        return [
+            [
+                self._format_scenario(documents[row]["id"], documents[row]["title"], documents[row]["content"], score)
+                for row, score in results
+            ]
+            for results in self.vector_index.search(query_vectors, k, rows)
+        ]
+
+    def _metadata_plan(self, template: Optional[Dict[str, Any]]) -> Tuple[Optional[List[str]], List[str]]:
+        """
+        Pre-filter and boost ranking for one query from its template's buckets.
+
+        Args:
+            template: Filled template fields of the session, if known
+
+        Returns:
+            Tuple of (scenario IDs to search, or None for all; scenario IDs
+            sharing query buckets, most shared first, to boost)
+        """
+        if self.scenario_metadata is None or not template or self.metadata_mode == "off":
+            return None, []
+        buckets = template_buckets(template)
+        if not buckets:
+            return None, []
+        shared = {
+            scenario_id: matching_buckets(entry, buckets)
+            for scenario_id, entry in self.scenario_metadata.items()
+        }
+
+        if self.metadata_mode == "filter":
+            allowed = [scenario_id for scenario_id, count in shared.items() if count == len(buckets)]
+            # Too few exact matches: relax to any shared bucket, then to all scenarios
+            if len(allowed) < self.top_k:
+                allowed = [scenario_id for scenario_id, count in shared.items() if count > 0]
+            return (allowed if len(allowed) >= self.top_k else None), []
+
+        boost = sorted((scenario_id for scenario_id, count in shared.items() if count > 0), key=lambda i: -shared[i])
+        return None, boost
+
+    def _dense_search(
+        self, query_texts: List[str], k: int, allowed: Optional[List[Optional[List[str]]]] = None
+    ) -> List[List[Dict[str, Any]]]:
+        """
+        Top-k scenarios per query by embedding similarity.
+
+        Args:
+            query_texts: Query texts
+            k: Results per query
+            allowed: Per query, the scenario IDs to search (None for all)
+        """
+        allowed = allowed or [None] * len(query_texts)
+        if self.vector_index is not None:
+            vectors = [self.embeddings.embed_query(query_text) for query_text in query_texts]
+            if all(ids is None for ids in allowed):
+                return self._search_index(vectors, k)
+            return [
+                self._search_index([vector], k, self._rows(self._index_rows, ids))[0]
+                for vector, ids in zip(vectors, allowed)
+            ]
+
+        batches = []
+        for query_text, ids in zip(query_texts, allowed):
+            # Perform similarity search (restricted to the pre-filtered scenarios)
+            search_filter = {"id": {"$in": ids}} if ids is not None else None
+            results = self.vector_store.similarity_search_with_score(query_text, k=k, filter=search_filter)
+            batches.append([
+                self._format_scenario(
+                    doc.metadata.get("id", "unknown"),
+                    doc.metadata.get("title", "Untitled Scenario"),
+                    doc.page_content,
+                    score
+                )
+                for doc, score in results
+            ])
+        return batches
+
+    @staticmethod
+    def _rows(rows_by_id: Dict[str, int], ids: Optional[List[str]]) -> Optional[List[int]]:
+        """Index rows of the given scenario IDs (None for all)."""
+        if ids is None:
+            return None
+        return [rows_by_id[scenario_id] for scenario_id in ids if scenario_id in rows_by_id]
+
+    def _dense_search_or_none(
+        self, query_texts: List[str], k: int, allowed: Optional[List[Optional[List[str]]]] = None
+    ) -> Optional[List[List[Dict[str, Any]]]]:
+        """
+        Dense search bounded by `dense_timeout_seconds`.
+
+        Returns:
+            Dense results, or None if the embedding call failed or timed out
+            (a timed-out call keeps running and still fills the embedding cache)
+        """
+        future = get_dense_executor().submit(self._dense_search, query_texts, k, allowed)
+        try:
+            return future.result(timeout=get_config().dense_timeout_seconds)
+        except FuturesTimeoutError:
+            print("Dense retrieval timed out, using lexical results only")
+        except Exception as e:
+            print(f"Dense retrieval failed ({e}), using lexical results only")
+        return None
+
+    def _fuse(
+        self,
+        query_text: str,
+        dense: Optional[List[Dict[str, Any]]],
+        allowed: Optional[List[str]] = None,
+        boost: Optional[List[str]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Fuse the dense, BM25 and metadata rankings of one query (reciprocal rank fusion).
+
+        Args:
+            query_text: Query text
+            dense: Dense candidates, or None to rank without them
+            allowed: Scenario IDs the BM25 side may return (None for all)
+            boost: Scenario IDs sharing the query's metadata buckets, most shared
+                first; only reorders scenarios the other rankings found
+
+        Returns:
+            Top-K scenario dictionaries; 'similarity_score' keeps the dense
+            distance (None for scenarios only the BM25 side found)
+        """
+        config = get_config()
+        rankings = [[scenario["id"] for scenario in dense]] if dense else []
+        dense_by_id = {scenario["id"]: scenario for scenario in dense or []}
+
+        lexical_scores: Dict[str, float] = {}
+        if self.lexical_index is not None:
+            rows = self._rows(self._lexical_rows, allowed)
+            lexical = [
+                (self.lexical_index.documents[row]["id"], score)
+                for row, score in self.lexical_index.search(query_text, config.hybrid_candidates, rows)
+            ]
+            rankings.append([scenario_id for scenario_id, _ in lexical])
+            lexical_scores = dict(lexical)
+
+        if boost:
+            candidates = set(dense_by_id) | set(lexical_scores)
+            rankings.append([scenario_id for scenario_id in boost if scenario_id in candidates])
+
+        if dense is None:
+            retrieval = "lexical"
+        else:
+            retrieval = "hybrid" if self.lexical_index is not None else "dense"
+
+        scenarios = []
+        for scenario_id, fused_score in reciprocal_rank_fusion(rankings, config.rrf_k)[:self.top_k]:
+            scenario = dense_by_id.get(scenario_id)
+            if scenario is None:
+                document = self._lexical_documents[scenario_id]
+                scenario = self._format_scenario(scenario_id, document["title"], document["content"], None)
+            scenarios.append({
+                **scenario,
+                "lexical_score": lexical_scores.get(scenario_id),
+                "fused_score": fused_score,
+                "retrieval": retrieval
+            })
+        return scenarios
+
+    def retrieve_scenarios(self, query_text: str, template: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
         """
         Retrieve top-K relevant scenarios based on query text.
 
         Args:
             query_text: Natural language summary of the case context
+            template: Filled template fields, used to filter or boost scenarios
+                by their extracted metadata (scenario_metadata_mode)
 
         Returns:
             List of scenario dictionaries with keys:
                 - id: Scenario identifier
                 - title: Scenario title
                 - content: Full scenario text
-                - similarity_score: Cosine similarity score
+                - similarity_score: Distance from the query (lower is closer)
+            plus, with hybrid retrieval or a metadata boost, lexical_score
+            (BM25), fused_score (RRF) and retrieval ("hybrid", "dense", or
+            "lexical" on the offline fallback)
         """
-        # Perform similarity search
-        results = self.vector_store.similarity_search_with_score(
-            query_text,
-            k=self.top_k
-        )
+        return self.retrieve_scenarios_batch([query_text], [template])[0]
 
-        # Format results
-        scenarios = []
-        for doc, score in results:
-            scenarios.append({
-                "id": doc.metadata.get("id", "unknown"),
-                "title": doc.metadata.get("title", "Untitled Scenario"),
-                "content": doc.page_content,
-                "similarity_score": float(score)
-            })
+    def retrieve_scenarios_batch(
+        self, query_texts: List[str], templates: Optional[List[Optional[Dict[str, Any]]]] = None
+    ) -> List[List[Dict[str, Any]]]:
+        """
+        Retrieve top-K scenarios for several queries at once.
 
-        return scenarios
+        With the numpy backend all unfiltered queries are answered by one
+        matrix product.
+
+        Args:
+            query_texts: Natural language case summaries
+            templates: Filled template fields per query (optional)
+
+        Returns:
+            One list of scenario dictionaries (as in retrieve_scenarios) per query
+        """
+        plans = [self._metadata_plan(template) for template in templates or [None] * len(query_texts)]
+        allowed = [ids for ids, _ in plans]
+        boosted = any(boost for _, boost in plans)
+        if self.lexical_index is None and not boosted:
+            return self._dense_search(query_texts, self.top_k, allowed)
+
+        candidate_k = max(self.top_k, get_config().hybrid_candidates)
+        if self.lexical_index is None:
+            dense = self._dense_search(query_texts, candidate_k, allowed)
+        else:
+            dense = self._dense_search_or_none(query_texts, candidate_k, allowed)
+        return [
+            self._fuse(query_text, dense[i] if dense is not None else None, *plans[i])
+            for i, query_text in enumerate(query_texts)
+        ]
+
+    async def aretrieve_scenarios(
+        self, query_text: str, template: Optional[Dict[str, Any]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Async variant of retrieve_scenarios.
+
+        The embedding call and Chroma query are blocking, so they run in a
+        worker thread to keep the event loop free.
+
+        Args:
+            query_text: Natural language summary of the case context
+            template: Filled template fields (see retrieve_scenarios)
+
+        Returns:
+            Same list of scenario dictionaries as retrieve_scenarios
+        """
+        return await asyncio.to_thread(self.retrieve_scenarios, query_text, template)
 
     def check_collection_exists(self) -> bool:
         """
@@ -73,6 +319,8 @@ class ScenarioRetriever:
         Returns:
             True if collection exists and has documents, False otherwise
         """
+        if self.vector_index is not None:
+            return len(self.vector_index) > 0
         try:
             # Try to get collection
             collection = self.vector_store._collection
@@ -88,6 +336,8 @@ class ScenarioRetriever:
         Returns:
             Number of documents in collection, or 0 if error
         """
+        if self.vector_index is not None:
+            return len(self.vector_index)
         try:
             collection = self.vector_store._collection
             return collection.count()
@@ -0,0 +1,442 @@
+"""
+Shared resources for the OT Mentor AI system.
+
+Process-wide registry of the heavy, thread-safe clients (chat model, structured
+extraction model, embeddings and their cache, Chroma vector store, scenario retriever, session
+store and the background worker pool). They are created once on first use and
+shared by all sessions, so a new session only builds its lightweight
+per-session state.
+
+The provider SDKs (langchain_google_genai, langchain_chroma/chromadb) are
+imported on first use, not at import time, so importing the backend stays cheap.
+warm_up_in_background() preloads them after the first page render.
+"""
+
+import importlib
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, Callable, Dict, Hashable, Optional
+
+from backend.config import get_config
+
+if TYPE_CHECKING:
+    from langchain_chroma import Chroma
+    from langchain_google_genai import ChatGoogleGenerativeAI, GoogleGenerativeAIEmbeddings
+
+
+# Chat model sampling temperature
+CHAT_TEMPERATURE = 0.7
+
+# Modules that are slow to import and only needed once a session talks to Gemini/Chroma
+HEAVY_MODULES = [
+    "langchain_google_genai",
+    "langchain_chroma",
+    "chromadb",
+]
+
+_resources: Dict[Hashable, Any] = {}
+_key_locks: Dict[Hashable, threading.Lock] = {}  # One per resource, held while it is built
+_lock = threading.RLock()  # Guards the registry dictionaries only
+_warm_up_thread: Optional[threading.Thread] = None
+
+
+def _get_or_create(key: Hashable, factory: Callable[[], Any]) -> Any:
+    """
+    Get a shared resource, creating it on first use.
+
+    Only callers of the same key wait for its factory, so a slow client
+    construction does not block unrelated resources (or the factories of
+    resources it depends on).
+
+    Args:
+        key: Registry key (includes every setting the resource depends on)
+        factory: Zero-argument callable that builds the resource
+
+    Returns:
+        The shared resource
+    """
+    resource = _resources.get(key)
+    if resource is None:
+        with _lock:
+            key_lock = _key_locks.setdefault(key, threading.Lock())
+        with key_lock:
+            resource = _resources.get(key)
+            if resource is None:
+                resource = factory()
+                with _lock:
+                    _resources[key] = resource
+    return resource
+
+
+def _get_base_chat_model(temperature: float) -> "ChatGoogleGenerativeAI":
+    """Get the shared, uncached chat model for the active model configuration."""
+    from langchain_google_genai import ChatGoogleGenerativeAI
+
+    config = get_config()
+    key = ("chat_model", config.model_config.technical_name, temperature)
+    return _get_or_create(key, lambda: ChatGoogleGenerativeAI(
+        model=config.model_config.technical_name,
+        google_api_key=config.google_api_key,
+        temperature=temperature
+    ))
+
+
+def get_chat_model(temperature: float = CHAT_TEMPERATURE) -> Any:
+    """
+    Get the shared chat model for the active model configuration.
+
+    Wrapped in the disk-backed response cache when `llm_cache_enabled` is set.
+
+    Args:
+        temperature: Sampling temperature
+
+    Returns:
+        ChatGoogleGenerativeAI instance (or CachedChatModel wrapping it)
+    """
+    config = get_config()
+    if not config.llm_cache_enabled:
+        return _get_base_chat_model(temperature)
+
+    from backend.llm_cache import CachedChatModel
+
+    key = ("cached_chat_model", config.model_config.technical_name, temperature, config.llm_cache_path)
+    return _get_or_create(key, lambda: CachedChatModel(
+        _get_base_chat_model(temperature),
+        get_llm_cache(),
+        config.model_config.technical_name,
+        temperature
+    ))
+
+
+def get_extraction_model(schema: type, temperature: float = CHAT_TEMPERATURE) -> Any:
+    """
+    Get the shared structured-output model for a Pydantic schema.
+
+    Wrapped in the disk-backed response cache when `llm_cache_enabled` is set.
+
+    Args:
+        schema: Pydantic model class describing the output
+        temperature: Sampling temperature of the underlying chat model
+
+    Returns:
+        Runnable returning instances of the schema
+    """
+    config = get_config()
+    key = ("extraction_model", config.model_config.technical_name, temperature, schema)
+    model = _get_or_create(
+        key,
+        lambda: _get_base_chat_model(temperature).with_structured_output(schema)
+    )
+    if not config.llm_cache_enabled:
+        return model
+
+    from backend.llm_cache import CachedStructuredModel
+
+    key = ("cached_extraction_model", config.model_config.technical_name, temperature, schema,
+           config.llm_cache_path)
+    return _get_or_create(key, lambda: CachedStructuredModel(
+        model,
+        schema,
+        get_llm_cache(),
+        config.model_config.technical_name,
+        temperature
+    ))
+
+
+def get_llm_cache() -> Any:
+    """
+    Get the shared disk-backed LLM response cache.
+
+    Returns:
+        LLMResponseCache instance
+    """
+    from backend.llm_cache import LLMResponseCache
+
+    config = get_config()
+    key = ("llm_cache", config.llm_cache_path)
+    return _get_or_create(key, lambda: LLMResponseCache(
+        config.llm_cache_path,
+        config.llm_cache_max_bytes
+    ))
+
+
+def _get_base_embeddings() -> "GoogleGenerativeAIEmbeddings":
+    """Get the shared, uncached embedding model."""
+    from langchain_google_genai import GoogleGenerativeAIEmbeddings
+
+    config = get_config()
+    key = ("embeddings", config.embedding_model)
+    return _get_or_create(key, lambda: GoogleGenerativeAIEmbeddings(
+        model=config.embedding_model,
+        google_api_key=config.google_api_key
+    ))
+
+
+def get_embeddings() -> Any:
+    """
+    Get the shared embedding model.
+
+    Wrapped in the persistent embedding cache when `embedding_cache_enabled` is set.
+
+    Returns:
+        GoogleGenerativeAIEmbeddings instance (or CachedEmbeddings wrapping it)
+    """
+    config = get_config()
+    if not config.embedding_cache_enabled:
+        return _get_base_embeddings()
+
+    from backend.embedding_cache import CachedEmbeddings
+
+    key = ("cached_embeddings", config.embedding_model, config.embedding_cache_path)
+    return _get_or_create(key, lambda: CachedEmbeddings(
+        _get_base_embeddings(),
+        get_embedding_cache(),
+        config.embedding_model
+    ))
+
+
+def get_embedding_cache() -> Any:
+    """
+    Get the shared persistent embedding cache.
+
+    Returns:
+        EmbeddingCache instance
+    """
+    from backend.embedding_cache import EmbeddingCache
+
+    config = get_config()
+    key = ("embedding_cache", config.embedding_cache_path)
+    return _get_or_create(key, lambda: EmbeddingCache(
+        config.embedding_cache_path,
+        config.embedding_cache_max_entries
+    ))
+
+
+def get_vector_store() -> "Chroma":
+    """
+    Get the shared Chroma vector store (one persistent client per database path).
+
+    Returns:
+        Chroma vector store
+    """
+    from langchain_chroma import Chroma
+
+    config = get_config()
+    key = ("vector_store", config.chroma_db_path, config.chroma_collection_name, config.embedding_model,
+           config.embedding_cache_enabled)
+    return _get_or_create(key, lambda: Chroma(
+        collection_name=config.chroma_collection_name,
+        embedding_function=get_embeddings(),
+        persist_directory=config.chroma_db_path
+    ))
+
+
+def get_vector_index() -> Any:
+    """
+    Get the shared in-process NumPy index of the scenario collection.
+
+    Memory-maps the scenario bundle at `vector_bundle_dir` when there is one,
+    otherwise loads the vectors from the Chroma collection.
+
+    Returns:
+        NumpyVectorIndex instance
+    """
+    from backend.vector_index import NumpyVectorIndex, bundle_exists
+
+    config = get_config()
+    if bundle_exists(config.vector_bundle_dir):
+        key = ("vector_index", "bundle", config.vector_bundle_dir, config.embedding_model)
+        return _get_or_create(key, lambda: NumpyVectorIndex.from_bundle(
+            config.vector_bundle_dir,
+            config.embedding_model
+        ))
+    key = ("vector_index", "chroma", config.chroma_db_path, config.chroma_collection_name, config.embedding_model)
+    return _get_or_create(key, lambda: NumpyVectorIndex.from_chroma(get_vector_store()))
+
+
+def get_lexical_index() -> Any:
+    """
+    Get the shared BM25 index of the scenario texts.
+
+    Returns:
+        BM25Index instance, or None if it has not been built yet
+    """
+    from backend.lexical_index import BM25Index
+
+    config = get_config()
+    if not os.path.exists(config.lexical_index_path):
+        return None
+    return _get_or_create(("lexical_index", config.lexical_index_path), lambda: BM25Index.load(
+        config.lexical_index_path
+    ))
+
+
+def get_scenario_metadata() -> Optional[Dict[str, Dict[str, Any]]]:
+    """
+    Get the shared structured metadata of the scenarios.
+
+    Returns:
+        Scenario ID -> metadata entry, or None if ingestion has not extracted it yet
+    """
+    from backend.scenario_metadata import load_scenario_metadata
+
+    config = get_config()
+    if not os.path.exists(config.scenario_metadata_path):
+        return None
+    return _get_or_create(("scenario_metadata", config.scenario_metadata_path), lambda: load_scenario_metadata(
+        config.scenario_metadata_path
+    ))
+
+
+def get_scenario_retriever() -> Any:
+    """
+    Get the shared scenario retriever.
+
+    Returns:
+        ScenarioRetriever instance
+    """
+    # Imported here: rag_retriever itself builds on this module
+    from backend.rag_retriever import ScenarioRetriever
+
+    config = get_config()
+    key = ("scenario_retriever", config.chroma_db_path, config.chroma_collection_name,
+           config.embedding_model, config.top_k_scenarios, config.vector_backend, config.vector_bundle_dir,
+           config.hybrid_retrieval, config.lexical_index_path, config.scenario_metadata_mode,
+           config.scenario_metadata_path)
+    return _get_or_create(key, ScenarioRetriever)
+
+
+def get_session_store() -> Any:
+    """
+    Get the shared session storage backend selected by `session_backend`.
+
+    Returns:
+        FileSessionStore or SQLiteSessionStore instance
+    """
+    from backend.session_store import FileSessionStore, SQLiteSessionStore
+
+    config = get_config()
+    if config.session_backend == "sqlite":
+        key = ("session_store", "sqlite", config.sessions_db_path)
+        return _get_or_create(key, lambda: SQLiteSessionStore(config.sessions_db_path))
+    if config.session_backend != "files":
+        raise ValueError(f"Unknown session backend: {config.session_backend}")
+    key = ("session_store", "files", config.sessions_dir, config.prompt_blobs_dir)
+    return _get_or_create(key, lambda: FileSessionStore(config.sessions_dir, config.prompt_blobs_dir))
+
+
+def get_prompt_store() -> Any:
+    """
+    Get the shared prompt blob store of the active session store.
+
+    Returns:
+        PromptStore instance
+    """
+    from backend.prompt_store import PromptStore
+
+    store = get_session_store()
+    return _get_or_create(("prompt_store", id(store)), lambda: PromptStore(store))
+
+
+def get_session_catalog() -> Any:
+    """
+    Get the shared session catalog index.
+
+    Returns:
+        SessionCatalog instance
+    """
+    from backend.session_catalog import SessionCatalog
+
+    config = get_config()
+    key = ("session_catalog", config.session_catalog_path)
+    return _get_or_create(key, lambda: SessionCatalog(config.session_catalog_path))
+
+
+def get_session_archive() -> Any:
+    """
+    Get the shared cold-session archive.
+
+    Returns:
+        SessionArchive instance
+    """
+    from backend.session_archive import SessionArchive
+
+    config = get_config()
+    return _get_or_create(("session_archive", config.archive_dir), lambda: SessionArchive(config.archive_dir))
+
+
+def get_background_executor() -> ThreadPoolExecutor:
+    """
+    Get the shared background worker pool (e.g. concurrent INTAKE extraction).
+
+    Returns:
+        ThreadPoolExecutor instance
+    """
+    workers = get_config().background_workers
+    return _get_or_create(
+        ("background_executor", workers),
+        lambda: ThreadPoolExecutor(max_workers=workers, thread_name_prefix="ot-mentor-bg")
+    )
+
+
+def get_dense_executor() -> ThreadPoolExecutor:
+    """
+    Get the worker pool for dense scenario searches.
+
+    Separate from the background pool, so a dense call left running after
+    its timeout never delays extraction or summary work.
+
+    Returns:
+        ThreadPoolExecutor instance
+    """
+    return _get_or_create(
+        "dense_executor",
+        lambda: ThreadPoolExecutor(max_workers=2, thread_name_prefix="ot-mentor-dense")
+    )
+
+
+def clear_shared_resources() -> None:
+    """Drop all shared resources so the next use recreates them (benchmarks, config changes)."""
+    with _lock:
+        executors = [r for r in _resources.values() if isinstance(r, ThreadPoolExecutor)]
+        _resources.clear()
+        _key_locks.clear()
+    for executor in executors:
+        executor.shutdown(wait=False)
+
+
+def preload_modules() -> None:
+    """Import the heavy provider modules (no clients are created)."""
+    for module_name in HEAVY_MODULES:
+        importlib.import_module(module_name)
+
+
+def warm_up() -> None:
+    """
+    Preload heavy modules and create the shared clients.
+
+    Best-effort: failures (e.g. missing API key) are logged and the clients
+    are created again on first real use.
+    """
+    try:
+        preload_modules()
+        get_chat_model()
+        get_scenario_retriever()
+    except Exception as e:
+        print(f"Warm-up error: {e}")
+
+
+def warm_up_in_background() -> threading.Thread:
+    """
+    Start warm_up() in a daemon thread (once per process).
+
+    Returns:
+        The warm-up thread
+    """
+    global _warm_up_thread
+    with _lock:
+        if _warm_up_thread is None:
+            _warm_up_thread = threading.Thread(target=warm_up, name="ot-mentor-warm-up", daemon=True)
+            _warm_up_thread.start()
+    return _warm_up_thread
@@ -0,0 +1,237 @@
+"""
+Structured scenario metadata for filtered and boosted retrieval.
+
+scripts/ingest_scenarios.py extracts the 18 template fields from every
+scenario once (same extraction model and fields as the intake template) and
+derives three normalized buckets from them:
+
+- age_range: child / adolescent / adult / older_adult
+- setting: school / psychiatric / hospital / rehabilitation / community / home / clinic
+- diagnosis_family: neurodevelopmental / neurological / mental_health / orthopedic / other
+
+The buckets are stored as Chroma metadata and in one JSON file that
+ScenarioRetriever loads at startup. The same buckets are computed from the
+session template at retrieval time, and scenarios that share them are
+either ranked higher ("boost") or the only candidates searched ("filter").
+Keyword lists cover both English and Hebrew, since either can appear in a
+template. English keywords match whole words (an optional plural ending
+allowed), or any word starting with them when they end in "*"; Hebrew
+keywords match anywhere, since prefixes such as ב/ה/ו attach to the word.
+"""
+
+import hashlib
+import json
+import re
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from backend.persistence import atomic_write_json
+from backend.tools import TEMPLATE_FIELDS
+
+SCENARIO_METADATA_FORMAT_VERSION = 1
+
+BUCKET_FIELDS = ("age_range", "setting", "diagnosis_family")
+
+# Upper age bound (inclusive) of each age bucket
+AGE_RANGES = [(12, "child"), (17, "adolescent"), (64, "adult"), (200, "older_adult")]
+AGE_WORDS = {
+    "child": ["child", "kid", "toddler", "infant", "ילד", "ילדה", "פעוט", "תינוק"],
+    "adolescent": ["adolescent", "teen*", "youth", "נער", "נערה", "מתבגר"],
+    "older_adult": ["elderly", "older adult", "senior", "קשיש", "קשישה", "מבוגר מאוד"],
+    "adult": ["adult", "מבוגר", "מבוגרת"],
+}
+
+# Checked in order: "בית ספר" and "בית חולים" must win over the home keywords
+SETTING_KEYWORDS = {
+    "school": ["school", "kindergarten", "preschool", "classroom", "בית ספר", "בית הספר", "גן ילדים", "כיתה"],
+    "psychiatric": ["psychiatr*", "mental health", "פסיכיאטר", "בריאות הנפש"],
+    "hospital": ["hospital*", "ward", "inpatient", "בית חולים", "בית החולים", "אשפוז", "מחלקה"],
+    "rehabilitation": ["rehab*", "שיקום", "שיקומי"],
+    "community": ["community", "day center", "sheltered", "קהילה", "קהילתי", "מרכז יום", "הוסטל", "מוגן"],
+    "home": ["home", "בבית", "ביתי", "ביקור בית"],
+    "clinic": ["clinic", "private practice", "outpatient", "קליניקה", "מכון"],
+}
+
+DIAGNOSIS_KEYWORDS = {
+    "neurodevelopmental": [
+        "autis*", "asd", "adhd", "attention deficit", "learning disab*", "developmental", "dcd", "sensory",
+        "אוטיזם", "אוטיסט", "קשב", "לקויות למידה", "לקות למידה", "התפתחות", "ויסות חושי",
+    ],
+    "neurological": [
+        "stroke", "cva", "spinal", "brain injury", "tbi", "parkinson*", "sclerosis", "cerebral palsy", "dementia",
+        "שבץ", "אירוע מוחי", "חוט השדרה", "פגיעת ראש", "פגיעה מוחית", "פרקינסון", "טרשת", "שיתוק מוחין", "דמנציה",
+    ],
+    "mental_health": [
+        "depress*", "anxiety", "schizo*", "bipolar", "psychos*", "eating disorder", "ptsd", "trauma*", "ocd",
+        "personality disorder", "דיכאון", "חרדה", "סכיזופרני", "דו קוטבי", "פסיכוזה", "הפרעת אכילה", "טראומה",
+        "אובססיבית", "הפרעת אישיות",
+    ],
+    "orthopedic": [
+        "fracture", "amputation", "orthop*", "arthritis", "hand injury", "tendon",
+        "שבר ב", "קטיעה", "אורתופד", "דלקת פרקים", "פגיעת יד", "גידים",
+    ],
+}
+
+
+@lru_cache(maxsize=None)
+def _keyword_pattern(keyword: str) -> "re.Pattern":
+    if not keyword.isascii():
+        return re.compile(re.escape(keyword))
+    if keyword.endswith("*"):
+        return re.compile(r"\b" + re.escape(keyword[:-1]))
+    # "ward" must not match "toward", nor "home" match "homework"
+    return re.compile(r"\b" + re.escape(keyword) + r"(?:e?s)?\b")
+
+
+def _contains_keyword(text: str, keywords: List[str]) -> bool:
+    return any(_keyword_pattern(keyword).search(text) for keyword in keywords)
+
+
+def age_bucket(patient_age: Optional[str]) -> Optional[str]:
+    """
+    Bucket a free-text patient age.
+
+    Args:
+        patient_age: Template value, e.g. "16", "בן 16" or "teenager"
+
+    Returns:
+        Age bucket, or None if the age is unknown
+    """
+    if not patient_age:
+        return None
+    text = patient_age.lower()
+    match = re.search(r"\d+", text)
+    if match:
+        age = int(match.group())
+        return next(bucket for limit, bucket in AGE_RANGES if age <= limit)
+    for bucket, words in AGE_WORDS.items():
+        if _contains_keyword(text, words):
+            return bucket
+    return None
+
+
+def setting_bucket(*settings: Optional[str]) -> Optional[str]:
+    """
+    Bucket the treatment setting.
+
+    Args:
+        settings: Setting values in order of preference (treatment_setting,
+            then therapist_setting)
+
+    Returns:
+        Setting bucket, or None if no setting keyword matches
+    """
+    for setting in settings:
+        if not setting:
+            continue
+        text = setting.lower()
+        for bucket, keywords in SETTING_KEYWORDS.items():
+            if _contains_keyword(text, keywords):
+                return bucket
+    return None
+
+
+def diagnosis_family(diagnosis: Optional[str]) -> Optional[str]:
+    """
+    Bucket a diagnosis or functional description.
+
+    Args:
+        diagnosis: Template value
+
+    Returns:
+        Diagnosis family ("other" for an unrecognized diagnosis), or None if
+        there is no diagnosis
+    """
+    if not diagnosis:
+        return None
+    text = diagnosis.lower()
+    for family, keywords in DIAGNOSIS_KEYWORDS.items():
+        if _contains_keyword(text, keywords):
+            return family
+    return "other"
+
+
+def template_buckets(template: Dict[str, Any]) -> Dict[str, str]:
+    """
+    Normalized buckets of a filled template.
+
+    Args:
+        template: Template fields (Template.to_dict() or scenario fields)
+
+    Returns:
+        Dictionary with the known buckets among BUCKET_FIELDS
+    """
+    buckets = {
+        "age_range": age_bucket(template.get("patient_age")),
+        "setting": setting_bucket(template.get("treatment_setting"), template.get("therapist_setting")),
+        "diagnosis_family": diagnosis_family(template.get("diagnosis")),
+    }
+    return {name: value for name, value in buckets.items() if value is not None}
+
+
+def scenario_entry(content: str, fields: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Build the stored metadata of one scenario.
+
+    Args:
+        content: Scenario text
+        fields: Extracted template fields
+
+    Returns:
+        Dictionary with the content hash, the filled template fields and their buckets
+    """
+    fields = {field: fields[field] for field in TEMPLATE_FIELDS if fields.get(field)}
+    return {
+        "content_sha256": content_hash(content),
+        "fields": fields,
+        "buckets": template_buckets(fields),
+    }
+
+
+def chroma_metadata(entry: Dict[str, Any]) -> Dict[str, str]:
+    """Flatten a scenario entry into Chroma metadata (scalar values only)."""
+    return {**entry["fields"], **entry["buckets"]}
+
+
+def content_hash(content: str) -> str:
+    """SHA-256 of a scenario text (re-extraction is skipped while it is unchanged)."""
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+
+def matching_buckets(entry: Dict[str, Any], buckets: Dict[str, str]) -> int:
+    """Number of query buckets a scenario entry shares."""
+    return sum(1 for name, value in buckets.items() if entry["buckets"].get(name) == value)
+
+
+def save_scenario_metadata(path: str, entries: Dict[str, Dict[str, Any]]) -> None:
+    """
+    Write scenario metadata to a JSON file (atomically).
+
+    Args:
+        path: Target file path
+        entries: Scenario ID -> entry from scenario_entry()
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    atomic_write_json(path, {"format": SCENARIO_METADATA_FORMAT_VERSION, "scenarios": entries})
+
+
+def load_scenario_metadata(path: str) -> Dict[str, Dict[str, Any]]:
+    """
+    Read scenario metadata written by save_scenario_metadata().
+
+    Args:
+        path: Metadata file path
+
+    Returns:
+        Scenario ID -> entry
+
+    Raises:
+        ValueError: If the file has another format version
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    if data.get("format") != SCENARIO_METADATA_FORMAT_VERSION:
+        raise ValueError(f"Unsupported scenario metadata format: {data.get('format')}")
+    return data["scenarios"]
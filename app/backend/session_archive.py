@@ -0,0 +1,169 @@
+"""
+Compressed archive tier for cold sessions.
+
+Sessions idle for longer than `archive_ttl_days` can be moved out of the
+session store into one compressed bundle per session under `archive_dir`
+(zstd when the zstandard package is installed, gzip otherwise). A bundle is
+the session's template, retrieved scenarios and conversation plus the prompt
+blobs it references, as JSON, so it is self-contained for analytics.
+
+SessionManager restores an archived session into the store when it is
+resumed, so archiving is invisible to the app.
+"""
+
+import gzip
+import json
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from backend.persistence import atomic_write_bytes
+
+try:
+    import zstandard
+except ImportError:  # Optional dependency; gzip is used instead
+    zstandard = None
+
+BUNDLE_FORMAT_VERSION = 1
+BUNDLE_SUFFIXES = {"zstd": ".json.zst", "gzip": ".json.gz"}
+
+
+def _compress(data: bytes, codec: str) -> bytes:
+    if codec == "zstd":
+        return zstandard.ZstdCompressor(level=10).compress(data)
+    return gzip.compress(data, compresslevel=9)
+
+
+def _decompress(data: bytes, codec: str) -> bytes:
+    if codec == "zstd":
+        if zstandard is None:
+            raise RuntimeError("zstandard is required to read .json.zst session bundles")
+        return zstandard.ZstdDecompressor().decompress(data)
+    return gzip.decompress(data)
+
+
+class SessionArchive:
+    """Directory of compressed per-session bundles."""
+
+    def __init__(self, archive_dir: str, codec: Optional[str] = None):
+        """
+        Args:
+            archive_dir: Directory holding the bundles
+            codec: "zstd" or "gzip" for new bundles (default: zstd if installed)
+        """
+        self.archive_dir = Path(archive_dir)
+        self.codec = codec or ("zstd" if zstandard is not None else "gzip")
+        if self.codec not in BUNDLE_SUFFIXES:
+            raise ValueError(f"Unknown archive codec: {self.codec}")
+        if self.codec == "zstd" and zstandard is None:
+            raise RuntimeError("zstandard is required for zstd session bundles (pip install zstandard)")
+
+    def _find(self, session_id: str) -> Optional[Tuple[Path, str]]:
+        """Locate a session's bundle and its codec."""
+        for codec, suffix in BUNDLE_SUFFIXES.items():
+            path = self.archive_dir / f"{session_id}{suffix}"
+            if path.exists():
+                return path, codec
+        return None
+
+    def contains(self, session_id: str) -> bool:
+        """Check whether a session is archived."""
+        return self._find(session_id) is not None
+
+    def list_sessions(self) -> List[str]:
+        """List the IDs of all archived sessions."""
+        if not self.archive_dir.exists():
+            return []
+        session_ids = set()
+        for suffix in BUNDLE_SUFFIXES.values():
+            session_ids.update(p.name[:-len(suffix)] for p in self.archive_dir.glob(f"*{suffix}"))
+        return sorted(session_ids)
+
+    def bundle_size(self, session_id: str) -> int:
+        """Compressed size of a session's bundle in bytes (0 if not archived)."""
+        found = self._find(session_id)
+        return found[0].stat().st_size if found else 0
+
+    def archive(self, store: Any, session_id: str) -> Tuple[int, int]:
+        """
+        Write a session's bundle and remove the session from the store.
+
+        Args:
+            store: SessionStore holding the session
+            session_id: Session to archive
+
+        Returns:
+            Tuple of (uncompressed bytes, compressed bytes)
+        """
+        conversation, _ = store.read_conversation(session_id)
+        blobs = {}
+        for message in (conversation or {}).get("messages", []):
+            if "ref" in message:
+                digest = message["ref"]["hash"]
+                blobs[digest] = store.read_blob(digest)
+
+        bundle = {
+            "format": BUNDLE_FORMAT_VERSION,
+            "session_id": session_id,
+            "archived_at": time.time(),
+            "updated_at": store.session_updated_at(session_id),
+            "template": store.read_template(session_id),
+            "retrieved_scenarios": store.read_scenarios(session_id),
+            "conversation": conversation,
+            "blobs": blobs
+        }
+        raw = json.dumps(bundle, ensure_ascii=False).encode("utf-8")
+        compressed = _compress(raw, self.codec)
+
+        self.archive_dir.mkdir(parents=True, exist_ok=True)
+        atomic_write_bytes(self.archive_dir / f"{session_id}{BUNDLE_SUFFIXES[self.codec]}", compressed)
+        store.delete_sessions([session_id])
+        return len(raw), len(compressed)
+
+    def read(self, session_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Read a session's bundle without restoring it.
+
+        Args:
+            session_id: Archived session
+
+        Returns:
+            Bundle dictionary, or None if the session is not archived
+        """
+        found = self._find(session_id)
+        if found is None:
+            return None
+        path, codec = found
+        bundle = json.loads(_decompress(path.read_bytes(), codec))
+        if bundle.get("format") != BUNDLE_FORMAT_VERSION:
+            raise ValueError(f"Unsupported session bundle format: {bundle.get('format')}")
+        return bundle
+
+    def restore(self, store: Any, session_id: str) -> bool:
+        """
+        Unpack an archived session into the store and delete its bundle.
+
+        Args:
+            store: SessionStore to restore into
+            session_id: Archived session
+
+        Returns:
+            True if the session was archived and has been restored
+        """
+        bundle = self.read(session_id)
+        if bundle is None:
+            return False
+
+        store.create_session(session_id)
+        for digest, content in bundle["blobs"].items():
+            if content is not None:
+                store.write_blob(digest, content)
+        if bundle["template"] is not None:
+            store.write_template(session_id, bundle["template"])
+        if bundle["retrieved_scenarios"] is not None:
+            store.write_scenarios(session_id, bundle["retrieved_scenarios"])
+        if bundle["conversation"] is not None:
+            store.write_conversation(session_id, bundle["conversation"])
+
+        self._find(session_id)[0].unlink()
+        return True
@@ -0,0 +1,313 @@
+"""
+Session catalog index.
+
+A small SQLite table with one row per saved session (created_at, last update,
+phase transition, turn count, retrieved scenario IDs and key template fields),
+so sessions can be listed and searched without reading every session from the
+session store. SessionManager updates a session's row whenever it flushes;
+rebuild_catalog() recreates the whole index from the session store (and the
+cold-session archive) with a parallel scanner. Archived sessions keep their
+rows, so they stay listed and resumable.
+"""
+
+import json
+import sqlite3
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+# Template fields copied into the catalog (searchable and shown in pickers)
+CATALOG_TEMPLATE_FIELDS = [
+    "therapist_role",
+    "patient_age",
+    "patient_gender",
+    "diagnosis",
+    "treatment_setting",
+    "treatment_type",
+    "main_difficulty",
+]
+
+CATALOG_COLUMNS = [
+    "session_id",
+    "created_at",
+    "updated_at",
+    "phase_transition_at",
+    "turn_count",
+    "scenario_ids",
+] + CATALOG_TEMPLATE_FIELDS
+
+
+class SessionCatalog:
+    """SQLite index of saved sessions."""
+
+    def __init__(self, path: str):
+        """
+        Open (or create) the catalog database.
+
+        Args:
+            path: SQLite file path
+        """
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        template_columns = "".join(f", {field} TEXT" for field in CATALOG_TEMPLATE_FIELDS)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS catalog ("
+            " session_id TEXT PRIMARY KEY,"
+            " created_at TEXT,"
+            " updated_at REAL NOT NULL,"
+            " phase_transition_at TEXT,"
+            " turn_count INTEGER NOT NULL DEFAULT 0,"
+            " scenario_ids TEXT"
+            f"{template_columns})"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_catalog_updated_at ON catalog(updated_at)")
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_catalog_created_at ON catalog(created_at)")
+        self._conn.commit()
+
+    @staticmethod
+    def _to_row(fields: Dict[str, Any]) -> Dict[str, Any]:
+        """Keep catalog columns and encode scenario IDs."""
+        row = {key: value for key, value in fields.items() if key in CATALOG_COLUMNS}
+        if row.get("scenario_ids") is not None:
+            row["scenario_ids"] = json.dumps(row["scenario_ids"], ensure_ascii=False)
+        row.setdefault("updated_at", time.time())
+        return row
+
+    @staticmethod
+    def _from_row(row: tuple) -> Dict[str, Any]:
+        """Decode a catalog row."""
+        entry = dict(zip(CATALOG_COLUMNS, row))
+        entry["scenario_ids"] = json.loads(entry["scenario_ids"]) if entry["scenario_ids"] else []
+        return entry
+
+    def update(self, session_id: str, fields: Dict[str, Any]) -> None:
+        """
+        Insert or update a session's row; columns not in `fields` are kept.
+
+        Args:
+            session_id: Session to update
+            fields: Catalog columns to set (scenario_ids as a list)
+        """
+        row = self._to_row(fields)
+        row.pop("session_id", None)
+        columns = ", ".join(["session_id"] + list(row))
+        placeholders = ", ".join("?" * (len(row) + 1))
+        assignments = ", ".join(f"{key} = excluded.{key}" for key in row)
+        with self._lock, self._conn:
+            self._conn.execute(
+                f"INSERT INTO catalog ({columns}) VALUES ({placeholders}) "
+                f"ON CONFLICT(session_id) DO UPDATE SET {assignments}",
+                (session_id, *row.values())
+            )
+
+    def replace_all(self, entries: List[Dict[str, Any]]) -> None:
+        """
+        Replace the whole catalog (used by rebuild_catalog).
+
+        Args:
+            entries: Complete catalog entries
+        """
+        rows = [self._to_row(entry) for entry in entries]
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM catalog")
+            self._conn.executemany(
+                f"INSERT INTO catalog ({', '.join(CATALOG_COLUMNS)}) "
+                f"VALUES ({', '.join('?' * len(CATALOG_COLUMNS))})",
+                [tuple(row.get(column) for column in CATALOG_COLUMNS) for row in rows]
+            )
+
+    def remove(self, session_ids: List[str]) -> None:
+        """
+        Remove sessions from the catalog.
+
+        Args:
+            session_ids: Sessions to remove
+        """
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "DELETE FROM catalog WHERE session_id = ?", [(session_id,) for session_id in session_ids]
+            )
+
+    def get(self, session_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Get one session's entry.
+
+        Args:
+            session_id: Session ID
+
+        Returns:
+            Catalog entry, or None if not indexed
+        """
+        with self._lock:
+            row = self._conn.execute(
+                f"SELECT {', '.join(CATALOG_COLUMNS)} FROM catalog WHERE session_id = ?", (session_id,)
+            ).fetchone()
+        return self._from_row(row) if row else None
+
+    def search(
+        self,
+        query: Optional[str] = None,
+        phase: Optional[str] = None,
+        min_turns: int = 0,
+        limit: int = 20
+    ) -> List[Dict[str, Any]]:
+        """
+        List sessions, most recently updated first.
+
+        Args:
+            query: Substring matched against the session ID and the catalog template fields
+            phase: "INTAKE" or "MENTORING" to filter by phase
+            min_turns: Minimum number of user turns
+            limit: Maximum number of entries
+
+        Returns:
+            List of catalog entries
+        """
+        conditions = ["turn_count >= ?"]
+        params: List[Any] = [min_turns]
+        if query:
+            searched = ["session_id"] + CATALOG_TEMPLATE_FIELDS
+            conditions.append("(" + " OR ".join(f"{column} LIKE ?" for column in searched) + ")")
+            params.extend([f"%{query}%"] * len(searched))
+        if phase == "MENTORING":
+            conditions.append("phase_transition_at IS NOT NULL")
+        elif phase == "INTAKE":
+            conditions.append("phase_transition_at IS NULL")
+
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT {', '.join(CATALOG_COLUMNS)} FROM catalog "
+                f"WHERE {' AND '.join(conditions)} ORDER BY updated_at DESC LIMIT ?",
+                (*params, limit)
+            ).fetchall()
+        return [self._from_row(row) for row in rows]
+
+    def count(self) -> int:
+        """Number of indexed sessions."""
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM catalog").fetchone()[0]
+
+
+def template_catalog_fields(template: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Pick the catalog template fields from a template dictionary.
+
+    Args:
+        template: Template dictionary
+
+    Returns:
+        Dictionary of catalog template fields
+    """
+    return {field: template.get(field) for field in CATALOG_TEMPLATE_FIELDS}
+
+
+def catalog_entry(
+    session_id: str,
+    conversation: Optional[Dict[str, Any]],
+    template: Optional[Dict[str, Any]],
+    scenarios: Optional[List[Dict[str, Any]]],
+    updated_at: Optional[float] = None
+) -> Optional[Dict[str, Any]]:
+    """
+    Build a catalog entry from a session's saved artifacts.
+
+    Args:
+        session_id: Session ID
+        conversation: Conversation dictionary
+        template: Template dictionary
+        scenarios: Retrieved scenario metadata
+        updated_at: Time of the last write, if known
+
+    Returns:
+        Catalog entry, or None if the session has no conversation
+    """
+    if conversation is None:
+        return None
+
+    # Without a known last write time the creation time keeps rebuilt
+    # entries in a sensible order
+    created_at = conversation.get("created_at")
+    if updated_at is None:
+        updated_at = datetime.fromisoformat(created_at).timestamp() if created_at else time.time()
+    entry = {
+        "session_id": session_id,
+        "created_at": created_at,
+        "updated_at": updated_at,
+        "phase_transition_at": conversation.get("phase_transition_at"),
+        "turn_count": sum(1 for m in conversation["messages"] if m["role"] == "user"),
+        "scenario_ids": [s["id"] for s in scenarios or []],
+    }
+    entry.update(template_catalog_fields(template or {}))
+    return entry
+
+
+def scan_session(store: Any, session_id: str) -> Optional[Dict[str, Any]]:
+    """
+    Build a session's catalog entry from the session store.
+
+    Args:
+        store: SessionStore to read from
+        session_id: Session to scan
+
+    Returns:
+        Catalog entry, or None if the session has no conversation
+    """
+    conversation, _ = store.read_conversation(session_id)
+    return catalog_entry(
+        session_id,
+        conversation,
+        store.read_template(session_id),
+        store.read_scenarios(session_id),
+        store.session_updated_at(session_id)
+    )
+
+
+def scan_archived_session(archive: Any, session_id: str) -> Optional[Dict[str, Any]]:
+    """
+    Build an archived session's catalog entry from its bundle.
+
+    Args:
+        archive: SessionArchive holding the bundle
+        session_id: Archived session
+
+    Returns:
+        Catalog entry, or None if the session has no conversation
+    """
+    bundle = archive.read(session_id)
+    return catalog_entry(
+        session_id,
+        bundle["conversation"],
+        bundle["template"],
+        bundle["retrieved_scenarios"],
+        bundle.get("updated_at")
+    )
+
+
+def rebuild_catalog(store: Any, catalog: SessionCatalog, workers: int = 8, archive: Any = None) -> int:
+    """
+    Rebuild the catalog from every session in the store (and archive).
+
+    Sessions are read concurrently by a thread pool (the scan is dominated by
+    file or database reads and decompression).
+
+    Args:
+        store: SessionStore to scan
+        catalog: Catalog to replace
+        workers: Scanner threads
+        archive: SessionArchive whose sessions are indexed too
+
+    Returns:
+        Number of indexed sessions
+    """
+    scans = [lambda sid=sid: scan_session(store, sid) for sid in store.list_sessions()]
+    if archive is not None:
+        scans += [lambda sid=sid: scan_archived_session(archive, sid) for sid in archive.list_sessions()]
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="ot-mentor-catalog") as executor:
+        entries = [e for e in executor.map(lambda scan: scan(), scans) if e]
+    catalog.replace_all(entries)
+    return len(entries)
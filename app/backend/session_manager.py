@@ -1,25 +1,58 @@
 """
-Session Manager for file-based persistence.
+Session Manager for session persistence.
 
 Handles saving and loading session artifacts:
-- template.json: The 18-field template
-- retrieved_scenarios.json: Retrieved scenarios metadata
-- conversation.json: Full conversation history
+- Template: The 18-field template
+- Retrieved scenarios metadata
+- Conversation: metadata + messages, saved as a snapshot plus appended journal entries
+
+Where they are stored is up to the configured SessionStore (backend.session_store):
+one directory of JSON files per session, or a single SQLite database.
+
+Saves only record pending writes in memory. With `write_behind` enabled they are
+written by the shared background flusher (backend.persistence), otherwise
+immediately.
+
+A new session is not written at all until its first conversation save
+(materialize()), so sessions that never get a message leave nothing behind.
+Resuming an archived session (backend.session_archive) restores it first.
 """
 
-import json
-import os
+import threading
+from dataclasses import dataclass
 from datetime import datetime
-from pathlib import Path
 from typing import Dict, Any, List, Optional
 from uuid import uuid4
 
 from backend.config import get_config
+from backend.persistence import get_session_flusher
+from backend.resources import get_prompt_store, get_session_archive, get_session_catalog, get_session_store
+from backend.session_catalog import template_catalog_fields
+from backend.state_snapshot import decode_state, encode_state
 from backend.tools import Template
 
 
+@dataclass
+class SessionMetadata:
+    """In-memory record of conversation metadata (disk is only read on resume)."""
+    created_at: str
+    phase_transition_at: Optional[str] = None
+    model: Optional[str] = None
+    context_summary: Optional[Dict[str, Any]] = None
+    message_count: int = 0  # Messages already on disk (snapshot + journal)
+    turn_count: int = 0  # User messages among them
+
+    def journal_fields(self) -> Dict[str, Any]:
+        """Fields written as a journal metadata entry."""
+        return {
+            "phase_transition_at": self.phase_transition_at,
+            "model": self.model,
+            "context_summary": self.context_summary
+        }
+
+
 class SessionManager:
-    """Manages session persistence to filesystem."""
+    """Manages session persistence through the configured session store."""
 
     def __init__(self, session_id: Optional[str] = None):
         """
@@ -29,69 +62,88 @@ class SessionManager:
             session_id: Optional existing session ID, or creates new one
         """
         self.session_id = session_id or str(uuid4())
-        config = get_config()
-
-        # Create session directory
-        self.session_dir = Path(config.sessions_dir) / self.session_id
-        self.session_dir.mkdir(parents=True, exist_ok=True)
-
-        # File paths
-        self.template_path = self.session_dir / "template.json"
-        self.scenarios_path = self.session_dir / "retrieved_scenarios.json"
-        self.conversation_path = self.session_dir / "conversation.json"
-
-        # Initialize empty files if new session
-        if not self.template_path.exists():
+        self.store = get_session_store()
+
+        # Conversation metadata as last written; loaded from disk on first use
+        # for resumed sessions
+        self._metadata: Optional[SessionMetadata] = None
+        self._journal_entries = 0
+
+        # Writes not yet on disk. Repeated saves of the same artifact coalesce;
+        # a pending snapshot supersedes journal entries queued before it.
+        self._lock = threading.Lock()  # Guards the pending state
+        self._flush_lock = threading.Lock()  # Serializes flushes
+        self._pending_template: Optional[Dict[str, Any]] = None
+        self._pending_scenarios: Optional[List[Dict[str, Any]]] = None
+        self._pending_snapshot: Optional[Dict[str, Any]] = None
+        self._pending_journal: List[Dict[str, Any]] = []
+        self._pending_state: Optional[Dict[str, Any]] = None
+
+        # New sessions exist only in memory until materialize(); their empty
+        # template and conversation stay pending until then
+        if session_id is not None:
+            self._flush_before_read()
+            if not self.store.session_exists(self.session_id):
+                # Archived sessions are unpacked back into the store on resume
+                get_session_archive().restore(self.store, self.session_id)
+        self.materialized = session_id is not None and self.store.session_exists(self.session_id)
+        self._created = self.materialized  # Storage prepared (store.create_session)
+        if not self.materialized:
             self._init_empty_template()
-
-        if not self.conversation_path.exists():
             self._init_empty_conversation()
 
+    def materialize(self) -> None:
+        """Start persisting the session (called on the first conversation save)."""
+        if not self.materialized:
+            self.materialized = True
+            self._schedule_flush()
+
     def _init_empty_template(self) -> None:
         """Create empty template file."""
-        empty_template = Template().to_dict()
-        with open(self.template_path, 'w', encoding='utf-8') as f:
-            json.dump(empty_template, f, indent=2, ensure_ascii=False)
+        self.save_template(Template())
 
     def _init_empty_conversation(self) -> None:
         """Create empty conversation file."""
-        conversation_data = {
-            "session_id": self.session_id,
-            "created_at": datetime.now().isoformat(),
-            "phase_transition_at": None,
-            "model": None,
-            "messages": []
-        }
-        with open(self.conversation_path, 'w', encoding='utf-8') as f:
-            json.dump(conversation_data, f, indent=2, ensure_ascii=False)
+        self._write_snapshot([], SessionMetadata(created_at=datetime.now().isoformat()))
+
+    @property
+    def metadata(self) -> SessionMetadata:
+        """Conversation metadata (read from disk once, then kept in memory)."""
+        if self._metadata is None:
+            self.load_conversation()
+        return self._metadata
 
     def save_template(self, template: Template) -> None:
         """
-        Save template to file.
+        Save template.
 
         Args:
             template: Template object to save
         """
-        with open(self.template_path, 'w', encoding='utf-8') as f:
-            json.dump(template.to_dict(), f, indent=2, ensure_ascii=False)
+        with self._lock:
+            self._pending_template = template.to_dict()
+        self._schedule_flush()
 
     def load_template(self) -> Template:
         """
-        Load template from file.
+        Load template.
 
         Returns:
             Template object
         """
         template = Template()
-        if self.template_path.exists():
-            with open(self.template_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                template.update_from_dict(data)
+        if self.materialized:
+            self._flush_before_read()
+            data = self.store.read_template(self.session_id)
+        else:
+            data = self._pending_template
+        if data is not None:
+            template.update_from_dict(data)
         return template
 
     def save_retrieved_scenarios(self, scenarios: List[Dict[str, Any]]) -> None:
         """
-        Save retrieved scenarios metadata to file.
+        Save retrieved scenarios metadata.
 
         Args:
             scenarios: List of scenario dictionaries
@@ -106,56 +158,96 @@ class SessionManager:
             for s in scenarios
         ]
 
-        with open(self.scenarios_path, 'w', encoding='utf-8') as f:
-            json.dump(metadata, f, indent=2, ensure_ascii=False)
+        with self._lock:
+            self._pending_scenarios = metadata
+        self._schedule_flush()
 
     def load_retrieved_scenarios(self) -> Optional[List[Dict[str, Any]]]:
         """
-        Load retrieved scenarios metadata from file.
+        Load retrieved scenarios metadata.
 
         Returns:
             List of scenario metadata dictionaries, or None if not yet retrieved
         """
-        if not self.scenarios_path.exists():
-            return None
-
-        with open(self.scenarios_path, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        if not self.materialized:
+            return self._pending_scenarios
+        self._flush_before_read()
+        return self.store.read_scenarios(self.session_id)
 
     def save_conversation(
         self,
         messages: List[Dict[str, str]],
         model: str,
-        phase_transition_at: Optional[str] = None
+        phase_transition_at: Optional[str] = None,
+        context_summary: Optional[Dict[str, Any]] = None
     ) -> None:
         """
-        Save conversation history to file.
+        Save conversation history.
+
+        Only messages not yet on disk are appended to the journal, plus a
+        metadata entry when the metadata changed. For stores that keep a
+        journal (files), it is compacted into the snapshot every
+        `journal_compaction_interval` entries.
 
         Args:
-            messages: List of message dictionaries with 'role' and 'content'
+            messages: Full list of message dictionaries with 'role' and 'content'
+                (or 'ref' for prompts stored with save_prompt)
             model: Model name being used
             phase_transition_at: ISO timestamp of phase transition, if occurred
+            context_summary: Rolling summary of older turns ('text', 'summarized_upto'), if any
         """
-        conversation_data = {
-            "session_id": self.session_id,
-            "created_at": self._get_created_at(),
-            "phase_transition_at": phase_transition_at,
-            "model": model,
-            "messages": messages
-        }
-
-        with open(self.conversation_path, 'w', encoding='utf-8') as f:
-            json.dump(conversation_data, f, indent=2, ensure_ascii=False)
+        self.materialize()
+        metadata = self.metadata
+        changed = (
+            (phase_transition_at, model, context_summary)
+            != (metadata.phase_transition_at, metadata.model, metadata.context_summary)
+        )
+        metadata.phase_transition_at = phase_transition_at
+        metadata.model = model
+        metadata.context_summary = context_summary
+
+        if len(messages) < metadata.message_count:
+            # History was rewritten rather than extended - replace the snapshot
+            self._write_snapshot(messages, metadata)
+            return
+
+        new_messages = messages[metadata.message_count:]
+        metadata.turn_count += sum(1 for m in new_messages if m["role"] == "user")
+        entries = [{"op": "message", **m} for m in new_messages]
+        if changed:
+            entries.append({"op": "meta", **metadata.journal_fields()})
+
+        if entries:
+            self._append_journal(entries)
+            metadata.message_count = len(messages)
+
+        if (self.store.compacts_journal
+                and self._journal_entries >= get_config().journal_compaction_interval):
+            self.compact_conversation(messages)
 
     def load_conversation(self) -> Dict[str, Any]:
         """
-        Load conversation history from file.
+        Load conversation history (snapshot plus journal) from the store.
+
+        Also refreshes the in-memory metadata record; call it on resume only.
 
         Returns:
             Conversation data dictionary
         """
-        if not self.conversation_path.exists():
+        if not self.materialized:
+            metadata = self.metadata
             return {
+                "session_id": self.session_id,
+                "created_at": metadata.created_at,
+                "phase_transition_at": metadata.phase_transition_at,
+                "model": metadata.model,
+                "messages": []
+            }
+
+        self._flush_before_read()
+        conv_data, self._journal_entries = self.store.read_conversation(self.session_id)
+        if conv_data is None:
+            conv_data = {
                 "session_id": self.session_id,
                 "created_at": datetime.now().isoformat(),
                 "phase_transition_at": None,
@@ -163,16 +255,250 @@ class SessionManager:
                 "messages": []
             }
 
-        with open(self.conversation_path, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        self._metadata = SessionMetadata(
+            created_at=conv_data.get("created_at") or datetime.now().isoformat(),
+            phase_transition_at=conv_data.get("phase_transition_at"),
+            model=conv_data.get("model"),
+            context_summary=conv_data.get("context_summary"),
+            message_count=len(conv_data["messages"]),
+            turn_count=sum(1 for m in conv_data["messages"] if m["role"] == "user")
+        )
+        return conv_data
+
+    def save_state_snapshot(self, state: Dict[str, Any]) -> None:
+        """
+        Save a state snapshot of the conversation manager for fast resume.
+
+        Call right after save_conversation/save_template, so the snapshot
+        describes the artifacts written in the same flush. Messages are not
+        part of the state; the snapshot records how many saved messages it
+        describes (its journal position) and they are read back on resume.
+
+        Args:
+            state: JSON-compatible conversation manager state (without messages)
+        """
+        state = dict(state)
+        state["message_count"] = self.metadata.message_count
+        with self._lock:
+            self._pending_state = state
+        self._schedule_flush()
+
+    def load_state_snapshot(self) -> Optional[Dict[str, Any]]:
+        """
+        Load the state snapshot and the saved messages it describes.
 
-    def _get_created_at(self) -> str:
-        """Get creation timestamp from existing conversation file."""
-        if self.conversation_path.exists():
-            with open(self.conversation_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                return data.get("created_at", datetime.now().isoformat())
-        return datetime.now().isoformat()
+        Returns:
+            Conversation manager state with 'messages' (saved message records),
+            or None if there is no usable snapshot (the caller then loads the
+            regular artifacts)
+        """
+        if not self.materialized:
+            return None
+        self._flush_before_read()
+
+        data = self.store.read_state_snapshot(self.session_id)
+        if data is None:
+            return None
+        try:
+            state = decode_state(data)
+        except Exception as e:
+            print(f"Unreadable state snapshot ({self.session_id}): {e}")
+            return None
+        if state is None or state.get("session_id") != self.session_id:
+            return None
+
+        # Messages come from the conversation snapshot and journal, which also
+        # refreshes the session metadata
+        messages = self.load_conversation()["messages"]
+        if len(messages) != state["message_count"]:
+            return None
+        state["messages"] = messages
+        return state
+
+    def compact_conversation(self, messages: Optional[List[Dict[str, str]]] = None) -> None:
+        """
+        Fold the journal into a fresh conversation snapshot.
+
+        Args:
+            messages: Full message list if already in memory (read from disk otherwise)
+        """
+        if messages is None:
+            messages = self.load_conversation()["messages"]
+        self._write_snapshot(messages, self.metadata)
+
+    def _write_snapshot(self, messages: List[Dict[str, str]], metadata: SessionMetadata) -> None:
+        """
+        Write the full conversation snapshot and clear the journal.
+
+        Args:
+            messages: Full list of message dictionaries
+            metadata: Conversation metadata to write
+        """
+        conversation_data = {
+            "session_id": self.session_id,
+            "created_at": metadata.created_at,
+            "phase_transition_at": metadata.phase_transition_at,
+            "model": metadata.model,
+            "messages": messages
+        }
+        if metadata.context_summary:
+            conversation_data["context_summary"] = metadata.context_summary
+
+        with self._lock:
+            self._pending_snapshot = conversation_data
+            self._pending_journal = []
+        self._schedule_flush()
+
+        self._journal_entries = 0
+        metadata.message_count = len(messages)
+        metadata.turn_count = sum(1 for m in messages if m["role"] == "user")
+        self._metadata = metadata
+
+    def _append_journal(self, entries: List[Dict[str, Any]]) -> None:
+        """
+        Append entries to the conversation journal.
+
+        Args:
+            entries: Journal entries ('op' is "message" or "meta")
+        """
+        with self._lock:
+            self._pending_journal.extend(entries)
+        self._journal_entries += len(entries)
+        self._schedule_flush()
+
+    def _schedule_flush(self) -> None:
+        """Hand pending writes to the background flusher, or write them now."""
+        if not self.materialized:
+            return
+        if get_config().write_behind:
+            get_session_flusher().mark_dirty(self)
+        else:
+            self.flush()
+
+    def _flush_before_read(self) -> None:
+        """Make sure reads see this session's pending writes."""
+        if get_config().write_behind:
+            get_session_flusher().flush_session(self.session_id)
+
+    def flush(self) -> None:
+        """
+        Write all pending artifacts to the store.
+
+        If a write fails, the unwritten artifacts stay pending (unless a newer
+        save replaced them) and the error is raised. Does nothing until the
+        session is materialized.
+        """
+        if not self.materialized:
+            return
+
+        with self._flush_lock:
+            if not self._created:
+                self.store.create_session(self.session_id)
+                self._created = True
+
+            with self._lock:
+                template, self._pending_template = self._pending_template, None
+                scenarios, self._pending_scenarios = self._pending_scenarios, None
+                snapshot, self._pending_snapshot = self._pending_snapshot, None
+                journal, self._pending_journal = self._pending_journal, []
+                state, self._pending_state = self._pending_state, None
+            artifacts_changed = template is not None or scenarios is not None or snapshot is not None or bool(journal)
+            if not artifacts_changed and state is None:
+                return
+            flushed_template, flushed_scenarios = template, scenarios
+
+            try:
+                if artifacts_changed:
+                    # A crash before the new state snapshot is written must
+                    # not leave an outdated one behind
+                    self.store.delete_state_snapshot(self.session_id)
+                if template is not None:
+                    self.store.write_template(self.session_id, template)
+                    template = None
+                if scenarios is not None:
+                    self.store.write_scenarios(self.session_id, scenarios)
+                    scenarios = None
+                if snapshot is not None:
+                    self.store.write_conversation(self.session_id, snapshot)
+                    snapshot = None
+                if journal:
+                    self.store.append_conversation(self.session_id, journal)
+                    journal = []
+                if state is not None:
+                    self.store.write_state_snapshot(self.session_id, encode_state(state))
+                    state = None
+            except Exception:
+                with self._lock:
+                    if self._pending_template is None:
+                        self._pending_template = template
+                    if self._pending_scenarios is None:
+                        self._pending_scenarios = scenarios
+                    if self._pending_snapshot is None:
+                        self._pending_snapshot = snapshot
+                        self._pending_journal = journal + self._pending_journal
+                    if self._pending_state is None:
+                        self._pending_state = state
+                raise
+
+            self._update_catalog(flushed_template, flushed_scenarios)
+
+    def _update_catalog(
+        self,
+        template: Optional[Dict[str, Any]],
+        scenarios: Optional[List[Dict[str, Any]]]
+    ) -> None:
+        """
+        Update this session's row in the session catalog after a flush.
+
+        Catalog errors are logged, not raised: the catalog can always be
+        rebuilt from the session store.
+
+        Args:
+            template: Template dictionary just written, if any
+            scenarios: Scenario metadata just written, if any
+        """
+        fields: Dict[str, Any] = {}
+        # Not self.metadata: loading it here would re-enter flush()
+        metadata = self._metadata
+        if metadata is not None:
+            fields.update(
+                created_at=metadata.created_at,
+                phase_transition_at=metadata.phase_transition_at,
+                turn_count=metadata.turn_count
+            )
+        if template is not None:
+            fields.update(template_catalog_fields(template))
+        if scenarios is not None:
+            fields["scenario_ids"] = [s["id"] for s in scenarios]
+
+        try:
+            get_session_catalog().update(self.session_id, fields)
+        except Exception as e:
+            print(f"Session catalog update error ({self.session_id}): {e}")
+
+    def save_prompt(self, content: str) -> Dict[str, Any]:
+        """
+        Store a system prompt in the shared prompt store.
+
+        Args:
+            content: Prompt text
+
+        Returns:
+            Reference to save in place of the message content
+        """
+        return get_prompt_store().put(content)
+
+    def load_prompt(self, ref: Dict[str, Any]) -> str:
+        """
+        Resolve a saved prompt reference.
+
+        Args:
+            ref: Reference returned by save_prompt
+
+        Returns:
+            Prompt text
+        """
+        return get_prompt_store().get(ref)
 
     def get_phase_transition_timestamp(self) -> Optional[str]:
         """
@@ -181,13 +507,10 @@ class SessionManager:
         Returns:
             ISO format timestamp string, or None if not yet transitioned
         """
-        conv_data = self.load_conversation()
-        return conv_data.get("phase_transition_at")
+        return self.metadata.phase_transition_at
 
     def mark_phase_transition(self) -> None:
         """Mark the current time as phase transition timestamp."""
-        conv_data = self.load_conversation()
-        conv_data["phase_transition_at"] = datetime.now().isoformat()
-
-        with open(self.conversation_path, 'w', encoding='utf-8') as f:
-            json.dump(conv_data, f, indent=2, ensure_ascii=False)
+        metadata = self.metadata
+        metadata.phase_transition_at = datetime.now().isoformat()
+        self._append_journal([{"op": "meta", "phase_transition_at": metadata.phase_transition_at}])
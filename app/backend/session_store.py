@@ -0,0 +1,570 @@
+"""
+Storage backends for session artifacts.
+
+SessionManager keeps the per-session logic (metadata, journal bookkeeping,
+write-behind) and delegates the actual reads and writes to a SessionStore:
+
+- FileSessionStore: one directory per session under `sessions_dir` holding
+  template.json, retrieved_scenarios.json, conversation.json (snapshot) and
+  conversation.jsonl (append-only journal)
+- SQLiteSessionStore: a single SQLite database (WAL mode) with sessions,
+  messages, templates and retrieved_scenarios tables
+
+Both also hold the shared prompt blobs that saved system messages reference
+(backend.prompt_store) and each session's state snapshot for fast resume
+(backend.state_snapshot).
+
+The active backend is selected with `AppConfig.session_backend` and shared
+process-wide (backend.resources.get_session_store).
+"""
+
+import json
+import shutil
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+from uuid import uuid4
+
+from backend.persistence import append_jsonl, atomic_write_bytes, atomic_write_json, atomic_write_text
+
+
+# Conversation metadata columns (everything in conversation.json except messages)
+CONVERSATION_FIELDS = ["created_at", "phase_transition_at", "model", "context_summary"]
+
+
+class SessionStore(ABC):
+    """Interface of a session storage backend."""
+
+    # Whether appended entries accumulate in a journal that SessionManager
+    # should periodically fold into a fresh snapshot
+    compacts_journal = False
+
+    @abstractmethod
+    def create_session(self, session_id: str) -> None:
+        """Prepare storage for a new session (no-op if it already exists)."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def session_exists(self, session_id: str) -> bool:
+        """Check whether any artifact of the session has been stored."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def list_sessions(self) -> List[str]:
+        """List the IDs of all stored sessions."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def delete_sessions(self, session_ids: List[str]) -> None:
+        """Delete sessions and all their artifacts (shared prompt blobs are kept)."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def session_updated_at(self, session_id: str) -> Optional[float]:
+        """Time of the session's last write (epoch seconds), or None if unknown."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def read_template(self, session_id: str) -> Optional[Dict[str, Any]]:
+        """Read the template dictionary, or None if not saved yet."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def write_template(self, session_id: str, template: Dict[str, Any]) -> None:
+        """Replace the template dictionary."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def read_scenarios(self, session_id: str) -> Optional[List[Dict[str, Any]]]:
+        """Read retrieved scenario metadata, or None if not retrieved yet."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def write_scenarios(self, session_id: str, scenarios: List[Dict[str, Any]]) -> None:
+        """Replace retrieved scenario metadata (id, title, similarity_score)."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def read_conversation(self, session_id: str) -> Tuple[Optional[Dict[str, Any]], int]:
+        """
+        Read the conversation (metadata plus messages).
+
+        Returns:
+            Tuple of (conversation dictionary or None, journal entries replayed)
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def write_conversation(self, session_id: str, conversation: Dict[str, Any]) -> None:
+        """Replace the whole conversation (metadata plus messages)."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def append_conversation(self, session_id: str, entries: List[Dict[str, Any]]) -> None:
+        """
+        Append journal entries to the conversation.
+
+        Entries have 'op' "message" (with 'role' and 'content', or 'ref' for
+        a stored prompt) or "meta" (with the changed metadata fields).
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def read_state_snapshot(self, session_id: str) -> Optional[bytes]:
+        """Read the session's state snapshot, or None if there is none."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def write_state_snapshot(self, session_id: str, data: bytes) -> None:
+        """Replace the session's state snapshot."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def delete_state_snapshot(self, session_id: str) -> None:
+        """Drop the session's state snapshot (no-op if there is none)."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def read_blob(self, digest: str) -> Optional[str]:
+        """Read a shared prompt blob by content hash, or None if missing."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def write_blob(self, digest: str, content: str) -> None:
+        """Store a shared prompt blob under its content hash (no-op if present)."""
+        raise NotImplementedError
+
+
+class FileSessionStore(SessionStore):
+    """
+    One directory of JSON files per session.
+
+    Each journal starts with a header entry carrying a random journal ID.
+    Compaction records the ID of the journal it folded in the snapshot
+    ('folded_journal') before deleting the journal, so a journal left behind
+    by a crash between the two steps is recognized and not replayed twice.
+    """
+
+    compacts_journal = True
+
+    def __init__(self, sessions_dir: str, blobs_dir: str):
+        """
+        Args:
+            sessions_dir: Directory holding one subdirectory per session
+            blobs_dir: Directory holding shared prompt blobs
+        """
+        self.sessions_dir = Path(sessions_dir)
+        self.blobs_dir = Path(blobs_dir)
+
+    def session_dir(self, session_id: str) -> Path:
+        """Directory of one session."""
+        return self.sessions_dir / session_id
+
+    def create_session(self, session_id: str) -> None:
+        self.session_dir(session_id).mkdir(parents=True, exist_ok=True)
+
+    def session_exists(self, session_id: str) -> bool:
+        session_dir = self.session_dir(session_id)
+        return (session_dir / "conversation.json").exists() or (session_dir / "template.json").exists()
+
+    def list_sessions(self) -> List[str]:
+        if not self.sessions_dir.exists():
+            return []
+        return sorted(p.name for p in self.sessions_dir.iterdir() if p.is_dir())
+
+    def delete_sessions(self, session_ids: List[str]) -> None:
+        for session_id in session_ids:
+            shutil.rmtree(self.session_dir(session_id), ignore_errors=True)
+
+    def session_updated_at(self, session_id: str) -> Optional[float]:
+        session_dir = self.session_dir(session_id)
+        mtimes = [p.stat().st_mtime for p in session_dir.glob("*") if p.is_file()]
+        if mtimes:
+            return max(mtimes)
+        # A session directory without files yet
+        return session_dir.stat().st_mtime if session_dir.is_dir() else None
+
+    def _read_json(self, path: Path) -> Optional[Any]:
+        if not path.exists():
+            return None
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    def read_template(self, session_id: str) -> Optional[Dict[str, Any]]:
+        return self._read_json(self.session_dir(session_id) / "template.json")
+
+    def write_template(self, session_id: str, template: Dict[str, Any]) -> None:
+        atomic_write_json(self.session_dir(session_id) / "template.json", template)
+
+    def read_scenarios(self, session_id: str) -> Optional[List[Dict[str, Any]]]:
+        return self._read_json(self.session_dir(session_id) / "retrieved_scenarios.json")
+
+    def write_scenarios(self, session_id: str, scenarios: List[Dict[str, Any]]) -> None:
+        atomic_write_json(self.session_dir(session_id) / "retrieved_scenarios.json", scenarios)
+
+    def read_conversation(self, session_id: str) -> Tuple[Optional[Dict[str, Any]], int]:
+        conv_data = self._read_json(self.session_dir(session_id) / "conversation.json")
+        journal_id, journal = self._read_journal(session_id)
+        folded_journal = conv_data.pop("folded_journal", None) if conv_data is not None else None
+        if journal_id is not None and journal_id == folded_journal:
+            # Already in the snapshot: compaction crashed before deleting it
+            (self.session_dir(session_id) / "conversation.jsonl").unlink(missing_ok=True)
+            journal = []
+        if conv_data is None:
+            if not journal:
+                return None, 0
+            conv_data = {"session_id": session_id, "messages": []}
+
+        for entry in journal:
+            if entry["op"] == "message":
+                conv_data["messages"].append({key: value for key, value in entry.items() if key != "op"})
+            elif entry["op"] == "meta":
+                for key, value in entry.items():
+                    if key != "op":
+                        conv_data[key] = value
+        return conv_data, len(journal)
+
+    def write_conversation(self, session_id: str, conversation: Dict[str, Any]) -> None:
+        session_dir = self.session_dir(session_id)
+        journal_path = session_dir / "conversation.jsonl"
+        journal_id = self._read_journal_id(journal_path)
+        if journal_id is not None:
+            conversation = {**conversation, "folded_journal": journal_id}
+        atomic_write_json(session_dir / "conversation.json", conversation)
+        if journal_path.exists():
+            journal_path.unlink()
+
+    def append_conversation(self, session_id: str, entries: List[Dict[str, Any]]) -> None:
+        append_jsonl(
+            self.session_dir(session_id) / "conversation.jsonl",
+            entries,
+            header={"op": "journal", "id": uuid4().hex}
+        )
+
+    def read_state_snapshot(self, session_id: str) -> Optional[bytes]:
+        snapshot_path = self.session_dir(session_id) / "state.snapshot"
+        if not snapshot_path.exists():
+            return None
+        return snapshot_path.read_bytes()
+
+    def write_state_snapshot(self, session_id: str, data: bytes) -> None:
+        atomic_write_bytes(self.session_dir(session_id) / "state.snapshot", data)
+
+    def delete_state_snapshot(self, session_id: str) -> None:
+        snapshot_path = self.session_dir(session_id) / "state.snapshot"
+        if snapshot_path.exists():
+            snapshot_path.unlink()
+
+    def read_blob(self, digest: str) -> Optional[str]:
+        blob_path = self.blobs_dir / f"{digest}.txt"
+        if not blob_path.exists():
+            return None
+        return blob_path.read_text(encoding='utf-8')
+
+    def write_blob(self, digest: str, content: str) -> None:
+        blob_path = self.blobs_dir / f"{digest}.txt"
+        if not blob_path.exists():
+            self.blobs_dir.mkdir(parents=True, exist_ok=True)
+            atomic_write_text(blob_path, content)
+
+    @staticmethod
+    def _read_journal_id(journal_path: Path) -> Optional[str]:
+        """ID from a journal's header entry (None if missing or unreadable)."""
+        if not journal_path.exists():
+            return None
+        with open(journal_path, 'rb') as f:
+            first_line = f.readline()
+        try:
+            header = json.loads(first_line)
+        except ValueError:
+            return None
+        return header.get("id") if header.get("op") == "journal" else None
+
+    def _read_journal(self, session_id: str) -> Tuple[Optional[str], List[Dict[str, Any]]]:
+        """
+        Read the conversation journal.
+
+        An undecodable line (a partial write from a crash) is skipped and
+        reading continues with the entries after it.
+
+        Returns:
+            Tuple of (journal ID from the header entry, or None for journals
+            written without one; journal entries, oldest first)
+        """
+        journal_path = self.session_dir(session_id) / "conversation.jsonl"
+        if not journal_path.exists():
+            return None, []
+
+        entries = []
+        with open(journal_path, 'rb') as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                try:
+                    entries.append(json.loads(line))
+                except ValueError:  # JSONDecodeError, or UnicodeDecodeError from a cut-off character
+                    print(f"Skipping unreadable journal line ({session_id})")
+
+        if entries and entries[0].get("op") == "journal":
+            return entries[0]["id"], entries[1:]
+        return None, entries
+
+
+class SQLiteSessionStore(SessionStore):
+    """All sessions in one SQLite database (WAL mode)."""
+
+    def __init__(self, path: str):
+        """
+        Open (or create) the session database.
+
+        Args:
+            path: SQLite file path
+        """
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("PRAGMA foreign_keys=ON")
+        self._conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS sessions (
+                session_id TEXT PRIMARY KEY,
+                created_at TEXT,
+                updated_at REAL NOT NULL,
+                phase_transition_at TEXT,
+                model TEXT,
+                context_summary TEXT
+            );
+            CREATE INDEX IF NOT EXISTS idx_sessions_created_at ON sessions(created_at);
+            CREATE INDEX IF NOT EXISTS idx_sessions_updated_at ON sessions(updated_at);
+
+            CREATE TABLE IF NOT EXISTS messages (
+                session_id TEXT NOT NULL REFERENCES sessions(session_id) ON DELETE CASCADE,
+                seq INTEGER NOT NULL,
+                role TEXT NOT NULL,
+                content TEXT NOT NULL,
+                ref TEXT,
+                created_at REAL NOT NULL,
+                PRIMARY KEY (session_id, seq)
+            );
+            CREATE INDEX IF NOT EXISTS idx_messages_created_at ON messages(session_id, created_at);
+
+            CREATE TABLE IF NOT EXISTS templates (
+                session_id TEXT PRIMARY KEY REFERENCES sessions(session_id) ON DELETE CASCADE,
+                data TEXT NOT NULL,
+                updated_at REAL NOT NULL
+            );
+
+            CREATE TABLE IF NOT EXISTS retrieved_scenarios (
+                session_id TEXT NOT NULL REFERENCES sessions(session_id) ON DELETE CASCADE,
+                rank INTEGER NOT NULL,
+                scenario_id TEXT NOT NULL,
+                title TEXT,
+                similarity_score REAL,
+                retrieved_at REAL NOT NULL,
+                PRIMARY KEY (session_id, rank)
+            );
+
+            CREATE TABLE IF NOT EXISTS state_snapshots (
+                session_id TEXT PRIMARY KEY REFERENCES sessions(session_id) ON DELETE CASCADE,
+                data BLOB NOT NULL,
+                updated_at REAL NOT NULL
+            );
+
+            CREATE TABLE IF NOT EXISTS blobs (
+                hash TEXT PRIMARY KEY,
+                content TEXT NOT NULL
+            );
+            """
+        )
+        # Databases created before prompt references were stored
+        columns = [row[1] for row in self._conn.execute("PRAGMA table_info(messages)")]
+        if "ref" not in columns:
+            self._conn.execute("ALTER TABLE messages ADD COLUMN ref TEXT")
+        self._conn.commit()
+
+    def _ensure_session(self, session_id: str) -> None:
+        """Insert the sessions row if missing and bump updated_at (caller holds the lock)."""
+        self._conn.execute(
+            "INSERT INTO sessions (session_id, updated_at) VALUES (?, ?) "
+            "ON CONFLICT(session_id) DO UPDATE SET updated_at = excluded.updated_at",
+            (session_id, time.time())
+        )
+
+    def create_session(self, session_id: str) -> None:
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR IGNORE INTO sessions (session_id, updated_at) VALUES (?, ?)",
+                (session_id, time.time())
+            )
+
+    def session_exists(self, session_id: str) -> bool:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT 1 FROM sessions WHERE session_id = ? AND "
+                "(created_at IS NOT NULL OR EXISTS (SELECT 1 FROM templates t WHERE t.session_id = ?))",
+                (session_id, session_id)
+            ).fetchone()
+        return row is not None
+
+    def list_sessions(self) -> List[str]:
+        with self._lock:
+            rows = self._conn.execute("SELECT session_id FROM sessions ORDER BY session_id").fetchall()
+        return [row[0] for row in rows]
+
+    def delete_sessions(self, session_ids: List[str]) -> None:
+        # Messages, templates and retrieved scenarios cascade
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "DELETE FROM sessions WHERE session_id = ?", [(session_id,) for session_id in session_ids]
+            )
+
+    def session_updated_at(self, session_id: str) -> Optional[float]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT updated_at FROM sessions WHERE session_id = ?", (session_id,)
+            ).fetchone()
+        return row[0] if row else None
+
+    def read_template(self, session_id: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT data FROM templates WHERE session_id = ?", (session_id,)
+            ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def write_template(self, session_id: str, template: Dict[str, Any]) -> None:
+        with self._lock, self._conn:
+            self._ensure_session(session_id)
+            self._conn.execute(
+                "INSERT OR REPLACE INTO templates (session_id, data, updated_at) VALUES (?, ?, ?)",
+                (session_id, json.dumps(template, ensure_ascii=False), time.time())
+            )
+
+    def read_scenarios(self, session_id: str) -> Optional[List[Dict[str, Any]]]:
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT scenario_id, title, similarity_score FROM retrieved_scenarios "
+                "WHERE session_id = ? ORDER BY rank",
+                (session_id,)
+            ).fetchall()
+        if not rows:
+            return None
+        return [{"id": row[0], "title": row[1], "similarity_score": row[2]} for row in rows]
+
+    def write_scenarios(self, session_id: str, scenarios: List[Dict[str, Any]]) -> None:
+        now = time.time()
+        with self._lock, self._conn:
+            self._ensure_session(session_id)
+            self._conn.execute("DELETE FROM retrieved_scenarios WHERE session_id = ?", (session_id,))
+            self._conn.executemany(
+                "INSERT INTO retrieved_scenarios "
+                "(session_id, rank, scenario_id, title, similarity_score, retrieved_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                [(session_id, rank, s["id"], s["title"], s["similarity_score"], now)
+                 for rank, s in enumerate(scenarios)]
+            )
+
+    def read_conversation(self, session_id: str) -> Tuple[Optional[Dict[str, Any]], int]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT created_at, phase_transition_at, model, context_summary "
+                "FROM sessions WHERE session_id = ?",
+                (session_id,)
+            ).fetchone()
+            if row is None or row[0] is None:
+                return None, 0
+            messages = self._conn.execute(
+                "SELECT role, content, ref FROM messages WHERE session_id = ? ORDER BY seq",
+                (session_id,)
+            ).fetchall()
+
+        conv_data = {
+            "session_id": session_id,
+            "created_at": row[0],
+            "phase_transition_at": row[1],
+            "model": row[2],
+            "messages": [
+                {"role": role, "ref": json.loads(ref)} if ref else {"role": role, "content": content}
+                for role, content, ref in messages
+            ]
+        }
+        if row[3]:
+            conv_data["context_summary"] = json.loads(row[3])
+        return conv_data, 0
+
+    def _update_metadata(self, session_id: str, fields: Dict[str, Any]) -> None:
+        """Update conversation metadata columns (caller holds the lock)."""
+        fields = {key: value for key, value in fields.items() if key in CONVERSATION_FIELDS}
+        if "context_summary" in fields and fields["context_summary"] is not None:
+            fields["context_summary"] = json.dumps(fields["context_summary"], ensure_ascii=False)
+        if fields:
+            assignments = ", ".join(f"{key} = ?" for key in fields)
+            self._conn.execute(
+                f"UPDATE sessions SET {assignments} WHERE session_id = ?",
+                (*fields.values(), session_id)
+            )
+
+    def _insert_messages(self, session_id: str, start: int, messages: List[Dict[str, Any]]) -> None:
+        """Insert messages from sequence number `start` on (caller holds the lock)."""
+        now = time.time()
+        self._conn.executemany(
+            "INSERT INTO messages (session_id, seq, role, content, ref, created_at) VALUES (?, ?, ?, ?, ?, ?)",
+            [(session_id, start + i, m["role"], m.get("content", ""),
+              json.dumps(m["ref"]) if "ref" in m else None, now)
+             for i, m in enumerate(messages)]
+        )
+
+    def write_conversation(self, session_id: str, conversation: Dict[str, Any]) -> None:
+        with self._lock, self._conn:
+            self._ensure_session(session_id)
+            self._update_metadata(session_id, {
+                key: conversation.get(key) for key in CONVERSATION_FIELDS
+            })
+            self._conn.execute("DELETE FROM messages WHERE session_id = ?", (session_id,))
+            self._insert_messages(session_id, 0, conversation["messages"])
+
+    def append_conversation(self, session_id: str, entries: List[Dict[str, Any]]) -> None:
+        with self._lock, self._conn:
+            self._ensure_session(session_id)
+            next_seq = self._conn.execute(
+                "SELECT COALESCE(MAX(seq) + 1, 0) FROM messages WHERE session_id = ?", (session_id,)
+            ).fetchone()[0]
+            messages = [entry for entry in entries if entry["op"] == "message"]
+            self._insert_messages(session_id, next_seq, messages)
+            for entry in entries:
+                if entry["op"] == "meta":
+                    self._update_metadata(session_id, entry)
+
+    def read_state_snapshot(self, session_id: str) -> Optional[bytes]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT data FROM state_snapshots WHERE session_id = ?", (session_id,)
+            ).fetchone()
+        return bytes(row[0]) if row else None
+
+    def write_state_snapshot(self, session_id: str, data: bytes) -> None:
+        with self._lock, self._conn:
+            self._ensure_session(session_id)
+            self._conn.execute(
+                "INSERT OR REPLACE INTO state_snapshots (session_id, data, updated_at) VALUES (?, ?, ?)",
+                (session_id, sqlite3.Binary(data), time.time())
+            )
+
+    def delete_state_snapshot(self, session_id: str) -> None:
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM state_snapshots WHERE session_id = ?", (session_id,))
+
+    def read_blob(self, digest: str) -> Optional[str]:
+        with self._lock:
+            row = self._conn.execute("SELECT content FROM blobs WHERE hash = ?", (digest,)).fetchone()
+        return row[0] if row else None
+
+    def write_blob(self, digest: str, content: str) -> None:
+        with self._lock, self._conn:
+            self._conn.execute("INSERT OR IGNORE INTO blobs (hash, content) VALUES (?, ?)", (digest, content))
@@ -0,0 +1,155 @@
+"""
+Conversation state snapshots for fast resume.
+
+A state snapshot is the ConversationManager bookkeeping (phase, template,
+retrieved scenarios, extraction and summary cursors) in one compact,
+versioned blob, so a resume reads it and the conversation instead of every
+session artifact. Messages are not part of it: they are already on disk in
+the conversation snapshot and journal, and rewriting them on every flush would
+make each save grow with the conversation. The snapshot records how many
+messages it describes (its journal position) instead, and the messages are
+rebuilt from the conversation on resume.
+
+Snapshots are a cache next to the regular session artifacts: they are written
+by the same flush, dropped before the artifacts they describe change, and
+ignored when missing, outdated, unreadable or at another journal position.
+
+Encoded with msgpack when it is installed, JSON otherwise. Restored messages
+are kept as saved records and only turned into LangChain messages when
+accessed (LazyMessages), so old turns of a long session are never
+materialized unless something reads them.
+"""
+
+import json
+from collections.abc import MutableSequence
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+try:
+    import msgpack
+except ImportError:  # Optional dependency; JSON is used instead
+    msgpack = None
+
+# Snapshot layout: MAGIC + format version byte + codec byte + payload
+MAGIC = b"OTMS"
+SNAPSHOT_FORMAT_VERSION = 2  # 2: no messages, rebuilt from the conversation
+CODEC_MSGPACK = b"m"
+CODEC_JSON = b"j"
+
+
+def encode_state(state: Dict[str, Any]) -> bytes:
+    """
+    Encode a state dictionary as a snapshot blob.
+
+    Args:
+        state: JSON-compatible state dictionary
+
+    Returns:
+        Snapshot bytes
+    """
+    header = MAGIC + bytes([SNAPSHOT_FORMAT_VERSION])
+    if msgpack is not None:
+        return header + CODEC_MSGPACK + msgpack.packb(state, use_bin_type=True)
+    return header + CODEC_JSON + json.dumps(state, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def decode_state(data: bytes) -> Optional[Dict[str, Any]]:
+    """
+    Decode a snapshot blob.
+
+    Args:
+        data: Snapshot bytes
+
+    Returns:
+        State dictionary, or None if the blob has another format version or
+        needs a codec that is not installed
+    """
+    header_size = len(MAGIC) + 2
+    if len(data) < header_size or not data.startswith(MAGIC) or data[len(MAGIC)] != SNAPSHOT_FORMAT_VERSION:
+        return None
+
+    codec = data[len(MAGIC) + 1:header_size]
+    payload = data[header_size:]
+    if codec == CODEC_MSGPACK:
+        if msgpack is None:
+            return None
+        return msgpack.unpackb(payload, raw=False)
+    if codec == CODEC_JSON:
+        return json.loads(payload.decode("utf-8"))
+    return None
+
+
+class LazyMessages(MutableSequence):
+    """
+    Message list that stores saved records and materializes messages on access.
+
+    Items are either saved message records (dicts with 'role' and 'content'
+    or 'ref') or LangChain messages. A record is converted the first time its
+    index is read and replaced by the message.
+    """
+
+    def __init__(self, items: Iterable[Any] = (), materialize: Optional[Callable[[Dict[str, Any]], Any]] = None):
+        """
+        Args:
+            items: Saved records and/or messages
+            materialize: Converts a saved record into a message
+        """
+        self._items: List[Any] = list(items)
+        self._materialize = materialize
+
+    def _get(self, index: int) -> Any:
+        item = self._items[index]
+        if isinstance(item, dict):
+            item = self._materialize(item)
+            self._items[index] = item
+        return item
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._get(i) for i in range(*index.indices(len(self._items)))]
+        return self._get(index)
+
+    def __setitem__(self, index, value) -> None:
+        self._items[index] = value
+
+    def __delitem__(self, index) -> None:
+        del self._items[index]
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __iter__(self):
+        for i in range(len(self._items)):
+            yield self._get(i)
+
+    def insert(self, index: int, value: Any) -> None:
+        self._items.insert(index, value)
+
+    def role(self, index: int, message_role: Callable[[Any], str]) -> str:
+        """
+        Get a message's role without materializing it.
+
+        Args:
+            index: Message index
+            message_role: Role of an already materialized message
+
+        Returns:
+            "system", "user" or "assistant"
+        """
+        item = self._items[index]
+        return item["role"] if isinstance(item, dict) else message_role(item)
+
+    def to_records(self, to_record: Callable[[Any], Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Get all messages as saved records, without materializing any.
+
+        Args:
+            to_record: Converts a materialized message into a record
+
+        Returns:
+            List of message records
+        """
+        return [item if isinstance(item, dict) else to_record(item) for item in self._items]
+
+    def materialized_count(self) -> int:
+        """Number of messages materialized so far."""
+        return sum(1 for item in self._items if not isinstance(item, dict))
@@ -4,7 +4,8 @@ Tools and template management for the OT Mentor AI.
 Implements the 18-field template, Template Filler tool, and Context Evaluator.
 """
 
-from typing import Dict, Any, Optional
+import re
+from typing import Dict, Any, List, Optional
 from dataclasses import dataclass, field
 
 
@@ -193,3 +194,257 @@ def generate_conversation_summary(template: Template) -> str:
         parts.append(f"Related behaviors: {template.related_behaviors}")
 
     return "\n".join(parts)
+
+
+# Local fast-path extraction (runs before the LLM extraction call)
+
+# Single-letter Hebrew prefixes (ו, ה, ב, ל, מ, ש, כ) attached to words
+_HE_PREFIX = "[והבלמשכ]?"
+
+# Only phrasing tied to the patient counts: "5 years of experience" or
+# "I've known him for 2 years" are not ages, and neither is "בגיל 5" (onset)
+AGE_PATTERNS = [
+    re.compile(r"\b(\d{1,3})(?:[\s-]*(?:years?|yrs?)[\s-]*old|\s*y/o)\b", re.IGNORECASE),
+    re.compile(
+        r"\b(?:(?:he|she|the (?:child|patient|client|boy|girl|kid))\s+is|he's|she's)\s+(\d{1,3})\b"
+        r"(?!\s*(?:%|percent|months?|weeks?|days?|hours?|times?|sessions?|years?))",
+        re.IGNORECASE
+    ),
+    re.compile(r"\baged\s+(\d{1,3})\b", re.IGNORECASE),
+    re.compile(r"(?:^|\s)(?:בן|בת)\s*(\d{1,3})\b"),
+]
+
+# Questions about age that make a bare number answer unambiguous
+AGE_QUESTION_PATTERN = re.compile(r"\bage\b|\bhow old\b|גיל|בן כמה|בת כמה", re.IGNORECASE)
+BARE_NUMBER_PATTERN = re.compile(r"^\s*(\d{1,3})\s*[.!]?\s*$")
+
+GENDER_PATTERNS = {
+    "Male": re.compile(
+        r"\b(?:boy|man|male|son|gentleman)\b|"
+        rf"\b{_HE_PREFIX}(?:ילד|נער|גבר|זכר|בנה|בנו)\b|(?:^|\s)בן\s*\d",
+        re.IGNORECASE
+    ),
+    "Female": re.compile(
+        r"\b(?:girl|woman|female|daughter|lady)\b|"
+        rf"\b{_HE_PREFIX}(?:ילדה|נערה|אישה|נקבה|בתה|בתו)\b|(?:^|\s)בת\s*\d",
+        re.IGNORECASE
+    ),
+}
+
+TREATMENT_TYPE_PATTERNS = {
+    "Hybrid": re.compile(r"\bhybrid\b|היברידי", re.IGNORECASE),
+    "Online": re.compile(
+        r"\b(?:online|zoom|video call|remote(?:ly)?|tele-?health)\b|"
+        rf"\b{_HE_PREFIX}(?:אונליין|זום|מרחוק)\b",
+        re.IGNORECASE
+    ),
+    "Face-to-face": re.compile(
+        r"\b(?:face[\s-]to[\s-]face|in[\s-]person)\b|פנים אל פנים|פרונטלי",
+        re.IGNORECASE
+    ),
+}
+
+TREATMENT_SETTING_PATTERNS = {
+    "Hospital": re.compile(r"\bhospital\b|בית (?:ה)?חולים", re.IGNORECASE),
+    # A bare "school" is too common ("he goes to school") to name the setting
+    "School": re.compile(
+        r"\bschool[\s-](?:based|setting|ot|occupational therap\w*)\b|"
+        r"(?:במסגרת|מסגרת) (?:בית )?(?:ה)?ספר|(?:טיפול|ריפוי בעיסוק) בבית (?:ה)?ספר",
+        re.IGNORECASE
+    ),
+    # "מרפאה בעיסוק" is the therapist's title (occupational therapist), not a clinic
+    "Clinic": re.compile(rf"\bclinic\b|\b{_HE_PREFIX}(?:קליניקה|מרפאה)\b(?!\s*בעיסוק)", re.IGNORECASE),
+    "Home": re.compile(
+        r"\b(?:at home|home visits?|home-based)\b|\bבבית\b(?!\s*ה?(?:ספר|חולים))|ביקורי בית",
+        re.IGNORECASE
+    ),
+    "Community": re.compile(r"\bcommunity\b|\bבקהילה\b", re.IGNORECASE),
+}
+
+# Words that signal the user is correcting earlier information
+CORRECTION_PATTERN = re.compile(
+    r"\b(?:actually|correction|i meant|sorry|mistake|not\s+\w+\s+but)\b|"
+    r"בעצם|טעיתי|תיקון|התכוונתי|סליחה",
+    re.IGNORECASE
+)
+
+# Words that carry no case facts (acknowledgements, "I don't know", function words)
+STOPWORDS = {
+    # English
+    "yes", "no", "ok", "okay", "sure", "right", "thanks", "thank", "you", "i", "me", "my",
+    "don't", "dont", "know", "not", "maybe", "idk", "the", "a", "an", "and", "or",
+    "is", "are", "was", "were", "he", "she", "it", "they", "his", "her", "their", "him",
+    "has", "have", "had", "of", "in", "on", "at", "to", "for", "with", "that", "this",
+    "so", "well", "also", "just", "very", "about", "be", "been", "do", "does", "did",
+    # Hebrew
+    "כן", "לא", "אוקיי", "בסדר", "תודה", "נכון", "יודע", "יודעת", "אין", "לי", "מושג",
+    "אני", "הוא", "היא", "הם", "הן", "של", "את", "עם", "על", "זה", "זאת", "גם", "רק",
+    "מאוד", "יש", "היה", "הייתה", "אבל", "אולי", "כל", "מה", "אז", "שלו", "שלה",
+}
+
+_TOKEN_PATTERN = re.compile(r"[\w']+", re.UNICODE)
+
+
+@dataclass
+class FastPathResult:
+    """Outcome of the local pre-extraction stage for one user message."""
+    fields: Dict[str, str]  # Fields filled directly from patterns
+    novelty: float  # Share of content tokens not seen earlier in the conversation
+    call_llm: bool  # Whether the LLM extraction call is still needed
+    reason: str  # Short explanation of the decision
+
+
+@dataclass
+class FastPathStats:
+    """Running counters for the local fast-path extractor."""
+    turns: int = 0
+    skipped: int = 0  # Turns where the LLM extraction call was skipped
+    pattern_hits: int = 0  # Turns where patterns filled at least one field
+    fields_filled: int = 0  # Fields filled directly by patterns
+
+    def record(self, result: FastPathResult) -> None:
+        """Record the outcome of one fast-path decision."""
+        self.turns += 1
+        if not result.call_llm:
+            self.skipped += 1
+        if result.fields:
+            self.pattern_hits += 1
+            self.fields_filled += len(result.fields)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert counters and derived rates to a dictionary."""
+        return {
+            "turns": self.turns,
+            "skipped": self.skipped,
+            "llm_calls": self.turns - self.skipped,
+            "pattern_hits": self.pattern_hits,
+            "fields_filled": self.fields_filled,
+            "skip_rate": self.skipped / self.turns if self.turns else 0.0,
+            "hit_rate": self.pattern_hits / self.turns if self.turns else 0.0,
+        }
+
+
+def _normalize_token(token: str) -> str:
+    """Lowercase a token and strip a single Hebrew prefix letter."""
+    token = token.lower()
+    if len(token) > 3 and token[0] in "והבלמשכ" and "\u0590" <= token[1] <= "\u05ff":
+        return token[1:]
+    return token
+
+
+def _content_tokens(text: str) -> List[str]:
+    """Split text into normalized tokens that may carry case facts."""
+    tokens = [_normalize_token(t) for t in _TOKEN_PATTERN.findall(text)]
+    return [t for t in tokens if t not in STOPWORDS and not t.isdigit()]
+
+
+def _first_match(patterns: Dict[str, "re.Pattern"], text: str) -> Optional[str]:
+    """Return the label of the single pattern that matches, or None if zero or several match."""
+    labels = [label for label, pattern in patterns.items() if pattern.search(text)]
+    return labels[0] if len(labels) == 1 else None
+
+
+def fast_path_extract(
+    message: str,
+    template: Template,
+    previous_user_texts: List[str],
+    last_question: Optional[str] = None,
+    novelty_threshold: float = 0.2
+) -> FastPathResult:
+    """
+    Local pre-extraction: fill obvious fields and decide whether the LLM extraction is needed.
+
+    Hebrew- and English-aware patterns recognize patient age, gender, treatment type
+    and treatment setting. They only fill fields that are still empty. The rest of the
+    message is scored for novelty against the user's earlier messages (the assistant's
+    questions are not facts the template already holds); the LLM is called only if
+    the message looks like it carries new or corrected facts.
+
+    Args:
+        message: The new user message
+        template: The current template state (not modified)
+        previous_user_texts: Earlier user message texts, oldest first
+        last_question: The assistant message this one answers, if any
+        novelty_threshold: Minimum novelty score that triggers the LLM call
+
+    Returns:
+        FastPathResult with the locally filled fields and the decision
+    """
+    fields: Dict[str, str] = {}
+    remainder = message
+
+    # Patient age: explicit phrasing, or a bare number answering an age question
+    for pattern in AGE_PATTERNS:
+        match = pattern.search(remainder)
+        if match:
+            fields["patient_age"] = match.group(1)
+            remainder = remainder[:match.start()] + " " + remainder[match.end():]
+            break
+    else:
+        match = BARE_NUMBER_PATTERN.match(message)
+        if match and last_question and AGE_QUESTION_PATTERN.search(last_question):
+            fields["patient_age"] = match.group(1)
+            remainder = ""
+
+    gender = _first_match(GENDER_PATTERNS, message)
+    if gender:
+        fields["patient_gender"] = gender
+
+    treatment_type = _first_match(TREATMENT_TYPE_PATTERNS, message)
+    if treatment_type is None and all(
+        TREATMENT_TYPE_PATTERNS[label].search(message) for label in ("Online", "Face-to-face")
+    ):
+        treatment_type = "Hybrid"
+    if treatment_type:
+        fields["treatment_type"] = treatment_type
+
+    setting = _first_match(TREATMENT_SETTING_PATTERNS, message)
+    if setting:
+        fields["treatment_setting"] = setting
+
+    # Only fill fields that are still empty - the LLM handles corrections
+    fields = {k: v for k, v in fields.items() if getattr(template, k) is None}
+
+    # Strip recognized keywords so they don't count as novel content
+    for patterns in (GENDER_PATTERNS, TREATMENT_TYPE_PATTERNS, TREATMENT_SETTING_PATTERNS):
+        for pattern in patterns.values():
+            remainder = pattern.sub(" ", remainder)
+
+    if CORRECTION_PATTERN.search(message):
+        return FastPathResult(fields, 1.0, True, "correction")
+
+    tokens = _content_tokens(remainder)
+    if not tokens:
+        return FastPathResult(fields, 0.0, False, "no new content")
+
+    seen = set()
+    for text in previous_user_texts:
+        seen.update(_content_tokens(text))
+    novel = [t for t in tokens if t not in seen]
+    novelty = len(novel) / len(tokens)
+
+    if novel and novelty >= novelty_threshold:
+        return FastPathResult(fields, novelty, True, "novel content")
+    return FastPathResult(fields, novelty, False, "repeated content")
+
+
+def summary_similarity(first: str, second: str) -> float:
+    """
+    Word-level Jaccard similarity of two conversation summaries.
+
+    Used to decide whether scenarios retrieved for an earlier summary can be
+    reused for a later one.
+
+    Args:
+        first: A summary from generate_conversation_summary
+        second: Another summary
+
+    Returns:
+        Similarity between 0.0 (disjoint) and 1.0 (same words)
+    """
+    first_words = set(_TOKEN_PATTERN.findall(first.lower()))
+    second_words = set(_TOKEN_PATTERN.findall(second.lower()))
+    if not first_words and not second_words:
+        return 1.0
+    return len(first_words & second_words) / len(first_words | second_words)
+
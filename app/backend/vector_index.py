@@ -0,0 +1,306 @@
+"""
+In-process NumPy vector index for scenario retrieval.
+
+The scenario corpus is small, so instead of querying Chroma's persistent
+client (SQLite metadata store plus HNSW index) on every retrieval, all
+scenario vectors are loaded once into one contiguous float32 matrix and top-k
+is a single vectorized matrix product.
+
+Scores use the collection's own distance function (Chroma's `hnsw:space`:
+squared L2 by default, or cosine / inner product distance), so results and
+their order match `Chroma.similarity_search_with_score` (lower is closer;
+ties are broken by ingestion order).
+
+The index can also be exported to a portable bundle directory and loaded
+from it without Chroma:
+
+- vectors.npy: float32 matrix, one row per scenario
+- documents.json: scenario IDs, titles, texts and Chroma metadata
+- manifest.json: format version, bundle ID, embedding model, dimension,
+  count and distance function
+
+A re-export is written to a sibling temporary directory and swapped in with
+renames, so a reader sees the old or the new bundle, never a mix of both.
+Bundles are memory-mapped read-only (numpy.memmap), so every worker process
+shares one page-cached copy of the vectors instead of loading its own.
+"""
+
+import json
+import os
+import shutil
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+from uuid import uuid4
+
+import numpy as np
+
+from backend.persistence import atomic_write_json
+
+DISTANCE_SPACES = ("l2", "cosine", "ip")
+
+BUNDLE_FORMAT_VERSION = 1
+BUNDLE_MANIFEST = "manifest.json"
+BUNDLE_VECTORS = "vectors.npy"
+BUNDLE_DOCUMENTS = "documents.json"
+BUNDLE_LOAD_ATTEMPTS = 3  # A load that overlaps a re-export is retried
+
+
+class NumpyVectorIndex:
+    """Exact top-k search over a float32 matrix of document vectors."""
+
+    def __init__(self, vectors: Any, documents: List[Dict[str, Any]], space: str = "l2"):
+        """
+        Args:
+            vectors: Document vectors, shape (documents, dimensions)
+            documents: Per-row dictionaries with 'id', 'title', 'content' and 'metadata'
+            space: Distance function: "l2" (squared), "cosine" or "ip"
+        """
+        if space not in DISTANCE_SPACES:
+            raise ValueError(f"Unsupported distance space: {space}")
+        # A float32 C-contiguous memmap is used as is (no copy)
+        self.vectors = np.ascontiguousarray(vectors, dtype=np.float32)
+        if self.vectors.ndim != 2 or len(self.vectors) != len(documents):
+            raise ValueError("Expected one vector row per document")
+        self.documents = documents
+        self.space = space
+
+        # Precomputed per-row terms (small vectors, not a second matrix) so a
+        # query is one product against the shared vectors
+        self._squared_norms = np.einsum("ij,ij->i", self.vectors, self.vectors)
+        self._inverse_norms = 1.0 / np.maximum(np.sqrt(self._squared_norms), 1e-12)
+
+    @classmethod
+    def from_chroma(cls, vector_store: Any) -> "NumpyVectorIndex":
+        """
+        Load every vector and document of a Chroma collection.
+
+        Args:
+            vector_store: LangChain Chroma vector store
+
+        Returns:
+            NumpyVectorIndex with the collection's distance function
+        """
+        collection = vector_store._collection
+        data = collection.get(include=["embeddings", "documents", "metadatas"])
+        documents = [
+            {
+                "id": (metadata or {}).get("id", "unknown"),
+                "title": (metadata or {}).get("title", "Untitled Scenario"),
+                "content": content,
+                "metadata": metadata or {},
+            }
+            for content, metadata in zip(data["documents"], data["metadatas"])
+        ]
+        vectors = np.asarray(data["embeddings"], dtype=np.float32)
+        if not documents:
+            vectors = vectors.reshape(0, 0)
+        space = (collection.metadata or {}).get("hnsw:space", "l2")
+        return cls(vectors, documents, space)
+
+    @classmethod
+    def from_bundle(cls, bundle_dir: str, embedding_model: Optional[str] = None) -> "NumpyVectorIndex":
+        """
+        Load an exported bundle, memory-mapping its vectors read-only.
+
+        Args:
+            bundle_dir: Bundle directory
+            embedding_model: Expected embedding model (checked against the manifest)
+
+        Returns:
+            NumpyVectorIndex backed by the bundle's vector file
+
+        Raises:
+            ValueError: If the bundle has another format version, embedding
+                model or shape than expected
+        """
+        bundle_dir = Path(bundle_dir)
+        for attempt in range(1, BUNDLE_LOAD_ATTEMPTS + 1):
+            try:
+                manifest = read_bundle_manifest(bundle_dir)
+                try:
+                    vectors, documents = cls._load_bundle_files(bundle_dir, manifest, embedding_model)
+                except ValueError:
+                    # Files of a newer export checked against the old manifest;
+                    # an unchanged manifest means the bundle really is invalid
+                    if attempt == BUNDLE_LOAD_ATTEMPTS or read_bundle_manifest(bundle_dir) == manifest:
+                        raise
+                else:
+                    # The bundle was swapped while loading: the files may belong
+                    # to two different exports
+                    if read_bundle_manifest(bundle_dir) == manifest:
+                        return cls(vectors, documents, manifest["space"])
+            except FileNotFoundError:
+                if attempt == BUNDLE_LOAD_ATTEMPTS:
+                    raise
+            time.sleep(0.05)
+        raise ValueError(f"Scenario bundle {bundle_dir} kept changing while loading")
+
+    @staticmethod
+    def _load_bundle_files(
+        bundle_dir: Path, manifest: Dict[str, Any], embedding_model: Optional[str]
+    ) -> Tuple[Any, List[Dict[str, Any]]]:
+        """Check a bundle manifest and load the vectors and documents it describes."""
+        if manifest.get("format") != BUNDLE_FORMAT_VERSION:
+            raise ValueError(f"Unsupported scenario bundle format: {manifest.get('format')}")
+        if embedding_model is not None and manifest["embedding_model"] != embedding_model:
+            raise ValueError(
+                f"Scenario bundle was embedded with {manifest['embedding_model']}, not {embedding_model}"
+            )
+
+        vectors = np.load(bundle_dir / BUNDLE_VECTORS, mmap_mode="r")
+        documents = json.loads((bundle_dir / BUNDLE_DOCUMENTS).read_text(encoding="utf-8"))
+        if vectors.shape != (manifest["count"], manifest["dimension"]) or len(documents) != manifest["count"]:
+            raise ValueError(f"Scenario bundle {bundle_dir} does not match its manifest")
+        return vectors, documents
+
+    def export_bundle(self, bundle_dir: str, embedding_model: str) -> Dict[str, Any]:
+        """
+        Write the index as a portable bundle.
+
+        The bundle is written to a temporary directory next to bundle_dir and
+        then swapped in: an existing bundle is renamed aside, the new one
+        renamed into place and the old one deleted. Readers see either bundle
+        complete (from_bundle() retries a load that overlaps the swap); a crash
+        between the two renames leaves no bundle, and retrieval falls back to
+        Chroma until the next export.
+
+        Args:
+            bundle_dir: Bundle directory (an existing bundle is replaced)
+            embedding_model: Embedding model the vectors were made with
+
+        Returns:
+            The written manifest
+
+        Raises:
+            ValueError: If bundle_dir exists but holds something other than a bundle
+        """
+        bundle_dir = Path(bundle_dir)
+        if bundle_dir.exists() and not bundle_exists(bundle_dir) and any(bundle_dir.iterdir()):
+            raise ValueError(f"{bundle_dir} is not a scenario bundle, refusing to replace it")
+        bundle_dir.parent.mkdir(parents=True, exist_ok=True)
+
+        tmp_dir = Path(tempfile.mkdtemp(prefix=f".{bundle_dir.name}.", dir=bundle_dir.parent))
+        old_dir = None
+        try:
+            manifest = self._write_bundle_files(tmp_dir, embedding_model)
+            if bundle_dir.exists():
+                old_dir = tmp_dir.with_name(f"{tmp_dir.name}.old")
+                os.replace(bundle_dir, old_dir)
+            os.replace(tmp_dir, bundle_dir)
+        except BaseException:
+            if old_dir is not None and not bundle_dir.exists():
+                os.replace(old_dir, bundle_dir)
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+            raise
+        if old_dir is not None:
+            # Processes that memory-mapped the old vectors keep their mapping
+            shutil.rmtree(old_dir, ignore_errors=True)
+        return manifest
+
+    def _write_bundle_files(self, bundle_dir: Path, embedding_model: str) -> Dict[str, Any]:
+        """Write the bundle files into an empty directory and return the manifest."""
+        bundle_dir.chmod(0o755)  # mkdtemp() creates it private to this user
+        with open(bundle_dir / BUNDLE_VECTORS, "wb") as f:
+            np.save(f, self.vectors)
+            f.flush()
+            os.fsync(f.fileno())
+        atomic_write_json(bundle_dir / BUNDLE_DOCUMENTS, self.documents, indent=None)
+
+        manifest = {
+            "format": BUNDLE_FORMAT_VERSION,
+            "bundle_id": uuid4().hex,
+            "embedding_model": embedding_model,
+            "dimension": int(self.vectors.shape[1]),
+            "count": len(self.documents),
+            "space": self.space,
+            "dtype": "float32",
+            "created_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        }
+        atomic_write_json(bundle_dir / BUNDLE_MANIFEST, manifest)
+        return manifest
+
+    def __len__(self) -> int:
+        return len(self.documents)
+
+    def distances(self, queries: Any, rows: Optional[Any] = None) -> Any:
+        """
+        Distances from each query to every document.
+
+        Args:
+            queries: Query vectors, shape (queries, dimensions)
+            rows: Only these document rows (all when None)
+
+        Returns:
+            float32 array, shape (queries, documents or rows)
+        """
+        queries = np.asarray(queries, dtype=np.float32)
+        vectors, squared_norms, inverse_norms = self.vectors, self._squared_norms, self._inverse_norms
+        if rows is not None:
+            vectors, squared_norms, inverse_norms = vectors[rows], squared_norms[rows], inverse_norms[rows]
+        products = queries @ vectors.T
+        if self.space == "cosine":
+            query_norms = np.maximum(np.linalg.norm(queries, axis=1, keepdims=True), 1e-12)
+            return 1.0 - products / query_norms * inverse_norms[None, :]
+        if self.space == "ip":
+            return 1.0 - products
+        squared = np.einsum("ij,ij->i", queries, queries)[:, None] + squared_norms[None, :] - 2.0 * products
+        return np.maximum(squared, 0.0)
+
+    def search(
+        self, queries: Sequence[Sequence[float]], k: int, rows: Optional[Sequence[int]] = None
+    ) -> List[List[Tuple[int, float]]]:
+        """
+        Find the k closest documents for each query.
+
+        Args:
+            queries: Query vectors
+            k: Results per query
+            rows: Only search these document rows (all when None)
+
+        Returns:
+            Per query, a list of (document row, distance) pairs, closest first
+        """
+        if not len(self.documents) or not len(queries) or (rows is not None and not len(rows)):
+            return [[] for _ in queries]
+        if rows is not None:
+            # Only the pre-filtered rows are scored
+            rows = np.asarray(sorted(rows), dtype=np.int64)
+        distances = self.distances(queries, rows)
+        k = min(k, distances.shape[1])
+
+        # Partial selection of the k smallest, then a stable sort of just those
+        if k < distances.shape[1]:
+            candidates = np.argpartition(distances, k - 1, axis=1)[:, :k]
+            candidates.sort(axis=1)
+        else:
+            candidates = np.broadcast_to(np.arange(distances.shape[1]), distances.shape)
+        candidate_distances = np.take_along_axis(distances, candidates, axis=1)
+        order = np.argsort(candidate_distances, axis=1, kind="stable")
+        result_rows = np.take_along_axis(candidates, order, axis=1)
+        if rows is not None:
+            result_rows = rows[result_rows]
+        scores = np.take_along_axis(candidate_distances, order, axis=1)
+        return [
+            [(int(row), float(score)) for row, score in zip(query_rows, query_scores)]
+            for query_rows, query_scores in zip(result_rows, scores)
+        ]
+
+
+def read_bundle_manifest(bundle_dir: str) -> Dict[str, Any]:
+    """
+    Read a scenario bundle's manifest.
+
+    Args:
+        bundle_dir: Bundle directory
+
+    Returns:
+        Manifest dictionary
+    """
+    return json.loads((Path(bundle_dir) / BUNDLE_MANIFEST).read_text(encoding="utf-8"))
+
+
+def bundle_exists(bundle_dir: str) -> bool:
+    """Check whether a directory holds a complete scenario bundle."""
+    return (Path(bundle_dir) / BUNDLE_MANIFEST).exists()
@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""
+Cold Session Archiver
+
+Moves sessions that have not been written for longer than the TTL out of the
+active session store into compressed per-session bundles (zstd when the
+zstandard package is installed, gzip otherwise), and restores them again.
+Archived sessions keep their catalog entries; resuming one in the app restores
+it automatically.
+
+Reports storage savings (uncompressed vs. compressed bytes) and archive,
+restore and read throughput.
+
+Usage:
+    python archive_sessions.py archive [--ttl-days D] [--codec zstd|gzip] [--dry-run]
+    python archive_sessions.py restore (SESSION_ID ... | --all)
+    python archive_sessions.py stats
+
+Examples:
+    python scripts/archive_sessions.py archive --dry-run
+    python scripts/archive_sessions.py archive --ttl-days 7 --codec gzip
+    python scripts/archive_sessions.py restore 3f2a9c1e-...
+    SESSION_BACKEND=sqlite python scripts/archive_sessions.py stats
+"""
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+# Add app backend to path
+app_dir = Path(__file__).parent.parent / "app"
+sys.path.insert(0, str(app_dir))
+
+from backend.config import get_config
+from backend.persistence import flush_all_sessions
+from backend.resources import get_session_archive, get_session_store
+from backend.session_archive import SessionArchive
+from backend.session_store import SessionStore
+
+
+def find_cold_sessions(store: SessionStore, ttl_days: float) -> list:
+    """
+    Find sessions not written for longer than the TTL.
+
+    Args:
+        store: Session store to scan
+        ttl_days: Idle time before a session is archived
+
+    Returns:
+        List of session IDs
+    """
+    cutoff = time.time() - ttl_days * 86400
+    cold = []
+    for session_id in store.list_sessions():
+        updated_at = store.session_updated_at(session_id)
+        if updated_at is not None and updated_at < cutoff:
+            cold.append(session_id)
+    return cold
+
+
+def report_throughput(action: str, count: int, raw_bytes: int, seconds: float) -> None:
+    """Print a sessions/s and MB/s line (MB of uncompressed session data)."""
+    seconds = max(seconds, 1e-9)
+    print(f"{action} {count} sessions in {seconds:.2f}s "
+          f"({count / seconds:.1f} sessions/s, {raw_bytes / seconds / 1e6:.2f} MB/s)")
+
+
+def cmd_archive(args, store: SessionStore, archive: SessionArchive) -> None:
+    ttl_days = args.ttl_days if args.ttl_days is not None else get_config().archive_ttl_days
+    cold = find_cold_sessions(store, ttl_days)
+    print(f"Found {len(cold)} sessions idle for more than {ttl_days:g} days")
+    if args.dry_run or not cold:
+        for session_id in cold:
+            print(f"  {session_id}")
+        return
+
+    raw_total = compressed_total = 0
+    started_at = time.perf_counter()
+    for session_id in cold:
+        raw, compressed = archive.archive(store, session_id)
+        raw_total += raw
+        compressed_total += compressed
+    elapsed = time.perf_counter() - started_at
+
+    report_throughput(f"📦 Archived ({archive.codec})", len(cold), raw_total, elapsed)
+    savings = 1 - compressed_total / raw_total if raw_total else 0
+    print(f"Storage: {raw_total / 1e6:.2f} MB -> {compressed_total / 1e6:.2f} MB ({savings:.0%} saved)")
+
+
+def cmd_restore(args, store: SessionStore, archive: SessionArchive) -> None:
+    session_ids = archive.list_sessions() if args.all else args.session_ids
+    if not session_ids:
+        print("No sessions to restore (pass session IDs or --all)")
+        return
+
+    restored = raw_total = 0
+    started_at = time.perf_counter()
+    for session_id in session_ids:
+        bundle = archive.read(session_id)
+        if bundle is None:
+            print(f"  ❌ {session_id}: not archived")
+            continue
+        raw_total += len(json.dumps(bundle, ensure_ascii=False).encode("utf-8"))
+        archive.restore(store, session_id)
+        restored += 1
+    report_throughput("✅ Restored", restored, raw_total, time.perf_counter() - started_at)
+
+
+def cmd_stats(args, store: SessionStore, archive: SessionArchive) -> None:
+    session_ids = archive.list_sessions()
+    print(f"Active sessions: {len(store.list_sessions())}")
+    print(f"Archived sessions: {len(session_ids)} in {archive.archive_dir}")
+    if not session_ids:
+        return
+
+    raw_total = compressed_total = 0
+    started_at = time.perf_counter()
+    for session_id in session_ids:
+        bundle = archive.read(session_id)
+        raw_total += len(json.dumps(bundle, ensure_ascii=False).encode("utf-8"))
+        compressed_total += archive.bundle_size(session_id)
+    elapsed = time.perf_counter() - started_at
+
+    savings = 1 - compressed_total / raw_total if raw_total else 0
+    print(f"Storage: {raw_total / 1e6:.2f} MB uncompressed, {compressed_total / 1e6:.2f} MB archived "
+          f"({savings:.0%} saved)")
+    report_throughput("📖 Read", len(session_ids), raw_total, elapsed)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Archive cold sessions into compressed bundles")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    archive_parser = subparsers.add_parser("archive", help="Archive sessions idle past the TTL")
+    archive_parser.add_argument("--ttl-days", type=float, help="Idle days before archiving (default: config)")
+    archive_parser.add_argument("--codec", choices=["zstd", "gzip"], help="Bundle compression (default: zstd if installed)")
+    archive_parser.add_argument("--dry-run", action="store_true", help="Only list what would be archived")
+
+    restore_parser = subparsers.add_parser("restore", help="Move archived sessions back into the store")
+    restore_parser.add_argument("session_ids", nargs="*", help="Sessions to restore")
+    restore_parser.add_argument("--all", action="store_true", help="Restore every archived session")
+
+    subparsers.add_parser("stats", help="Show archive size, savings and read throughput")
+    args = parser.parse_args()
+
+    config = get_config()
+    store = get_session_store()
+    archive = get_session_archive()
+    if getattr(args, "codec", None):
+        archive = SessionArchive(config.archive_dir, codec=args.codec)
+    # Pending write-behind saves must reach the store before it is scanned
+    flush_all_sessions()
+    print(f"🗄️  {config.session_backend} session store, archive: {config.archive_dir}\n")
+
+    {"archive": cmd_archive, "restore": cmd_restore, "stats": cmd_stats}[args.command](args, store, archive)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+Session Resume Benchmark
+
+Measures how long ConversationManager(session_id) takes to resume a saved
+session, once from the regular session artifacts (template, scenarios,
+conversation snapshot + journal) and once from the state snapshot (plus
+the conversation, which holds the messages).
+Also reports the time to materialize every message, which the lazy message
+list skips until messages are actually read.
+
+By default the largest sessions in the session catalog are used. They are
+copied into a temporary store first (and re-saved there to produce a state
+snapshot), so the original sessions are never modified. --synthetic adds a
+generated session with the given number of turns. No API key needed.
+
+Usage:
+    python benchmark_resume.py [SESSION_ID ...] [--largest N] [--synthetic TURNS] [--repeat N]
+
+Examples:
+    python scripts/benchmark_resume.py --largest 5
+    python scripts/benchmark_resume.py --synthetic 500 --repeat 10
+"""
+
+import argparse
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Add app backend to path
+app_dir = Path(__file__).parent.parent / "app"
+sys.path.insert(0, str(app_dir))
+
+from langchain_core.messages import AIMessage, HumanMessage
+
+from backend.config import get_config
+from backend.conversation_manager import ConversationManager
+from backend.persistence import flush_all_sessions
+from backend.resources import clear_shared_resources, get_session_catalog, get_session_store
+from migrate_sessions import migrate_session
+
+
+def create_synthetic_session(turns: int) -> str:
+    """
+    Save a generated session with the given number of turns.
+
+    Args:
+        turns: User/assistant exchanges
+
+    Returns:
+        Session ID
+    """
+    manager = ConversationManager()
+    for i in range(turns):
+        manager.messages.append(HumanMessage(content=f"Turn {i}: the patient struggles with handwriting at school. " * 4))
+        manager.messages.append(AIMessage(content=f"Turn {i}: what have you noticed about the grip and posture? " * 8))
+    manager._save_state()
+    return manager.get_session_id()
+
+
+def time_resume(session_id: str, use_snapshot: bool, repeat: int) -> tuple:
+    """
+    Resume a session repeatedly.
+
+    Args:
+        session_id: Session to resume
+        use_snapshot: Resume from the state snapshot (else from the artifacts)
+        repeat: Number of resumes
+
+    Returns:
+        Tuple of (median resume seconds, median full materialization seconds, message count)
+    """
+    config = get_config()
+    config.state_snapshots = use_snapshot
+    resume_times, materialize_times = [], []
+    for _ in range(repeat):
+        started_at = time.perf_counter()
+        manager = ConversationManager(session_id)
+        resume_times.append(time.perf_counter() - started_at)
+
+        started_at = time.perf_counter()
+        list(manager.messages)
+        materialize_times.append(time.perf_counter() - started_at)
+    config.state_snapshots = True
+    return statistics.median(resume_times), statistics.median(materialize_times), len(manager.messages)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark session resume")
+    parser.add_argument("session_ids", nargs="*", help="Sessions to benchmark (default: the largest ones)")
+    parser.add_argument("--largest", type=int, default=5, help="Number of largest catalog sessions to use")
+    parser.add_argument("--synthetic", type=int, help="Also benchmark a generated session with this many turns")
+    parser.add_argument("--repeat", type=int, default=5, help="Resumes per session and mode")
+    args = parser.parse_args()
+
+    config = get_config()
+    source = get_session_store()
+    session_ids = args.session_ids or [
+        entry["session_id"]
+        for entry in sorted(get_session_catalog().search(limit=100000), key=lambda e: -e["turn_count"])
+    ][:args.largest]
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        config.sessions_dir = str(Path(tmp_dir) / "sessions")
+        config.sessions_db_path = str(Path(tmp_dir) / "sessions.sqlite3")
+        config.prompt_blobs_dir = str(Path(tmp_dir) / "prompt_blobs")
+        config.session_catalog_path = str(Path(tmp_dir) / "session_catalog.sqlite3")
+        clear_shared_resources()
+        target = get_session_store()
+
+        # Copy into the temporary store and re-save to write a state snapshot
+        for session_id in session_ids:
+            migrate_session(source, target, session_id)
+            config.state_snapshots = False
+            manager = ConversationManager(session_id)
+            config.state_snapshots = True
+            manager._save_state()
+        if args.synthetic:
+            session_ids.append(create_synthetic_session(args.synthetic))
+        flush_all_sessions()
+
+        if not session_ids:
+            print("No sessions to benchmark (pass session IDs or --synthetic TURNS)")
+            return
+
+        print(f"⏱️  Resume latency ({config.session_backend} backend, median of {args.repeat})\n")
+        print(f"{'session':10} {'messages':>8} {'artifacts':>10} {'snapshot':>10} {'speedup':>8} "
+              f"{'snapshot KiB':>12} {'materialize all':>16}")
+        for session_id in session_ids:
+            artifacts, _, count = time_resume(session_id, False, args.repeat)
+            snapshot, materialize, _ = time_resume(session_id, True, args.repeat)
+            size = len(target.read_state_snapshot(session_id) or b"")
+            print(f"{session_id[:8]:10} {count:8} {artifacts * 1000:8.2f}ms {snapshot * 1000:8.2f}ms "
+                  f"{artifacts / snapshot:7.1f}x {size / 1024:12.1f} {materialize * 1000:14.2f}ms")
+
+    clear_shared_resources()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Session Storage Backend Benchmark
+
+Compares the files and SQLite session stores on synthetic sessions:
+- startup: creating a new session (empty template and conversation)
+- save:    saving a conversation turn by turn (one user + one assistant message per turn)
+- resume:  loading a saved session's template and conversation into a new SessionManager
+
+Writes go straight to the store (write_behind disabled) so the storage cost
+is measured, and everything runs in a temporary directory. No API key needed.
+
+Usage:
+    python benchmark_session_backends.py [--sessions N] [--turns N]
+
+Examples:
+    python scripts/benchmark_session_backends.py --sessions 200 --turns 20
+"""
+
+import argparse
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Add app backend to path
+app_dir = Path(__file__).parent.parent / "app"
+sys.path.insert(0, str(app_dir))
+
+from backend.config import get_config
+from backend.resources import clear_shared_resources
+from backend.session_manager import SessionManager
+
+USER_MESSAGE = "המטופל בן 7, מגיע לטיפול בקליניקה בגלל קשיי מוטוריקה עדינה. " * 3
+ASSISTANT_MESSAGE = "תודה על הפרטים. ספרי לי עוד על המטרות הטיפוליות שהצבתם עד עכשיו? " * 4
+
+
+def run_backend(backend: str, sessions: int, turns: int, tmp_dir: str) -> dict:
+    """
+    Benchmark one backend.
+
+    Args:
+        backend: "files" or "sqlite"
+        sessions: Number of sessions to create
+        turns: Turns saved per session
+        tmp_dir: Directory for the backend's data
+
+    Returns:
+        Dictionary of latency lists (seconds) for startup, save and resume
+    """
+    config = get_config()
+    config.session_backend = backend
+    config.sessions_dir = str(Path(tmp_dir) / "sessions")
+    config.sessions_db_path = str(Path(tmp_dir) / "sessions.sqlite3")
+    clear_shared_resources()
+
+    results = {"startup": [], "save": [], "resume": []}
+    session_ids = []
+
+    for _ in range(sessions):
+        started_at = time.perf_counter()
+        manager = SessionManager()
+        results["startup"].append(time.perf_counter() - started_at)
+        session_ids.append(manager.session_id)
+
+        messages = [{"role": "system", "content": "system prompt"}]
+        for _ in range(turns):
+            messages.append({"role": "user", "content": USER_MESSAGE})
+            messages.append({"role": "assistant", "content": ASSISTANT_MESSAGE})
+            started_at = time.perf_counter()
+            manager.save_conversation(messages, model="benchmark")
+            manager.save_template(manager.load_template())
+            results["save"].append(time.perf_counter() - started_at)
+
+    for session_id in session_ids:
+        started_at = time.perf_counter()
+        manager = SessionManager(session_id)
+        manager.load_template()
+        manager.load_conversation()
+        results["resume"].append(time.perf_counter() - started_at)
+
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark session storage backends")
+    parser.add_argument("--sessions", type=int, default=100, help="Sessions per backend")
+    parser.add_argument("--turns", type=int, default=10, help="Turns saved per session")
+    args = parser.parse_args()
+
+    config = get_config()
+    config.write_behind = False
+
+    for backend in ("files", "sqlite"):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            results = run_backend(backend, args.sessions, args.turns, tmp_dir)
+
+        print(f"⏱️  {backend} ({args.sessions} sessions x {args.turns} turns)")
+        for stage, latencies in results.items():
+            print(f"  {stage:<8} median {statistics.median(latencies) * 1000:7.2f} ms   "
+                  f"max {max(latencies) * 1000:7.2f} ms")
+        print()
+
+    clear_shared_resources()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Session Initialization Benchmark
+
+Creates N ConversationManager sessions and reports session-init latency and the
+Python memory held per session, once with the process-wide shared clients and
+once rebuilding every client per session (the old behaviour).
+
+Sessions are created in a temporary sessions directory. No LLM calls are made,
+but a valid GOOGLE_API_KEY and an ingested ChromaDB are required to build clients.
+
+Usage:
+    python benchmark_sessions.py [--sessions N]
+
+Examples:
+    python scripts/benchmark_sessions.py --sessions 20
+"""
+
+import argparse
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+# Add app backend to path
+app_dir = Path(__file__).parent.parent / "app"
+sys.path.insert(0, str(app_dir))
+
+from backend.config import get_config
+from backend.conversation_manager import ConversationManager
+from backend.resources import clear_shared_resources
+
+
+def create_sessions(count: int, shared: bool) -> tuple:
+    """
+    Create sessions and measure init latency and retained memory.
+
+    Args:
+        count: Number of sessions to create
+        shared: Reuse shared clients (False clears the registry before each session)
+
+    Returns:
+        Tuple of (list of init latencies in seconds, retained bytes per session)
+    """
+    clear_shared_resources()
+    managers = []
+    latencies = []
+
+    tracemalloc.start()
+    baseline = tracemalloc.get_traced_memory()[0]
+
+    for _ in range(count):
+        if not shared:
+            clear_shared_resources()
+        started_at = time.perf_counter()
+        managers.append(ConversationManager())
+        latencies.append(time.perf_counter() - started_at)
+
+    retained = tracemalloc.get_traced_memory()[0] - baseline
+    tracemalloc.stop()
+
+    return latencies, retained / count
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark session initialization")
+    parser.add_argument("--sessions", type=int, default=10, help="Sessions to create per run")
+    args = parser.parse_args()
+
+    config = get_config()
+    config.validate()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        config.sessions_dir = tmp_dir
+
+        for label, shared in (("Per-session clients", False), ("Shared clients", True)):
+            latencies, per_session = create_sessions(args.sessions, shared)
+            print(f"⏱️  {label} ({args.sessions} sessions)")
+            print(f"  First session init   {latencies[0] * 1000:8.1f} ms")
+            if len(latencies) > 1:
+                print(f"  Later sessions init  {statistics.median(latencies[1:]) * 1000:8.1f} ms (median)")
+            print(f"  Memory per session   {per_session / 1024:8.1f} KiB (tracemalloc)")
+            print()
+
+
+if __name__ == "__main__":
+    main()
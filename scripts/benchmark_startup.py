@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+Startup Import-Time Benchmark
+
+Runs a fresh interpreter with `python -X importtime` for each target and reports
+the total import time plus the slowest modules and top-level packages. Exits
+with status 1 if a target exceeds its budget, so import-time regressions are
+caught (e.g. a heavy SDK imported at module level again).
+
+Targets:
+    backend     - import backend.conversation_manager (what app.py needs up front)
+    warm-up     - preload the heavy provider modules (backend.resources.preload_modules)
+
+Usage:
+    python benchmark_startup.py [--budget-ms MS] [--top N] [--target backend warm-up]
+
+Examples:
+    python scripts/benchmark_startup.py
+    python scripts/benchmark_startup.py --target backend --budget-ms 800
+"""
+
+import argparse
+import re
+import subprocess
+import sys
+from collections import defaultdict
+from pathlib import Path
+
+app_dir = Path(__file__).parent.parent / "app"
+
+TARGETS = {
+    "backend": "import backend.conversation_manager",
+    "warm-up": "import backend.resources as r; r.preload_modules()",
+}
+
+# "import time:       self [us] |  cumulative | imported package"
+IMPORTTIME_LINE = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)")
+
+
+def run_importtime(code: str) -> list:
+    """
+    Run code in a fresh interpreter with -X importtime.
+
+    Args:
+        code: Python source passed to -c
+
+    Returns:
+        List of (module, self_us, cumulative_us, depth) tuples
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=app_dir,
+        capture_output=True,
+        text=True
+    )
+    if result.returncode != 0:
+        print(result.stderr.splitlines()[-1] if result.stderr else "import failed")
+        sys.exit(2)
+
+    entries = []
+    for line in result.stderr.splitlines():
+        match = IMPORTTIME_LINE.match(line)
+        if match:
+            self_us, cumulative_us, indent, module = match.groups()
+            entries.append((module, int(self_us), int(cumulative_us), len(indent) // 2))
+    return entries
+
+
+def report(name: str, entries: list, top: int, budget_ms: float) -> bool:
+    """
+    Print the import-time breakdown of one target.
+
+    Args:
+        name: Target name
+        entries: Parsed -X importtime entries
+        top: Number of modules/packages to list
+        budget_ms: Allowed total import time in milliseconds
+
+    Returns:
+        True if the target is within budget
+    """
+    total_ms = sum(e[1] for e in entries) / 1000
+    within_budget = total_ms <= budget_ms
+    status = "✅" if within_budget else "❌ over budget"
+    print(f"⏱️  {name}: {total_ms:.1f} ms total ({len(entries)} modules, budget {budget_ms:.0f} ms) {status}")
+
+    print("  Slowest modules (cumulative):")
+    for module, _, cumulative_us, _ in sorted(entries, key=lambda e: -e[2])[:top]:
+        print(f"    {cumulative_us / 1000:8.1f} ms  {module}")
+
+    packages = defaultdict(int)
+    for module, self_us, _, _ in entries:
+        packages[module.split(".")[0]] += self_us
+    print("  Slowest packages (self time):")
+    for package, self_us in sorted(packages.items(), key=lambda p: -p[1])[:top]:
+        print(f"    {self_us / 1000:8.1f} ms  {package}")
+    print()
+
+    return within_budget
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Report import time per module")
+    parser.add_argument("--target", nargs="+", default=["backend"], choices=list(TARGETS))
+    parser.add_argument("--budget-ms", type=float, default=1000, help="Allowed import time per target")
+    parser.add_argument("--top", type=int, default=10, help="Modules/packages to list")
+    args = parser.parse_args()
+
+    ok = True
+    for name in args.target:
+        ok = report(name, run_importtime(TARGETS[name]), args.top, args.budget_ms) and ok
+
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
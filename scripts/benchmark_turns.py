@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+"""
+Turn Latency Benchmark
+
+Replays the user messages of a saved session through a fresh ConversationManager
+and reports time-to-first-token and total turn latency. Each requested INTAKE
+execution mode is replayed separately so the modes can be compared side by side.
+
+Replays run against the live Gemini API and write into a temporary session
+store (sessions, catalog, prompt blobs and archive), so the original session
+and the session catalog are never modified. With --cache the
+disk-backed LLM response cache is enabled; from the second replay on, every
+LLM call of the transcript is served from the cache.
+
+Usage:
+    python benchmark_turns.py <session_dir> [--modes sequential concurrent] [--stream]
+                              [--cache] [--repeat N]
+
+Examples:
+    python scripts/benchmark_turns.py app/sessions/298d0880-94d6-4f57-bd0d-2b9797e6ac46
+    python scripts/benchmark_turns.py app/sessions/<id> --modes concurrent --stream
+    python scripts/benchmark_turns.py app/sessions/<id> --modes sequential --cache --repeat 2
+"""
+
+import argparse
+import statistics
+import sys
+import tempfile
+from pathlib import Path
+
+# Add app backend to path
+app_dir = Path(__file__).parent.parent / "app"
+sys.path.insert(0, str(app_dir))
+
+from backend.config import get_config
+from backend.conversation_manager import ConversationManager
+from backend.persistence import flush_all_sessions
+from backend.resources import clear_shared_resources, get_llm_cache
+from backend.session_store import FileSessionStore
+
+
+def load_user_messages(session_dir: Path) -> list:
+    """
+    Load the user messages of a saved session in order.
+
+    Args:
+        session_dir: Path to a session directory
+
+    Returns:
+        List of user message strings
+    """
+    store = FileSessionStore(str(session_dir.parent), get_config().prompt_blobs_dir)
+    data, _ = store.read_conversation(session_dir.name)
+    return [m["content"] for m in data["messages"] if m["role"] == "user"]
+
+
+def replay(user_messages: list, stream: bool) -> list:
+    """
+    Replay user messages through a new session.
+
+    Args:
+        user_messages: User messages to send in order
+        stream: Use stream_message instead of send_message
+
+    Returns:
+        List of per-turn metrics dictionaries (with the phase added)
+    """
+    manager = ConversationManager()
+    turns = []
+    for message in user_messages:
+        if stream:
+            for _ in manager.stream_message(message):
+                pass
+            result = manager.last_turn
+        else:
+            result = manager.send_message(message)
+        turns.append({"phase": result["phase"], **result["metrics"]})
+    return turns
+
+
+def summarize(label: str, values: list) -> str:
+    """Format mean/median/max of a list of seconds."""
+    if not values:
+        return f"  {label:<22} n/a"
+    return (
+        f"  {label:<22} mean {statistics.mean(values):6.2f}s"
+        f"  median {statistics.median(values):6.2f}s"
+        f"  max {max(values):6.2f}s"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Replay a session and report turn latency")
+    parser.add_argument("session_dir", type=Path, help="Saved session directory to replay")
+    parser.add_argument(
+        "--modes",
+        nargs="+",
+        default=["sequential", "concurrent"],
+        choices=["sequential", "concurrent"],
+        help="INTAKE execution modes to benchmark"
+    )
+    parser.add_argument("--stream", action="store_true", help="Measure the streaming path")
+    parser.add_argument("--cache", action="store_true", help="Enable the disk-backed LLM response cache")
+    parser.add_argument("--repeat", type=int, default=1, help="Replays per mode")
+    args = parser.parse_args()
+
+    config = get_config()
+    config.validate()
+    config.llm_cache_enabled = args.cache
+
+    user_messages = load_user_messages(args.session_dir)
+    print(f"📁 Replaying {len(user_messages)} user messages from {args.session_dir.name}\n")
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        # Every session persistence path, so replays leave nothing behind
+        # (the LLM and embedding caches stay shared on purpose)
+        config.sessions_dir = str(Path(tmp_dir) / "sessions")
+        config.sessions_db_path = str(Path(tmp_dir) / "sessions.sqlite3")
+        config.session_catalog_path = str(Path(tmp_dir) / "session_catalog.sqlite3")
+        config.prompt_blobs_dir = str(Path(tmp_dir) / "prompt_blobs")
+        config.archive_dir = str(Path(tmp_dir) / "archive")
+        clear_shared_resources()
+
+        for mode in args.modes:
+            config.intake_execution_mode = mode
+
+            for run in range(1, args.repeat + 1):
+                if args.cache:
+                    cache = get_llm_cache()
+                    hits_before, misses_before = cache.hits, cache.misses
+
+                turns = replay(user_messages, args.stream)
+
+                intake = [t for t in turns if t["phase"] == "INTAKE"]
+                print(f"⏱️  Mode: {mode}, run {run} ({len(intake)} INTAKE / {len(turns)} total turns)")
+                print(summarize("INTAKE total latency", [t["total_latency"] for t in intake]))
+                print(summarize("All turns total", [t["total_latency"] for t in turns]))
+                print(summarize("Time to first token", [t["time_to_first_token"] for t in turns]))
+
+                fast_path = turns[-1]["fast_path"] if turns else None
+                if fast_path and fast_path["turns"]:
+                    print(
+                        f"  Fast-path extractor    skip rate {fast_path['skip_rate']:.0%}"
+                        f"  hit rate {fast_path['hit_rate']:.0%}"
+                        f"  ({fast_path['llm_calls']} LLM extraction calls,"
+                        f" {fast_path['fields_filled']} fields filled locally)"
+                    )
+
+                if args.cache:
+                    print(
+                        f"  LLM response cache     {cache.hits - hits_before} hits"
+                        f"  {cache.misses - misses_before} misses (network calls)"
+                    )
+                print()
+
+        # Finish background writes and close the stores before the
+        # temporary directory is removed
+        flush_all_sessions()
+        clear_shared_resources()
+
+
+if __name__ == "__main__":
+    main()
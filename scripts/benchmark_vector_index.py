@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+Vector Index Benchmark
+
+Compares per-query retrieval latency of the two ScenarioRetriever query
+paths on synthetic corpora of growing size:
+- chroma: Chroma similarity search by vector (persistent client, HNSW index)
+- numpy:  the in-process NumPy index (backend.vector_index), one query at a
+          time and as a single batch
+
+Each corpus is random unit vectors written to a temporary Chroma collection;
+the NumPy index is loaded from that collection exactly as the app loads it.
+Query embeddings are precomputed, so only the search is timed. Also reports
+how often both paths return the same top-k IDs in the same order (HNSW is
+approximate, so large corpora can differ slightly). No API key needed.
+
+Usage:
+    python benchmark_vector_index.py [--sizes N ...] [--dim D] [--queries Q] [--k K] [--space l2|cosine|ip]
+
+Examples:
+    python scripts/benchmark_vector_index.py
+    python scripts/benchmark_vector_index.py --sizes 18 1000 100000 --dim 3072 --queries 200
+"""
+
+import argparse
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Add app backend to path
+app_dir = Path(__file__).parent.parent / "app"
+sys.path.insert(0, str(app_dir))
+
+import chromadb
+import numpy as np
+from langchain_chroma import Chroma
+
+from backend.vector_index import NumpyVectorIndex
+
+
+def build_collection(client, name: str, vectors: np.ndarray, space: str) -> Chroma:
+    """
+    Write a synthetic scenario collection.
+
+    Args:
+        client: Chroma persistent client
+        name: Collection name
+        vectors: Scenario vectors
+        space: Chroma distance function
+
+    Returns:
+        LangChain Chroma vector store over the collection
+    """
+    collection = client.create_collection(name, metadata={"hnsw:space": space})
+    batch_size = client.get_max_batch_size() if hasattr(client, "get_max_batch_size") else 5000
+    for start in range(0, len(vectors), batch_size):
+        rows = range(start, min(start + batch_size, len(vectors)))
+        collection.add(
+            ids=[f"scenario-{i}" for i in rows],
+            embeddings=vectors[start:start + batch_size].tolist(),
+            documents=[f"Synthetic scenario {i}" for i in rows],
+            metadatas=[{"id": f"scenario-{i}", "title": f"Scenario {i}"} for i in rows]
+        )
+    return Chroma(client=client, collection_name=name)
+
+
+def run_size(client, size: int, args, rng: np.random.Generator) -> dict:
+    """
+    Benchmark one corpus size.
+
+    Returns:
+        Dictionary with median latencies (seconds), load time and agreement rate
+    """
+    vectors = rng.standard_normal((size, args.dim)).astype(np.float32)
+    vectors /= np.linalg.norm(vectors, axis=1, keepdims=True)
+    queries = rng.standard_normal((args.queries, args.dim)).astype(np.float32)
+    queries /= np.linalg.norm(queries, axis=1, keepdims=True)
+
+    vector_store = build_collection(client, f"bench_{size}", vectors, args.space)
+
+    started_at = time.perf_counter()
+    index = NumpyVectorIndex.from_chroma(vector_store)
+    load_time = time.perf_counter() - started_at
+
+    chroma_times, numpy_times, chroma_ids, numpy_ids = [], [], [], []
+    for query in queries:
+        started_at = time.perf_counter()
+        results = vector_store.similarity_search_by_vector_with_relevance_scores(query.tolist(), k=args.k)
+        chroma_times.append(time.perf_counter() - started_at)
+        chroma_ids.append([doc.metadata["id"] for doc, _ in results])
+
+        started_at = time.perf_counter()
+        results = index.search([query], args.k)[0]
+        numpy_times.append(time.perf_counter() - started_at)
+        numpy_ids.append([index.documents[row]["id"] for row, _ in results])
+
+    started_at = time.perf_counter()
+    index.search(queries, args.k)
+    batch_time = (time.perf_counter() - started_at) / len(queries)
+
+    return {
+        "chroma": statistics.median(chroma_times),
+        "numpy": statistics.median(numpy_times),
+        "numpy_batch": batch_time,
+        "load": load_time,
+        "agreement": sum(a == b for a, b in zip(chroma_ids, numpy_ids)) / len(queries),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark Chroma vs. NumPy scenario retrieval")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[18, 1000, 10000, 100000], help="Corpus sizes")
+    parser.add_argument("--dim", type=int, default=768, help="Vector dimensions")
+    parser.add_argument("--queries", type=int, default=100, help="Queries per corpus size")
+    parser.add_argument("--k", type=int, default=2, help="Scenarios per query")
+    parser.add_argument("--space", choices=["l2", "cosine", "ip"], default="l2", help="Distance function")
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    print(f"⏱️  Per-query retrieval latency (dim={args.dim}, k={args.k}, {args.space}, median of {args.queries})\n")
+    print(f"{'scenarios':>10} {'chroma':>10} {'numpy':>10} {'numpy batch':>12} {'speedup':>8} "
+          f"{'index load':>11} {'same top-k':>11}")
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        client = chromadb.PersistentClient(path=tmp_dir)
+        for size in args.sizes:
+            result = run_size(client, size, args, rng)
+            print(f"{size:10} {result['chroma'] * 1000:8.3f}ms {result['numpy'] * 1000:8.3f}ms "
+                  f"{result['numpy_batch'] * 1000:10.3f}ms {result['chroma'] / result['numpy']:7.1f}x "
+                  f"{result['load']:10.2f}s {result['agreement']:10.0%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,373 @@
+#!/usr/bin/env python3
+"""
+Columnar Session Export
+
+Exports every saved session into columnar files for bulk analytics, one table
+each (requires pyarrow):
+
+- messages: one row per message (session, sequence number, user turn, phase,
+  role, text, or the prompt hash of a stored system prompt)
+- templates: one row per session (creation and transition times, turn count,
+  turns until the MENTORING transition, filled field count and every template
+  field)
+- retrievals: one row per retrieved scenario (session, rank, scenario ID,
+  title, similarity score)
+
+Sessions are read by a process pool and streamed into the output in batches,
+so memory stays bounded however many sessions there are. Archived sessions
+(scripts/archive_sessions.py) are exported from their bundles.
+
+Re-running into the same directory is incremental: the manifest remembers
+when each session was exported, and only sessions changed since then are read
+again. Each run adds one part file per table; the rows of changed and deleted
+sessions are dropped from older parts. A run writes its new parts first, then
+rewrites the older parts, and the manifest last, so an interrupted run never
+loses rows: part files the manifest does not reference are left-overs of such
+a run and are removed by the next one.
+
+Usage:
+    python export_sessions.py [--out DIR] [--format parquet|arrow] [--workers N]
+                              [--batch-size N] [--full]
+
+Examples:
+    python scripts/export_sessions.py --out exports/sessions
+    python scripts/export_sessions.py --out exports/sessions --format arrow --workers 8
+    SESSION_BACKEND=sqlite python scripts/export_sessions.py --out exports/sessions --full
+"""
+
+import argparse
+import json
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+# Add app backend to path
+app_dir = Path(__file__).parent.parent / "app"
+sys.path.insert(0, str(app_dir))
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.feather as feather
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+
+from backend.config import get_config
+from backend.persistence import atomic_write_json
+from backend.session_archive import SessionArchive
+from backend.tools import TEMPLATE_FIELDS
+from migrate_sessions import open_store
+
+EXPORT_FORMAT_VERSION = 1
+MANIFEST_NAME = "export_manifest.json"
+FILE_SUFFIXES = {"parquet": ".parquet", "arrow": ".arrow"}
+TABLES = ["messages", "templates", "retrievals"]
+
+# Per-process session sources, opened by _init_worker
+_store = None
+_archive = None
+
+
+def table_schemas() -> Dict[str, Any]:
+    """Arrow schemas of the exported tables."""
+    return {
+        "messages": pa.schema([
+            ("session_id", pa.string()),
+            ("seq", pa.int32()),
+            ("turn", pa.int32()),
+            ("phase", pa.string()),
+            ("role", pa.string()),
+            ("content", pa.string()),
+            ("prompt_hash", pa.string()),
+            ("content_chars", pa.int32()),
+        ]),
+        "templates": pa.schema([
+            ("session_id", pa.string()),
+            ("created_at", pa.string()),
+            ("phase_transition_at", pa.string()),
+            ("model", pa.string()),
+            ("turn_count", pa.int32()),
+            ("turns_to_transition", pa.int32()),
+            ("filled_fields", pa.int32()),
+        ] + [(field, pa.string()) for field in TEMPLATE_FIELDS]),
+        "retrievals": pa.schema([
+            ("session_id", pa.string()),
+            ("rank", pa.int32()),
+            ("scenario_id", pa.string()),
+            ("title", pa.string()),
+            ("similarity_score", pa.float64()),
+        ]),
+    }
+
+
+def session_rows(
+    session_id: str,
+    conversation: Optional[Dict[str, Any]],
+    template: Optional[Dict[str, Any]],
+    scenarios: Optional[List[Dict[str, Any]]]
+) -> Dict[str, List[Dict[str, Any]]]:
+    """
+    Flatten one session into table rows.
+
+    The MENTORING transition is the first system message after the two
+    opening ones (the phase 2 instructions).
+
+    Args:
+        session_id: Session ID
+        conversation: Conversation dictionary
+        template: Template dictionary
+        scenarios: Retrieved scenario metadata
+
+    Returns:
+        Dictionary of table name -> rows
+    """
+    conversation = conversation or {"messages": []}
+    template = template or {}
+
+    messages = []
+    turn = 0
+    turns_to_transition = None
+    for seq, message in enumerate(conversation["messages"]):
+        if message["role"] == "user":
+            turn += 1
+        elif message["role"] == "system" and seq >= 2 and turns_to_transition is None:
+            turns_to_transition = turn
+        content = message.get("content")
+        messages.append({
+            "session_id": session_id,
+            "seq": seq,
+            "turn": turn,
+            "phase": "INTAKE" if turns_to_transition is None else "MENTORING",
+            "role": message["role"],
+            "content": content,
+            "prompt_hash": message["ref"]["hash"] if "ref" in message else None,
+            "content_chars": len(content) if content is not None else None,
+        })
+
+    templates = [{
+        "session_id": session_id,
+        "created_at": conversation.get("created_at"),
+        "phase_transition_at": conversation.get("phase_transition_at"),
+        "model": conversation.get("model"),
+        "turn_count": turn,
+        "turns_to_transition": turns_to_transition,
+        "filled_fields": sum(1 for field in TEMPLATE_FIELDS if template.get(field)),
+        **{field: template.get(field) for field in TEMPLATE_FIELDS},
+    }]
+
+    retrievals = [
+        {
+            "session_id": session_id,
+            "rank": rank,
+            "scenario_id": scenario.get("id"),
+            "title": scenario.get("title"),
+            "similarity_score": scenario.get("similarity_score"),
+        }
+        for rank, scenario in enumerate(scenarios or [], start=1)
+    ]
+    return {"messages": messages, "templates": templates, "retrievals": retrievals}
+
+
+def _init_worker(backend: str, sessions_dir: str, blobs_dir: str, db_path: str, archive_dir: str) -> None:
+    """Open the session store and archive once per worker process."""
+    global _store, _archive
+    _store = open_store(backend, sessions_dir, blobs_dir, db_path)
+    _archive = SessionArchive(archive_dir)
+
+
+def _read_batch(batch: List[tuple]) -> Dict[str, List[Dict[str, Any]]]:
+    """Read a batch of (session_id, archived) pairs into table rows (runs in a worker)."""
+    rows = {table: [] for table in TABLES}
+    for session_id, archived in batch:
+        if archived:
+            bundle = _archive.read(session_id)
+            if bundle is None:
+                continue
+            session = session_rows(
+                session_id, bundle["conversation"], bundle["template"], bundle["retrieved_scenarios"]
+            )
+        else:
+            conversation, _ = _store.read_conversation(session_id)
+            session = session_rows(
+                session_id, conversation, _store.read_template(session_id), _store.read_scenarios(session_id)
+            )
+        for table in TABLES:
+            rows[table].extend(session[table])
+    return rows
+
+
+def read_table(path: Path, file_format: str) -> Any:
+    """Read one part file."""
+    if file_format == "parquet":
+        return pq.read_table(path)
+    return feather.read_table(path)
+
+
+def write_table(table: Any, path: Path, file_format: str) -> None:
+    """Write one part file (via a temporary file, replaced atomically)."""
+    tmp_path = path.with_name(path.name + ".tmp")
+    if file_format == "parquet":
+        pq.write_table(table, tmp_path)
+    else:
+        feather.write_feather(table, tmp_path)
+    tmp_path.replace(path)
+
+
+class PartWriter:
+    """Streams record batches into one new part file per table."""
+
+    def __init__(self, out_dir: Path, part: str, file_format: str, schemas: Dict[str, Any]):
+        self.schemas = schemas
+        self.paths = {
+            table: out_dir / table / f"{part}{FILE_SUFFIXES[file_format]}" for table in TABLES
+        }
+        self.writers = {}
+        for table, path in self.paths.items():
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_name(path.name + ".tmp")
+            if file_format == "parquet":
+                self.writers[table] = pq.ParquetWriter(tmp_path, schemas[table])
+            else:
+                self.writers[table] = pa.ipc.new_file(str(tmp_path), schemas[table])
+
+    def write(self, rows: Dict[str, List[Dict[str, Any]]]) -> None:
+        for table, table_rows in rows.items():
+            if table_rows:
+                self.writers[table].write_table(pa.Table.from_pylist(table_rows, schema=self.schemas[table]))
+
+    def close(self) -> None:
+        for table, writer in self.writers.items():
+            writer.close()
+            path = self.paths[table]
+            path.with_name(path.name + ".tmp").replace(path)
+
+
+def drop_sessions(out_dir: Path, manifest: Dict[str, Any], session_ids: set) -> None:
+    """
+    Remove sessions' rows from the part files that hold them.
+
+    Args:
+        out_dir: Export directory
+        manifest: Export manifest (updated in place)
+        session_ids: Sessions to remove
+    """
+    file_format = manifest["format"]
+    affected = {manifest["sessions"][sid]["part"] for sid in session_ids if sid in manifest["sessions"]}
+    for part in affected:
+        for table in TABLES:
+            path = out_dir / table / f"{part}{FILE_SUFFIXES[file_format]}"
+            if not path.exists():
+                continue
+            data = read_table(path, file_format)
+            kept = data.filter(pc.invert(pc.is_in(data["session_id"], value_set=pa.array(sorted(session_ids)))))
+            write_table(kept, path, file_format)
+    for session_id in session_ids:
+        manifest["sessions"].pop(session_id, None)
+
+
+def load_manifest(out_dir: Path, file_format: str, full: bool) -> Dict[str, Any]:
+    """Load the previous run's manifest, or start a new export (removing old parts)."""
+    path = out_dir / MANIFEST_NAME
+    if path.exists() and not full:
+        manifest = json.loads(path.read_text(encoding="utf-8"))
+        if manifest.get("version") == EXPORT_FORMAT_VERSION and manifest.get("format") == file_format:
+            remove_unreferenced_parts(out_dir, manifest)
+            return manifest
+        print("⚠️  Existing export has another version or format, exporting everything again")
+
+    manifest = {"version": EXPORT_FORMAT_VERSION, "format": file_format, "sessions": {}}
+    remove_unreferenced_parts(out_dir, manifest)
+    return manifest
+
+
+def remove_unreferenced_parts(out_dir: Path, manifest: Dict[str, Any]) -> None:
+    """Delete part files (and temporary files) that no manifest entry points to."""
+    suffix = FILE_SUFFIXES[manifest["format"]]
+    referenced = {entry["part"] + suffix for entry in manifest["sessions"].values()}
+    for table in TABLES:
+        for path in (out_dir / table).glob("part-*"):
+            if path.name not in referenced:
+                path.unlink()
+
+
+def main():
+    config = get_config()
+
+    parser = argparse.ArgumentParser(description="Export sessions into columnar files")
+    parser.add_argument("--out", type=Path, default=Path(config.sessions_dir).parent / "data" / "exports",
+                        help="Export directory")
+    parser.add_argument("--format", dest="file_format", choices=["parquet", "arrow"], default="parquet",
+                        help="Parquet or Arrow IPC files")
+    parser.add_argument("--workers", type=int, default=4, help="Reader processes")
+    parser.add_argument("--batch-size", type=int, default=200, help="Sessions per batch")
+    parser.add_argument("--full", action="store_true", help="Re-export every session")
+    args = parser.parse_args()
+
+    if pa is None:
+        print("❌ pyarrow is required for the export: pip install pyarrow")
+        sys.exit(1)
+
+    store = open_store(config.session_backend, config.sessions_dir, config.prompt_blobs_dir, config.sessions_db_path)
+    archive = SessionArchive(config.archive_dir)
+    args.out.mkdir(parents=True, exist_ok=True)
+    manifest = load_manifest(args.out, args.file_format, args.full)
+    exported = manifest["sessions"]
+
+    # Active sessions are re-read when written after their last export;
+    # archived ones never change, so only new ones are read
+    stored = {sid: store.session_updated_at(sid) or 0.0 for sid in store.list_sessions()}
+    archived = [sid for sid in archive.list_sessions() if sid not in stored]
+    todo = [
+        (sid, False) for sid, updated_at in stored.items()
+        if sid not in exported or updated_at > exported[sid]["updated_at"]
+    ] + [(sid, True) for sid in archived if sid not in exported]
+    removed = set(exported) - set(stored) - set(archived)
+
+    print(f"📊 Exporting {len(todo)} of {len(stored) + len(archived)} sessions "
+          f"({config.session_backend} store + archive) to {args.out} as {args.file_format}")
+
+    started_at = time.perf_counter()
+    counts = {table: 0 for table in TABLES}
+    if todo:
+        part = f"part-{time.strftime('%Y%m%d-%H%M%S')}"
+        while any(manifest_entry["part"] == part for manifest_entry in exported.values()):
+            part += "a"
+        writer = PartWriter(args.out, part, args.file_format, table_schemas())
+        batches = [todo[i:i + args.batch_size] for i in range(0, len(todo), args.batch_size)]
+        with ProcessPoolExecutor(
+            max_workers=args.workers,
+            initializer=_init_worker,
+            initargs=(config.session_backend, config.sessions_dir, config.prompt_blobs_dir,
+                      config.sessions_db_path, config.archive_dir)
+        ) as executor:
+            for rows in executor.map(_read_batch, batches):
+                writer.write(rows)
+                for table in TABLES:
+                    counts[table] += len(rows[table])
+        writer.close()
+
+    # Only now that the new rows are on disk are the old ones dropped
+    # (the new part is not in the manifest yet, so it is never touched)
+    drop_sessions(args.out, manifest, {sid for sid, _ in todo if sid in exported} | removed)
+    if todo:
+        exported_at = time.time()
+        for session_id, was_archived in todo:
+            exported[session_id] = {
+                "updated_at": exported_at if was_archived else stored[session_id],
+                "part": part,
+            }
+    atomic_write_json(args.out / MANIFEST_NAME, manifest)
+    elapsed = time.perf_counter() - started_at
+
+    print(f"✅ Exported {len(todo)} sessions in {elapsed:.2f}s: " +
+          ", ".join(f"{counts[table]} {table} rows" for table in TABLES))
+    if removed:
+        print(f"🗑️  Dropped {len(removed)} deleted sessions")
+    print(f"Export now covers {len(exported)} sessions")
+
+
+if __name__ == "__main__":
+    main()
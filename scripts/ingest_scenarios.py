@@ -2,9 +2,20 @@
 Scenario Ingestion Script
 
 Reads scenario markdown files from /scenarios directory and ingests them into ChromaDB
-with Gemini Embedding 001 embeddings for RAG retrieval.
+with Gemini Embedding 001 embeddings for RAG retrieval. Also builds the local
+BM25 index used for hybrid retrieval (no API key needed for that part), and
+extracts the template fields and age/setting/diagnosis buckets of every
+scenario as metadata (unchanged scenarios keep their earlier extraction).
+
+Usage:
+    python ingest_scenarios.py [--lexical-only]
+
+Examples:
+    python scripts/ingest_scenarios.py
+    python scripts/ingest_scenarios.py --lexical-only
 """
 
+import argparse
 import os
 import sys
 from pathlib import Path
@@ -14,11 +25,23 @@ import re
 app_dir = Path(__file__).parent.parent / "app"
 sys.path.insert(0, str(app_dir))
 
-from langchain_google_genai import GoogleGenerativeAIEmbeddings
 from langchain_chroma import Chroma
 from langchain_core.documents import Document
+from langchain_core.messages import HumanMessage, SystemMessage
 
 from backend.config import get_config
+from backend.conversation_manager import TemplateExtraction
+from backend.lexical_index import BM25Index
+from backend.prompts import SCENARIO_METADATA_EXTRACTION_PROMPT
+from backend.resources import get_embedding_cache, get_embeddings, get_extraction_model
+from backend.scenario_metadata import (
+    chroma_metadata,
+    content_hash,
+    load_scenario_metadata,
+    save_scenario_metadata,
+    scenario_entry,
+    template_buckets
+)
 
 
 def extract_scenario_title(content: str) -> str:
@@ -44,28 +67,56 @@ def extract_scenario_title(content: str) -> str:
     return "Untitled Scenario"
 
 
-def ingest_scenarios():
-    """Main ingestion function."""
+def extract_scenario_metadata(documents: list, metadata_path: str) -> dict:
+    """
+    Extract the template fields and buckets of every scenario.
+
+    Scenarios whose text is unchanged since the last run reuse their stored
+    entry, so each scenario is sent to the extraction model only once.
+
+    Args:
+        documents: Scenario documents
+        metadata_path: Scenario metadata file (read and rewritten)
+
+    Returns:
+        Scenario ID -> metadata entry
+    """
+    previous = load_scenario_metadata(metadata_path) if os.path.exists(metadata_path) else {}
+    extraction_model = get_extraction_model(TemplateExtraction, temperature=0.0)
+
+    entries = {}
+    for doc in documents:
+        scenario_id = doc.metadata["id"]
+        entry = previous.get(scenario_id)
+        if entry is None or entry["content_sha256"] != content_hash(doc.page_content):
+            extracted = extraction_model.invoke([
+                SystemMessage(content=SCENARIO_METADATA_EXTRACTION_PROMPT),
+                HumanMessage(content=doc.page_content)
+            ])
+            entry = scenario_entry(doc.page_content, extracted.model_dump())
+            print(f"  ├─ {scenario_id}: {entry['buckets']}")
+        else:
+            # Keyword lists may have changed since the fields were extracted
+            entry = {**entry, "buckets": template_buckets(entry["fields"])}
+        entries[scenario_id] = entry
+
+    save_scenario_metadata(metadata_path, entries)
+    return entries
+
+
+def ingest_scenarios(lexical_only: bool = False):
+    """
+    Main ingestion function.
+
+    Args:
+        lexical_only: Only rebuild the BM25 index (skip embedding and ChromaDB)
+    """
     print("🚀 Starting scenario ingestion...\n")
 
     # Get configuration
     config = get_config()
-    config.validate()
-
-    # Initialize embedding model
-    print(f"📊 Initializing embedding model: {config.embedding_model}")
-    embeddings = GoogleGenerativeAIEmbeddings(
-        model=config.embedding_model,
-        google_api_key=config.google_api_key
-    )
-
-    # Initialize ChromaDB
-    print(f"💾 Initializing ChromaDB at: {config.chroma_db_path}")
-    vector_store = Chroma(
-        collection_name=config.chroma_collection_name,
-        embedding_function=embeddings,
-        persist_directory=config.chroma_db_path
-    )
+    if not lexical_only:
+        config.validate()
 
     # Find scenario files
     scenarios_dir = Path(__file__).parent.parent / "scenarios"
@@ -120,8 +171,45 @@ def ingest_scenarios():
         print("\n❌ No documents to ingest")
         sys.exit(1)
 
+    # Build the local BM25 index (same IDs, titles and texts as ChromaDB)
+    print(f"\n🔤 Building BM25 index at: {config.lexical_index_path}")
+    lexical_index = BM25Index().build([
+        {"id": doc.metadata["id"], "title": doc.metadata["title"], "content": doc.page_content}
+        for doc in documents
+    ])
+    lexical_index.save(config.lexical_index_path)
+    print(f"✅ Indexed {len(lexical_index)} scenarios ({len(lexical_index.postings)} terms)")
+
+    if lexical_only:
+        print("\n✨ Ingestion complete!")
+        return
+
+    # Extract structured metadata and attach it to the Chroma documents
+    print(f"\n🏷️  Extracting scenario metadata to: {config.scenario_metadata_path}")
+    try:
+        entries = extract_scenario_metadata(documents, config.scenario_metadata_path)
+        for doc in documents:
+            doc.metadata.update(chroma_metadata(entries[doc.metadata["id"]]))
+        print(f"✅ Extracted metadata for {len(entries)} scenarios")
+    except Exception as e:
+        # Retrieval works without metadata (no filtering or boosting)
+        print(f"  ⚠️ Metadata extraction failed: {str(e)}")
+
+    # Initialize embedding model (through the embedding cache, so unchanged
+    # scenarios are not embedded again on re-ingestion)
+    print(f"\n📊 Initializing embedding model: {config.embedding_model}")
+    embeddings = get_embeddings()
+
+    # Initialize ChromaDB
+    print(f"💾 Initializing ChromaDB at: {config.chroma_db_path}")
+    vector_store = Chroma(
+        collection_name=config.chroma_collection_name,
+        embedding_function=embeddings,
+        persist_directory=config.chroma_db_path
+    )
+
     # Add documents to vector store
-    print(f"\n🔄 Embedding and storing {len(documents)} documents...")
+    print(f"🔄 Embedding and storing {len(documents)} documents...")
     try:
         ids = vector_store.add_documents(documents=documents)
         print(f"✅ Successfully ingested {len(ids)} scenarios")
@@ -130,6 +218,9 @@ def ingest_scenarios():
         collection = vector_store._collection
         count = collection.count()
         print(f"📊 ChromaDB collection '{config.chroma_collection_name}' now contains {count} documents")
+        if config.embedding_cache_enabled:
+            stats = get_embedding_cache().stats()
+            print(f"🗃️  Embedding cache: {stats['hits']} hits, {stats['misses']} misses")
 
     except Exception as e:
         print(f"\n❌ Ingestion failed: {str(e)}")
@@ -141,4 +232,7 @@ def ingest_scenarios():
 
 
 if __name__ == "__main__":
-    ingest_scenarios()
+    parser = argparse.ArgumentParser(description="Ingest scenarios into ChromaDB and the BM25 index")
+    parser.add_argument("--lexical-only", action="store_true", help="Only rebuild the BM25 index (no API key needed)")
+    args = parser.parse_args()
+    ingest_scenarios(lexical_only=args.lexical_only)
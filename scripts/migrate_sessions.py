@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""
+Session Migration Script
+
+Copies saved sessions between storage backends, e.g. the existing
+`app/sessions/<id>/` directories into the SQLite session database. Each
+session's template, retrieved scenarios, conversation (snapshot plus journal),
+state snapshot and the prompt blobs it references are copied; sessions
+already present in the target are skipped unless --overwrite is given, which
+replaces them entirely. The source is never modified.
+
+Usage:
+    python migrate_sessions.py [--from files|sqlite] [--to files|sqlite]
+                               [--sessions-dir DIR] [--blobs-dir DIR] [--db PATH] [--overwrite]
+
+Examples:
+    python scripts/migrate_sessions.py
+    python scripts/migrate_sessions.py --from sqlite --to files --sessions-dir /tmp/sessions-export
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+# Add app backend to path
+app_dir = Path(__file__).parent.parent / "app"
+sys.path.insert(0, str(app_dir))
+
+from backend.config import get_config
+from backend.session_store import FileSessionStore, SessionStore, SQLiteSessionStore
+
+
+def open_store(backend: str, sessions_dir: str, blobs_dir: str, db_path: str) -> SessionStore:
+    """
+    Open a session store.
+
+    Args:
+        backend: "files" or "sqlite"
+        sessions_dir: Sessions directory (files backend)
+        blobs_dir: Prompt blob directory (files backend)
+        db_path: Database path (sqlite backend)
+
+    Returns:
+        SessionStore instance
+    """
+    if backend == "sqlite":
+        return SQLiteSessionStore(db_path)
+    return FileSessionStore(sessions_dir, blobs_dir)
+
+
+def migrate_session(source: SessionStore, target: SessionStore, session_id: str) -> int:
+    """
+    Copy one session, replacing it if the target already has it.
+
+    Nothing of an existing target session is kept: a leftover state snapshot
+    or retrieved scenarios list would describe the old session, not the copy.
+
+    Args:
+        source: Store to read from
+        target: Store to write to
+        session_id: Session to copy
+
+    Returns:
+        Number of messages copied
+    """
+    if target.session_exists(session_id):
+        target.delete_sessions([session_id])
+    target.create_session(session_id)
+
+    template = source.read_template(session_id)
+    if template is not None:
+        target.write_template(session_id, template)
+
+    scenarios = source.read_scenarios(session_id)
+    if scenarios is not None:
+        target.write_scenarios(session_id, scenarios)
+
+    conversation, _ = source.read_conversation(session_id)
+    if conversation is None:
+        return 0
+
+    # Shared prompt blobs referenced by system messages
+    for message in conversation["messages"]:
+        if "ref" in message:
+            digest = message["ref"]["hash"]
+            content = source.read_blob(digest)
+            if content is None:
+                raise ValueError(f"missing prompt blob {digest[:12]}")
+            target.write_blob(digest, content)
+
+    target.write_conversation(session_id, conversation)
+
+    # Snapshots are backend-independent and describe the artifacts just copied
+    state_snapshot = source.read_state_snapshot(session_id)
+    if state_snapshot is not None:
+        target.write_state_snapshot(session_id, state_snapshot)
+    return len(conversation["messages"])
+
+
+def main():
+    config = get_config()
+
+    parser = argparse.ArgumentParser(description="Copy sessions between storage backends")
+    parser.add_argument("--from", dest="source", choices=["files", "sqlite"], default="files")
+    parser.add_argument("--to", dest="target", choices=["files", "sqlite"], default="sqlite")
+    parser.add_argument("--sessions-dir", default=config.sessions_dir, help="Sessions directory (files backend)")
+    parser.add_argument("--blobs-dir", default=config.prompt_blobs_dir, help="Prompt blob directory (files backend)")
+    parser.add_argument("--db", default=config.sessions_db_path, help="Session database (sqlite backend)")
+    parser.add_argument("--overwrite", action="store_true", help="Replace sessions already in the target")
+    args = parser.parse_args()
+
+    if args.source == args.target:
+        parser.error("--from and --to must differ")
+
+    source = open_store(args.source, args.sessions_dir, args.blobs_dir, args.db)
+    target = open_store(args.target, args.sessions_dir, args.blobs_dir, args.db)
+
+    session_ids = source.list_sessions()
+    print(f"📦 Migrating {len(session_ids)} sessions from {args.source} to {args.target}\n")
+
+    migrated = skipped = failed = messages = 0
+    started_at = time.perf_counter()
+    for session_id in session_ids:
+        if not args.overwrite and target.session_exists(session_id):
+            skipped += 1
+            continue
+        try:
+            messages += migrate_session(source, target, session_id)
+            migrated += 1
+        except Exception as e:
+            print(f"❌ {session_id}: {e}")
+            failed += 1
+    elapsed = time.perf_counter() - started_at
+
+    print(f"✅ Migrated {migrated} sessions ({messages} messages) in {elapsed:.2f}s")
+    if skipped:
+        print(f"⏭️  Skipped {skipped} sessions already in the target (use --overwrite to replace)")
+    if failed:
+        print(f"⚠️  {failed} sessions failed")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
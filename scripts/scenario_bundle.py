@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+Scenario Embedding Bundle Tool
+
+Exports the ingested scenario collection into a portable bundle (float32
+vectors.npy, documents.json and a manifest with the embedding model,
+dimension and distance function) and imports a bundle back into a Chroma
+collection without re-embedding anything.
+
+With `vector_backend = "numpy"` the app memory-maps the bundle at
+`vector_bundle_dir` directly, so workers share one page-cached copy of the
+vectors and never open Chroma; copying the bundle is a complete, offline
+deployment of the scenario index.
+
+Usage:
+    python scenario_bundle.py export [--out DIR]
+    python scenario_bundle.py import [BUNDLE_DIR] [--replace]
+    python scenario_bundle.py info [BUNDLE_DIR]
+
+Examples:
+    python scripts/ingest_scenarios.py && python scripts/scenario_bundle.py export
+    python scripts/scenario_bundle.py import /path/to/scenario_bundle --replace
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+from typing import Optional
+
+# Add app backend to path
+app_dir = Path(__file__).parent.parent / "app"
+sys.path.insert(0, str(app_dir))
+
+from backend.config import get_config
+from backend.vector_index import NumpyVectorIndex, bundle_exists, read_bundle_manifest
+
+
+def open_collection(space: Optional[str] = None):
+    """Open the configured Chroma collection (created with `space` if missing)."""
+    import chromadb
+
+    config = get_config()
+    client = chromadb.PersistentClient(path=config.chroma_db_path)
+    metadata = {"hnsw:space": space} if space else None
+    return client, client.get_or_create_collection(config.chroma_collection_name, metadata=metadata)
+
+
+def cmd_export(args) -> None:
+    from langchain_chroma import Chroma
+
+    config = get_config()
+    client, _ = open_collection()
+    vector_store = Chroma(client=client, collection_name=config.chroma_collection_name)
+
+    started_at = time.perf_counter()
+    index = NumpyVectorIndex.from_chroma(vector_store)
+    if not len(index):
+        print(f"❌ Collection '{config.chroma_collection_name}' is empty, run scripts/ingest_scenarios.py first")
+        sys.exit(1)
+    manifest = index.export_bundle(args.out, config.embedding_model)
+    elapsed = time.perf_counter() - started_at
+
+    size = sum(p.stat().st_size for p in Path(args.out).iterdir() if p.is_file())
+    print(f"✅ Exported {manifest['count']} scenarios ({manifest['dimension']} dims, {manifest['space']}) "
+          f"to {args.out} in {elapsed:.2f}s ({size / 1024:.1f} KiB)")
+
+
+def cmd_import(args) -> None:
+    config = get_config()
+    index = NumpyVectorIndex.from_bundle(args.bundle_dir, config.embedding_model)
+
+    client, collection = open_collection(index.space)
+    if args.replace:
+        client.delete_collection(config.chroma_collection_name)
+        client, collection = open_collection(index.space)
+    elif collection.count():
+        print(f"❌ Collection '{config.chroma_collection_name}' already has {collection.count()} documents "
+              "(use --replace)")
+        sys.exit(1)
+
+    documents = index.documents
+    collection.add(
+        ids=[document["id"] for document in documents],
+        embeddings=index.vectors.tolist(),
+        documents=[document["content"] for document in documents],
+        metadatas=[document["metadata"] or {"id": document["id"], "title": document["title"]}
+                   for document in documents]
+    )
+    print(f"✅ Imported {len(documents)} scenarios into '{config.chroma_collection_name}' "
+          f"at {config.chroma_db_path} (no re-embedding)")
+
+
+def cmd_info(args) -> None:
+    if not bundle_exists(args.bundle_dir):
+        print(f"No scenario bundle at {args.bundle_dir}")
+        return
+    manifest = read_bundle_manifest(args.bundle_dir)
+    for key, value in manifest.items():
+        print(f"{key:16} {value}")
+
+    started_at = time.perf_counter()
+    NumpyVectorIndex.from_bundle(args.bundle_dir)
+    print(f"{'load time':16} {(time.perf_counter() - started_at) * 1000:.2f}ms (memory-mapped)")
+    if manifest["embedding_model"] != get_config().embedding_model:
+        print(f"⚠️  The app is configured for {get_config().embedding_model}; this bundle will not load")
+
+
+def main():
+    config = get_config()
+
+    parser = argparse.ArgumentParser(description="Export and import portable scenario-embedding bundles")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    export_parser = subparsers.add_parser("export", help="Write the Chroma collection as a bundle")
+    export_parser.add_argument("--out", default=config.vector_bundle_dir, help="Bundle directory")
+
+    import_parser = subparsers.add_parser("import", help="Load a bundle into the Chroma collection")
+    import_parser.add_argument("bundle_dir", nargs="?", default=config.vector_bundle_dir, help="Bundle directory")
+    import_parser.add_argument("--replace", action="store_true", help="Replace the existing collection")
+
+    info_parser = subparsers.add_parser("info", help="Show a bundle's manifest")
+    info_parser.add_argument("bundle_dir", nargs="?", default=config.vector_bundle_dir, help="Bundle directory")
+    args = parser.parse_args()
+
+    {"export": cmd_export, "import": cmd_import, "info": cmd_info}[args.command](args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+Session Catalog CLI
+
+Lists, searches and inspects saved sessions through the session catalog index
+(backend/session_catalog.py) without reading the sessions themselves, and
+rebuilds the index from the active session store.
+
+Commands:
+    list     - most recently updated sessions
+    search   - sessions whose ID or key template fields contain a text
+    show     - one session's catalog entry
+    rebuild  - recreate the catalog from the session store and archive (parallel scan)
+
+Usage:
+    python session_catalog.py list [--phase INTAKE|MENTORING] [--min-turns N] [--limit N]
+    python session_catalog.py search TEXT [--phase ...] [--limit N]
+    python session_catalog.py show SESSION_ID
+    python session_catalog.py rebuild [--workers N]
+
+Examples:
+    python scripts/session_catalog.py list --phase MENTORING
+    python scripts/session_catalog.py search "CP"
+    python scripts/session_catalog.py rebuild --workers 16
+"""
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+# Add app backend to path
+app_dir = Path(__file__).parent.parent / "app"
+sys.path.insert(0, str(app_dir))
+
+from backend.resources import get_session_archive, get_session_catalog, get_session_store
+from backend.session_catalog import rebuild_catalog
+
+
+def print_entries(entries: list, elapsed: float) -> None:
+    """
+    Print catalog entries as one line each.
+
+    Args:
+        entries: Catalog entries
+        elapsed: Query time in seconds
+    """
+    for entry in entries:
+        phase = "MENTORING" if entry["phase_transition_at"] else "INTAKE"
+        scenarios = ",".join(entry["scenario_ids"]) or "-"
+        print(f"{entry['session_id']}  {(entry['created_at'] or '')[:16]:16}  {phase:9}  "
+              f"{entry['turn_count']:3} turns  scenarios {scenarios:10}  "
+              f"{entry['diagnosis'] or ''} {entry['patient_age'] or ''}")
+    print(f"\n{len(entries)} sessions ({elapsed * 1000:.1f} ms)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Query the session catalog")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    list_parser = subparsers.add_parser("list", help="List recent sessions")
+    search_parser = subparsers.add_parser("search", help="Search sessions")
+    search_parser.add_argument("text", help="Text matched against session ID and template fields")
+    for sub in (list_parser, search_parser):
+        sub.add_argument("--phase", choices=["INTAKE", "MENTORING"])
+        sub.add_argument("--min-turns", type=int, default=0)
+        sub.add_argument("--limit", type=int, default=20)
+
+    show_parser = subparsers.add_parser("show", help="Show one session's entry")
+    show_parser.add_argument("session_id")
+
+    rebuild_parser = subparsers.add_parser("rebuild", help="Rebuild the catalog from the session store")
+    rebuild_parser.add_argument("--workers", type=int, default=8, help="Scanner threads")
+
+    args = parser.parse_args()
+    catalog = get_session_catalog()
+
+    if args.command == "rebuild":
+        started_at = time.perf_counter()
+        count = rebuild_catalog(get_session_store(), catalog, workers=args.workers, archive=get_session_archive())
+        print(f"✅ Indexed {count} sessions in {time.perf_counter() - started_at:.2f}s")
+        return
+
+    if args.command == "show":
+        entry = catalog.get(args.session_id)
+        if entry is None:
+            print(f"❌ {args.session_id} is not in the catalog")
+            sys.exit(1)
+        print(json.dumps(entry, indent=2, ensure_ascii=False))
+        return
+
+    started_at = time.perf_counter()
+    entries = catalog.search(
+        query=getattr(args, "text", None),
+        phase=args.phase,
+        min_turns=args.min_turns,
+        limit=args.limit
+    )
+    print_entries(entries, time.perf_counter() - started_at)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+Empty Session Sweeper
+
+Removes (or archives, then removes) abandoned empty sessions from the active
+session store: sessions without a single user message that were created more
+than --older-than-hours ago. New sessions are only written once they get a
+message, so these are mostly sessions created before that change or sessions
+whose first turn failed.
+
+Archived sessions are written as one JSON file per session (template,
+retrieved scenarios and conversation) into the archive directory.
+
+Usage:
+    python sweep_sessions.py [--older-than-hours H] [--archive DIR] [--dry-run]
+
+Examples:
+    python scripts/sweep_sessions.py --dry-run
+    python scripts/sweep_sessions.py --older-than-hours 48 --archive /tmp/empty-sessions
+    SESSION_BACKEND=sqlite python scripts/sweep_sessions.py
+"""
+
+import argparse
+import sys
+from datetime import datetime, timedelta
+from pathlib import Path
+
+# Add app backend to path
+app_dir = Path(__file__).parent.parent / "app"
+sys.path.insert(0, str(app_dir))
+
+from backend.config import get_config
+from backend.persistence import atomic_write_json
+from backend.resources import get_session_catalog, get_session_store
+from backend.session_store import SessionStore
+
+
+def find_empty_sessions(store: SessionStore, older_than: timedelta) -> list:
+    """
+    Find sessions without user messages created before the cutoff.
+
+    Sessions without a conversation (or without its creation time) are aged
+    by their last write instead, so a session still being set up is never
+    swept.
+
+    Args:
+        store: Session store to scan
+        older_than: Minimum session age
+
+    Returns:
+        List of session IDs
+    """
+    cutoff = datetime.now() - older_than
+    empty = []
+    for session_id in store.list_sessions():
+        conversation, _ = store.read_conversation(session_id)
+        messages = conversation["messages"] if conversation else []
+        if any(m["role"] == "user" for m in messages):
+            continue
+
+        created_at = conversation.get("created_at") if conversation else None
+        if created_at:
+            created = datetime.fromisoformat(created_at)
+        else:
+            updated_at = store.session_updated_at(session_id)
+            if updated_at is None:
+                continue  # Age unknown
+            created = datetime.fromtimestamp(updated_at)
+        if created > cutoff:
+            continue
+        empty.append(session_id)
+    return empty
+
+
+def archive_session(store: SessionStore, session_id: str, archive_dir: Path) -> None:
+    """
+    Write one session's artifacts to <archive_dir>/<session_id>.json.
+
+    Args:
+        store: Session store to read from
+        session_id: Session to archive
+        archive_dir: Archive directory
+    """
+    conversation, _ = store.read_conversation(session_id)
+    atomic_write_json(archive_dir / f"{session_id}.json", {
+        "session_id": session_id,
+        "template": store.read_template(session_id),
+        "retrieved_scenarios": store.read_scenarios(session_id),
+        "conversation": conversation
+    })
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Remove abandoned empty sessions")
+    parser.add_argument("--older-than-hours", type=float, default=24, help="Minimum age of swept sessions")
+    parser.add_argument("--archive", type=Path, help="Archive sessions here before removing them")
+    parser.add_argument("--dry-run", action="store_true", help="Only list what would be removed")
+    args = parser.parse_args()
+
+    config = get_config()
+    store = get_session_store()
+    print(f"🧹 Scanning {config.session_backend} session store")
+
+    empty = find_empty_sessions(store, timedelta(hours=args.older_than_hours))
+    print(f"Found {len(empty)} empty sessions older than {args.older_than_hours:g} hours")
+    if args.dry_run or not empty:
+        for session_id in empty:
+            print(f"  {session_id}")
+        return
+
+    if args.archive:
+        args.archive.mkdir(parents=True, exist_ok=True)
+        for session_id in empty:
+            archive_session(store, session_id, args.archive)
+        print(f"📦 Archived to {args.archive}")
+
+    store.delete_sessions(empty)
+    get_session_catalog().remove(empty)
+    print(f"✅ Removed {len(empty)} sessions")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,43 @@
+"""
+Shared pytest fixtures.
+
+The backend and scripts are imported the way the app and the scripts import
+them (app/ and scripts/ on sys.path). The `config` fixture points every
+persistence path into the test's temporary directory, so tests never touch
+real sessions, catalogs or blobs.
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT_DIR / "app"))
+sys.path.insert(0, str(ROOT_DIR / "scripts"))
+
+from backend.config import get_config  # noqa: E402
+from backend.resources import clear_shared_resources  # noqa: E402
+
+# Config fields holding persistence paths, and their names under tmp_path
+PERSISTENCE_PATHS = {
+    "sessions_dir": "sessions",
+    "sessions_db_path": "sessions.sqlite3",
+    "session_catalog_path": "session_catalog.sqlite3",
+    "prompt_blobs_dir": "prompt_blobs",
+    "archive_dir": "archive",
+    "llm_cache_path": "llm_cache.sqlite3",
+    "embedding_cache_path": "embedding_cache.sqlite3",
+}
+
+
+@pytest.fixture
+def config(tmp_path, monkeypatch):
+    """Global config with isolated persistence paths and synchronous session writes."""
+    config = get_config()
+    for field, name in PERSISTENCE_PATHS.items():
+        monkeypatch.setattr(config, field, str(tmp_path / name))
+    monkeypatch.setattr(config, "write_behind", False)
+    clear_shared_resources()
+    yield config
+    clear_shared_resources()
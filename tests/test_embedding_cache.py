@@ -0,0 +1,139 @@
+"""Persistent embedding cache: LRU bound, request coalescing and cache keys."""
+
+import threading
+import time
+
+import pytest
+
+from backend import embedding_cache
+from backend.embedding_cache import CachedEmbeddings, EmbeddingCache
+
+
+class Clock:
+    """Stand-in for the time module that advances one second per call."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def time(self):
+        self.now += 1
+        return self.now
+
+
+class CountingEmbeddings:
+    """Embedding model stand-in that counts calls and can block until released."""
+
+    def __init__(self, block=False, error=None):
+        self.calls = []
+        self.started = threading.Event()
+        self.release = threading.Event()
+        if not block:
+            self.release.set()
+        self.error = error
+
+    def embed_query(self, text):
+        self.calls.append(text)
+        self.started.set()
+        self.release.wait(5)
+        if self.error:
+            raise self.error
+        return [float(len(text)), 1.0]
+
+    def embed_documents(self, texts):
+        self.calls.extend(texts)
+        return [[float(len(text)), 0.0] for text in texts]
+
+
+@pytest.fixture
+def cache(tmp_path, monkeypatch):
+    monkeypatch.setattr(embedding_cache, "time", Clock())
+    return EmbeddingCache(str(tmp_path / "embedding_cache.sqlite3"), max_entries=2)
+
+
+def test_least_recently_used_entry_is_evicted(cache):
+    embeddings = CachedEmbeddings(CountingEmbeddings(), cache, "model-a")
+    embeddings.embed_query("first")
+    embeddings.embed_query("second")
+    embeddings.embed_query("first")  # Hit: "second" is now the oldest
+    embeddings.embed_query("third")
+
+    assert cache.stats()["evictions"] == 1
+    assert cache.stats()["entries"] == 2
+    keys = [cache.make_key("model-a", "query", text) for text in ("first", "second", "third")]
+    assert set(cache.get_many(keys)) == {keys[0], keys[2]}
+
+
+def test_vectors_survive_reopening(tmp_path):
+    path = str(tmp_path / "embedding_cache.sqlite3")
+    CachedEmbeddings(CountingEmbeddings(), EmbeddingCache(path, 10), "model-a").embed_query("child")
+
+    model = CountingEmbeddings()
+    assert CachedEmbeddings(model, EmbeddingCache(path, 10), "model-a").embed_query("child") == [5.0, 1.0]
+    assert model.calls == []
+
+
+def test_keys_separate_models_and_call_kinds_but_not_whitespace(cache):
+    cache.max_entries = 10
+    model = CountingEmbeddings()
+    embeddings_a = CachedEmbeddings(model, cache, "model-a")
+    embeddings_b = CachedEmbeddings(model, cache, "model-b")
+
+    embeddings_a.embed_query("weak  pencil grip")
+    embeddings_a.embed_query(" weak pencil\ngrip ")
+    assert len(model.calls) == 1
+
+    embeddings_b.embed_query("weak pencil grip")
+    assert len(model.calls) == 2
+
+    assert embeddings_a.embed_documents(["weak pencil grip"]) == [[16.0, 0.0]]
+    assert len(model.calls) == 3
+
+
+def test_concurrent_misses_are_embedded_once(cache):
+    model = CountingEmbeddings(block=True)
+    embeddings = CachedEmbeddings(model, cache, "model-a")
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(embeddings.embed_query("child"))) for _ in range(2)]
+
+    threads[0].start()
+    assert model.started.wait(5)
+    threads[1].start()
+    deadline = time.monotonic() + 5
+    while cache.coalesced < 1 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    model.release.set()
+    for thread in threads:
+        thread.join(5)
+
+    assert model.calls == ["child"]
+    assert results == [[5.0, 1.0], [5.0, 1.0]]
+    assert cache.stats()["coalesced"] == 1
+    assert embeddings._in_flight == {}
+
+
+def test_failed_embedding_is_raised_to_waiters_and_retried(cache):
+    model = CountingEmbeddings(block=True, error=ConnectionError("embedding API unreachable"))
+    embeddings = CachedEmbeddings(model, cache, "model-a")
+    errors = []
+
+    def embed():
+        try:
+            embeddings.embed_query("child")
+        except ConnectionError as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=embed) for _ in range(2)]
+    threads[0].start()
+    assert model.started.wait(5)
+    threads[1].start()
+    deadline = time.monotonic() + 5
+    while cache.coalesced < 1 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    model.release.set()
+    for thread in threads:
+        thread.join(5)
+
+    assert len(errors) == 2
+    assert embeddings._in_flight == {}
+    model.error = None
+    assert embeddings.embed_query("child") == [5.0, 1.0]
@@ -0,0 +1,74 @@
+"""Local fast-path extraction: what the patterns may fill and when the LLM is skipped."""
+
+import pytest
+
+from backend.tools import Template, fast_path_extract
+
+
+@pytest.mark.parametrize("message, age", [
+    ("He is 7 and struggles with handwriting", "7"),
+    ("She's 15.", "15"),
+    ("A 7-year-old boy with ADHD", "7"),
+    ("the patient is 82 years old", "82"),
+    ("הוא בן 7 ומתקשה בכתיבה", "7"),
+    ("בת 16", "16"),
+])
+def test_patient_age_from_patient_phrasing(message, age):
+    result = fast_path_extract(message, Template(), [])
+    assert result.fields["patient_age"] == age
+
+
+@pytest.mark.parametrize("message", [
+    "I have 5 years of experience",
+    "I've known him for 2 years",
+    "He is 3 weeks into treatment",
+    "The symptoms started בגיל 5",
+])
+def test_unrelated_numbers_do_not_fill_patient_age(message):
+    result = fast_path_extract(message, Template(), [])
+    assert "patient_age" not in result.fields
+
+
+def test_bare_number_fills_age_only_after_an_age_question():
+    assert fast_path_extract("7", Template(), [], last_question="How old is the child?").fields == {
+        "patient_age": "7"
+    }
+    assert "patient_age" not in fast_path_extract("7", Template(), [], last_question="How many sessions?").fields
+
+
+@pytest.mark.parametrize("message", [
+    "We meet after school on Tuesdays",
+    "He has trouble keeping up at school",
+    "הוא לומד בבית ספר רגיל",
+])
+def test_mentioning_school_does_not_fill_treatment_setting(message):
+    result = fast_path_extract(message, Template(), [])
+    assert "treatment_setting" not in result.fields
+
+
+@pytest.mark.parametrize("message", [
+    "I work as a school-based OT",
+    "Treatment is in the school setting",
+    "אני עובדת במסגרת בית ספר",
+])
+def test_school_setting_phrasing_fills_treatment_setting(message):
+    result = fast_path_extract(message, Template(), [])
+    assert result.fields["treatment_setting"] == "School"
+
+
+def test_filled_fields_are_not_overwritten():
+    result = fast_path_extract("He is 9", Template(patient_age="8"), [])
+    assert "patient_age" not in result.fields
+
+
+def test_words_from_assistant_questions_count_as_novel():
+    # The assistant asked about handwriting; the user confirming it is a new fact
+    result = fast_path_extract("handwriting difficulties", Template(), ["my client"])
+    assert result.call_llm
+    assert result.novelty == 1.0
+
+
+def test_repeated_user_content_skips_the_llm():
+    result = fast_path_extract("handwriting difficulties", Template(), ["he has handwriting difficulties"])
+    assert not result.call_llm
+    assert result.reason == "repeated content"
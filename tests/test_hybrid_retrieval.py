@@ -0,0 +1,132 @@
+"""Hybrid dense + BM25 scenario ranking."""
+
+import numpy as np
+import pytest
+
+from backend import lexical_index, rag_retriever
+from backend.lexical_index import BM25Index, reciprocal_rank_fusion, tokenize
+from backend.rag_retriever import ScenarioRetriever
+from backend.vector_index import NumpyVectorIndex
+
+SCENARIOS = [
+    {"id": "s0", "title": "Grip", "content": "A child with a weak pencil grip and poor posture at the desk."},
+    {"id": "s1", "title": "Stroke", "content": "An adult after a stroke relearning dressing at home."},
+    {"id": "s2", "title": "Single parent", "content": "Family of a single parent, משפחה חד הורית, and sleep routines."},
+    {"id": "s3", "title": "Anxiety", "content": "A teenager with anxiety avoiding the school canteen."},
+]
+
+
+class FakeEmbeddings:
+    """Embeds every query next to scenario s0, or fails like an unreachable API."""
+
+    def __init__(self, fail=False):
+        self.fail = fail
+
+    def embed_query(self, text):
+        if self.fail:
+            raise ConnectionError("embedding API unreachable")
+        return [1.0, 0.1, 0.0, 0.0]
+
+
+@pytest.fixture
+def make_retriever(config, monkeypatch):
+    def make(fail=False, metadata=None, mode="boost"):
+        monkeypatch.setattr(config, "vector_backend", "numpy")
+        monkeypatch.setattr(config, "hybrid_retrieval", True)
+        monkeypatch.setattr(config, "scenario_metadata_mode", mode if metadata else "off")
+        monkeypatch.setattr(config, "top_k_scenarios", 2)
+        documents = [{**scenario, "metadata": {"id": scenario["id"]}} for scenario in SCENARIOS]
+        vector_index = NumpyVectorIndex(np.eye(4, dtype=np.float32), documents, "l2")
+        monkeypatch.setattr(rag_retriever, "get_embeddings", lambda: FakeEmbeddings(fail))
+        monkeypatch.setattr(rag_retriever, "get_vector_index", lambda: vector_index)
+        monkeypatch.setattr(rag_retriever, "get_lexical_index", lambda: BM25Index().build(SCENARIOS))
+        monkeypatch.setattr(rag_retriever, "get_scenario_metadata", lambda: metadata)
+        return ScenarioRetriever()
+    return make
+
+
+def test_rrf_prefers_documents_ranked_by_both_lists():
+    fused = reciprocal_rank_fusion([["a", "b"], ["c", "b"]], k=60)
+    assert fused[0][0] == "b"
+    assert fused[0][1] == pytest.approx(2 / 62)
+
+
+def test_hebrew_prefixes_are_stripped():
+    assert "מטופל" in tokenize("והמטופל")
+    assert "חד_הורית" in tokenize("משפחה חד הורית")
+
+
+def test_search_only_scores_allowed_rows():
+    index = BM25Index().build(SCENARIOS)
+    assert sorted(row for row, _ in index.search("stroke anxiety", 4)) == [1, 3]
+    assert [row for row, _ in index.search("stroke anxiety", 4, rows=[3, 0])] == [3]
+
+
+def test_index_saved_with_other_stopwords_is_rejected(tmp_path, monkeypatch):
+    path = str(tmp_path / "bm25_index.json")
+    BM25Index().build(SCENARIOS).save(path)
+    assert BM25Index.load(path).search("stroke", 1) == BM25Index().build(SCENARIOS).search("stroke", 1)
+
+    monkeypatch.setattr(lexical_index, "LEXICAL_STOPWORDS", lexical_index.LEXICAL_STOPWORDS | {"stroke"})
+    with pytest.raises(ValueError, match="stopwords"):
+        BM25Index.load(path)
+
+
+def test_hybrid_returns_dense_and_lexical_matches(make_retriever):
+    retriever = make_retriever()
+    scenarios = retriever.retrieve_scenarios("חד הורית family")
+
+    assert {scenario["id"] for scenario in scenarios} == {"s0", "s2"}
+    assert all(scenario["retrieval"] == "hybrid" for scenario in scenarios)
+    by_id = {scenario["id"]: scenario for scenario in scenarios}
+    assert by_id["s0"]["similarity_score"] is not None  # Found by the dense side
+    assert by_id["s2"]["lexical_score"] > 0
+
+
+def test_lexical_fallback_when_embeddings_fail(make_retriever):
+    retriever = make_retriever(fail=True)
+    scenarios = retriever.retrieve_scenarios("חד הורית family")
+
+    assert scenarios[0]["id"] == "s2"
+    assert scenarios[0]["retrieval"] == "lexical"
+    assert scenarios[0]["similarity_score"] is None
+
+
+def test_metadata_boost_reorders_candidates(make_retriever):
+    metadata = {
+        scenario["id"]: {"buckets": {"age_range": "adolescent" if scenario["id"] == "s3" else "adult"}}
+        for scenario in SCENARIOS
+    }
+    query = "anxiety canteen pencil grip"
+    plain = make_retriever().retrieve_scenarios(query)
+    boosted = make_retriever(metadata=metadata).retrieve_scenarios(query, {"patient_age": "15"})
+
+    assert plain[0]["id"] == "s0"  # Dense and lexical both rank s0 first
+    assert boosted[0]["id"] == "s3"
+
+
+FILTER_METADATA = {
+    "s0": {"buckets": {"age_range": "child", "setting": "school"}},
+    "s1": {"buckets": {"age_range": "adult", "setting": "home"}},
+    "s2": {"buckets": {"age_range": "adult", "setting": "home"}},
+    "s3": {"buckets": {"age_range": "adolescent", "setting": "school"}},
+}
+
+
+def test_metadata_filter_relaxes_before_searching_everything(make_retriever):
+    retriever = make_retriever(metadata=FILTER_METADATA, mode="filter")
+
+    assert retriever._metadata_plan({"patient_age": "40", "treatment_setting": "home visits"})[0] == ["s1", "s2"]
+    # No exact match: any shared bucket
+    assert retriever._metadata_plan({"patient_age": "8", "treatment_setting": "home"})[0] == ["s0", "s1", "s2"]
+    # Fewer than top_k sharing a bucket: all scenarios
+    assert retriever._metadata_plan({"patient_age": "80", "treatment_setting": "school"})[0] == ["s0", "s3"]
+    assert retriever._metadata_plan({"patient_age": "80", "treatment_setting": "clinic"})[0] is None
+
+
+def test_metadata_filter_with_one_match_still_returns_top_k(make_retriever):
+    retriever = make_retriever(metadata=FILTER_METADATA, mode="filter")
+    template = {"patient_age": "15", "treatment_setting": "private clinic"}
+
+    assert retriever._metadata_plan(template)[0] is None
+    assert len(retriever.retrieve_scenarios("pencil grip", template)) == 2
@@ -0,0 +1,69 @@
+"""Incremental template extraction: only new messages are sent, across resumes."""
+
+import pytest
+from langchain_core.messages import AIMessage, HumanMessage
+
+from backend.conversation_manager import ConversationManager, TemplateExtraction
+from backend.prompts import TEMPLATE_EXTRACTION_PROMPT
+
+
+class FakeExtractionModel:
+    """Extraction model stand-in that records the messages of every call."""
+
+    def __init__(self):
+        self.calls = []
+
+    def invoke(self, messages):
+        self.calls.append(messages)
+        return TemplateExtraction(patient_age="7")
+
+
+@pytest.fixture
+def extraction_model(monkeypatch):
+    model = FakeExtractionModel()
+    monkeypatch.setattr(ConversationManager, "extraction_model", model)
+    return model
+
+
+def exchange(manager, question, answer):
+    manager.messages.append(HumanMessage(content=question))
+    manager.messages.append(AIMessage(content=answer))
+    manager._extract_template_fields()
+
+
+def sent_dialogue(call):
+    return [msg.content for msg in call[1:]]
+
+
+@pytest.mark.parametrize("state_snapshots", [True, False])
+def test_only_messages_since_last_extraction_are_sent(config, extraction_model, monkeypatch, state_snapshots):
+    monkeypatch.setattr(config, "extraction_mode", "incremental")
+    monkeypatch.setattr(config, "full_extraction_interval", 5)
+    monkeypatch.setattr(config, "state_snapshots", state_snapshots)
+    manager = ConversationManager()
+
+    exchange(manager, "He is 7", "What brings him to OT?")
+    exchange(manager, "Handwriting at school", "How is his grip?")
+    first, second = extraction_model.calls
+    assert first[0].content == TEMPLATE_EXTRACTION_PROMPT  # First extraction reads everything
+    assert second[0].content != TEMPLATE_EXTRACTION_PROMPT
+    assert sent_dialogue(second) == ["Handwriting at school", "How is his grip?"]
+    assert manager.template.patient_age == "7"
+
+    manager._save_state()
+    resumed = ConversationManager(manager.get_session_id())
+    assert resumed._extracted_upto == manager._extracted_upto == len(manager.messages)
+
+    exchange(resumed, "A weak pencil grip", "Does he tire quickly?")
+    assert sent_dialogue(extraction_model.calls[-1]) == ["A weak pencil grip", "Does he tire quickly?"]
+
+
+def test_every_nth_extraction_rereads_the_conversation(config, extraction_model, monkeypatch):
+    monkeypatch.setattr(config, "extraction_mode", "incremental")
+    monkeypatch.setattr(config, "full_extraction_interval", 2)
+    manager = ConversationManager()
+
+    for i in range(3):
+        exchange(manager, f"question {i}", f"answer {i}")
+    assert [len(sent_dialogue(call)) for call in extraction_model.calls] == [2, 2, 6]
+    assert extraction_model.calls[2][0].content == TEMPLATE_EXTRACTION_PROMPT
@@ -0,0 +1,127 @@
+"""Opt-in LLM response cache."""
+
+import os
+import subprocess
+import sys
+
+from langchain_core.messages import AIMessage, AIMessageChunk, HumanMessage, SystemMessage
+from pydantic import BaseModel
+
+from backend import resources
+from backend.llm_cache import CachedChatModel, CachedStructuredModel, LLMResponseCache
+from backend.resources import get_chat_model, get_extraction_model
+
+MESSAGES = [SystemMessage(content="You are an OT mentor."), HumanMessage(content="He is 7")]
+
+
+class FakeChatModel:
+    """Chat model stand-in that numbers its replies."""
+
+    def __init__(self):
+        self.calls = 0
+
+    def invoke(self, messages):
+        self.calls += 1
+        return AIMessage(content=f"reply {self.calls}")
+
+    def stream(self, messages):
+        self.calls += 1
+        yield AIMessageChunk(content="re")
+        yield AIMessageChunk(content=f"ply {self.calls}")
+
+    def with_structured_output(self, schema):
+        return FakeStructuredModel(schema)
+
+
+class FakeStructuredModel:
+    def __init__(self, schema):
+        self.schema = schema
+        self.calls = 0
+
+    def invoke(self, messages):
+        self.calls += 1
+        return self.schema(patient_age="7")
+
+
+class Extraction(BaseModel):
+    patient_age: str = ""
+
+
+def make_cache(tmp_path):
+    return LLMResponseCache(str(tmp_path / "llm_cache.sqlite3"), max_bytes=1024 * 1024)
+
+
+def test_repeated_call_is_a_hit(tmp_path):
+    cache = make_cache(tmp_path)
+    model = FakeChatModel()
+    cached = CachedChatModel(model, cache, "gemini-2.5-flash", 0.7)
+
+    assert cached.invoke(MESSAGES).content == "reply 1"
+    assert cached.invoke(MESSAGES).content == "reply 1"
+    assert cached.invoke(MESSAGES + [HumanMessage(content="He has ADHD")]).content == "reply 2"
+    assert model.calls == 2
+    assert (cache.stats()["hits"], cache.stats()["misses"]) == (1, 2)
+
+
+def test_key_depends_on_kind_model_temperature_and_messages():
+    key = LLMResponseCache.make_key("chat", "gemini-2.5-flash", 0.7, MESSAGES)
+    assert LLMResponseCache.make_key("chat", "gemini-2.5-flash", 0.7, list(MESSAGES)) == key
+    assert LLMResponseCache.make_key("chat", "gemini-2.5-pro", 0.7, MESSAGES) != key
+    assert LLMResponseCache.make_key("chat", "gemini-2.5-flash", 0.0, MESSAGES) != key
+    assert LLMResponseCache.make_key("structured:Extraction", "gemini-2.5-flash", 0.7, MESSAGES) != key
+    assert LLMResponseCache.make_key("chat", "gemini-2.5-flash", 0.7, MESSAGES[1:]) != key
+
+
+def test_models_with_other_temperature_do_not_share_entries(tmp_path):
+    cache = make_cache(tmp_path)
+    model = FakeChatModel()
+    CachedChatModel(model, cache, "gemini-2.5-flash", 0.7).invoke(MESSAGES)
+
+    assert CachedChatModel(model, cache, "gemini-2.5-flash", 0.0).invoke(MESSAGES).content == "reply 2"
+    assert CachedChatModel(model, cache, "gemini-2.5-pro", 0.7).invoke(MESSAGES).content == "reply 3"
+    assert CachedChatModel(model, cache, "gemini-2.5-flash", 0.7).invoke(MESSAGES).content == "reply 1"
+
+
+def test_only_complete_streams_are_cached(tmp_path):
+    cache = make_cache(tmp_path)
+    model = FakeChatModel()
+    cached = CachedChatModel(model, cache, "gemini-2.5-flash", 0.7)
+
+    next(cached.stream(MESSAGES))  # Abandoned after the first chunk
+    assert cache.stats()["entries"] == 0
+
+    assert "".join(chunk.content for chunk in cached.stream(MESSAGES)) == "reply 2"
+    assert [chunk.content for chunk in cached.stream(MESSAGES)] == ["reply 2"]
+    assert model.calls == 2
+
+
+def test_structured_hit_returns_the_schema(tmp_path):
+    cache = make_cache(tmp_path)
+    model = FakeStructuredModel(Extraction)
+    cached = CachedStructuredModel(model, Extraction, cache, "gemini-2.5-flash", 0.7)
+
+    cached.invoke(MESSAGES)
+    assert cached.invoke(MESSAGES) == Extraction(patient_age="7")
+    assert model.calls == 1
+
+
+def test_cache_is_off_unless_enabled():
+    env = {name: value for name, value in os.environ.items() if name != "LLM_CACHE_ENABLED"}
+    result = subprocess.run(
+        [sys.executable, "-c", "from backend.config import get_config; print(get_config().llm_cache_enabled)"],
+        cwd=os.path.join(os.path.dirname(os.path.dirname(__file__)), "app"),
+        env=env, capture_output=True, text=True, check=True
+    )
+    assert result.stdout.strip() == "False"
+
+
+def test_models_are_wrapped_only_when_enabled(config, monkeypatch):
+    monkeypatch.setattr(resources, "_get_base_chat_model", lambda temperature: FakeChatModel())
+    monkeypatch.setattr(config, "llm_cache_enabled", False)
+    assert isinstance(get_chat_model(), FakeChatModel)
+    assert isinstance(get_extraction_model(Extraction), FakeStructuredModel)
+    assert not os.path.exists(config.llm_cache_path)
+
+    monkeypatch.setattr(config, "llm_cache_enabled", True)
+    assert isinstance(get_chat_model(), CachedChatModel)
+    assert isinstance(get_extraction_model(Extraction), CachedStructuredModel)
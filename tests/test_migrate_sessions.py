@@ -0,0 +1,84 @@
+"""Copying sessions between the files and SQLite backends."""
+
+import hashlib
+
+import pytest
+
+from backend.session_store import FileSessionStore, SessionStore, SQLiteSessionStore
+from migrate_sessions import migrate_session
+
+PROMPT = "You are an OT mentor."
+DIGEST = hashlib.sha256(PROMPT.encode("utf-8")).hexdigest()
+
+
+@pytest.fixture
+def files_store(tmp_path):
+    return FileSessionStore(str(tmp_path / "sessions"), str(tmp_path / "blobs"))
+
+
+@pytest.fixture
+def sqlite_store(tmp_path):
+    return SQLiteSessionStore(str(tmp_path / "sessions.sqlite3"))
+
+
+def save_session(store, session_id="s1", turns=3, transitioned=True):
+    store.create_session(session_id)
+    store.write_blob(DIGEST, PROMPT)
+    store.write_template(session_id, {"patient_age": "7", "diagnosis": "DCD"})
+    if transitioned:
+        store.write_scenarios(session_id, [{"id": "sc1", "title": "Handwriting", "similarity_score": 0.4}])
+    store.write_conversation(session_id, {
+        "session_id": session_id,
+        "created_at": "2026-01-01T10:00:00",
+        "phase_transition_at": None,
+        "model": "gemini",
+        "messages": [{"role": "system", "ref": {"hash": DIGEST}}],
+    })
+    store.append_conversation(session_id, [
+        {"op": "message", "role": role, "content": f"{role} {i}"}
+        for i in range(turns) for role in ("user", "assistant")
+    ])
+    store.write_state_snapshot(session_id, b"snapshot")
+
+
+def session_artifacts(store, session_id="s1"):
+    conversation, _ = store.read_conversation(session_id)
+    return {
+        "template": store.read_template(session_id),
+        "scenarios": store.read_scenarios(session_id),
+        "messages": conversation["messages"],
+        "created_at": conversation["created_at"],
+        "model": conversation["model"],
+        "state_snapshot": store.read_state_snapshot(session_id),
+    }
+
+
+def test_files_to_sqlite_and_back(tmp_path, files_store, sqlite_store):
+    save_session(files_store)
+    expected = session_artifacts(files_store)
+
+    assert migrate_session(files_store, sqlite_store, "s1") == 7
+    assert session_artifacts(sqlite_store) == expected
+    assert sqlite_store.read_blob(DIGEST) == PROMPT
+
+    files_copy = FileSessionStore(str(tmp_path / "copy"), str(tmp_path / "copy-blobs"))
+    migrate_session(sqlite_store, files_copy, "s1")
+    assert session_artifacts(files_copy) == expected
+    assert files_copy.read_blob(DIGEST) == PROMPT
+
+
+def test_overwrite_replaces_the_whole_target_session(files_store, sqlite_store):
+    save_session(sqlite_store, turns=5)
+    save_session(files_store, turns=2, transitioned=False)
+    files_store.delete_state_snapshot("s1")
+    migrate_session(files_store, sqlite_store, "s1")
+
+    # Nothing of the old target session survives: no snapshot, no scenarios
+    assert sqlite_store.read_state_snapshot("s1") is None
+    assert sqlite_store.read_scenarios("s1") is None
+    assert session_artifacts(sqlite_store) == session_artifacts(files_store)
+
+
+def test_session_store_is_abstract():
+    with pytest.raises(TypeError):
+        SessionStore()
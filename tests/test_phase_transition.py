@@ -0,0 +1,79 @@
+"""Phase transition with a background scenario pre-retrieval."""
+
+import asyncio
+import threading
+from concurrent.futures import Future
+
+import pytest
+
+from backend import conversation_manager as conversation_manager_module
+from backend.conversation_manager import ConversationManager
+from backend.tools import generate_conversation_summary
+
+SCENARIO = {"id": "s1", "title": "Handwriting", "content": "A scenario.", "similarity_score": 0.9}
+
+
+class FakeRetriever:
+    def __init__(self):
+        self.calls = 0
+
+    def retrieve_scenarios(self, query_text, template=None):
+        self.calls += 1
+        return [SCENARIO]
+
+    async def aretrieve_scenarios(self, query_text, template=None):
+        return self.retrieve_scenarios(query_text, template)
+
+
+@pytest.fixture
+def retriever(monkeypatch):
+    retriever = FakeRetriever()
+    monkeypatch.setattr(conversation_manager_module, "get_scenario_retriever", lambda: retriever)
+    return retriever
+
+
+def manager_with_prefetch(future):
+    manager = ConversationManager()
+    manager._prefetch = (generate_conversation_summary(manager.template), future)
+    return manager
+
+
+def pending_failure():
+    # Still running when the transition claims it, fails afterwards
+    future = Future()
+    future.set_running_or_notify_cancel()
+    return future
+
+
+def test_failed_prefetch_falls_back_to_retrieval(config, retriever):
+    future = pending_failure()
+    manager = manager_with_prefetch(future)
+    threading.Timer(0.05, future.set_exception, [RuntimeError("Chroma unavailable")]).start()
+
+    assert manager._execute_phase_transition() == [SCENARIO]
+    assert retriever.calls == 1
+    assert manager.phase == "MENTORING"
+
+
+def test_async_failed_prefetch_falls_back_to_retrieval(config, retriever):
+    future = pending_failure()
+    manager = manager_with_prefetch(future)
+
+    async def transition():
+        task = asyncio.ensure_future(manager._aexecute_phase_transition())
+        await asyncio.sleep(0)
+        future.set_exception(RuntimeError("Chroma unavailable"))
+        return await task
+
+    assert asyncio.run(transition()) == [SCENARIO]
+    assert retriever.calls == 1
+    assert manager.phase == "MENTORING"
+
+
+def test_successful_prefetch_is_reused(config, retriever):
+    future = Future()
+    future.set_result([SCENARIO])
+    manager = manager_with_prefetch(future)
+
+    assert manager._execute_phase_transition() == [SCENARIO]
+    assert retriever.calls == 0
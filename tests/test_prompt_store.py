@@ -0,0 +1,55 @@
+"""Shared prompt blobs and their in-memory cache."""
+
+from backend.prompt_store import PromptStore
+from backend.session_store import FileSessionStore
+
+
+class CountingStore(FileSessionStore):
+    def __init__(self, *args):
+        super().__init__(*args)
+        self.blob_writes = 0
+        self.blob_reads = 0
+
+    def write_blob(self, digest, content):
+        self.blob_writes += 1
+        super().write_blob(digest, content)
+
+    def read_blob(self, digest):
+        self.blob_reads += 1
+        return super().read_blob(digest)
+
+
+def make_store(tmp_path):
+    return CountingStore(str(tmp_path / "sessions"), str(tmp_path / "blobs"))
+
+
+def test_cached_prompt_is_written_once(tmp_path):
+    store = make_store(tmp_path)
+    prompts = PromptStore(store)
+    ref = prompts.put("base prompt")
+    assert prompts.put("base prompt") == ref
+    assert prompts.get(ref) == "base prompt"
+    assert store.blob_writes == 1
+    assert store.blob_reads == 0
+
+
+def test_cache_is_bounded_and_evicted_prompts_are_read_back(tmp_path):
+    store = make_store(tmp_path)
+    prompts = PromptStore(store, cache_entries=3)
+    refs = [prompts.put(f"scenario context of session {i}") for i in range(10)]
+
+    assert len(prompts._contents) == 3
+    assert prompts.get(refs[0]) == "scenario context of session 0"
+    assert store.blob_reads == 1
+
+
+def test_recently_used_prompt_stays_cached(tmp_path):
+    store = make_store(tmp_path)
+    prompts = PromptStore(store, cache_entries=2)
+    base = prompts.put("base prompt")
+    prompts.put("context 1")
+    prompts.get(base)
+    prompts.put("context 2")  # Evicts "context 1", not the base prompt
+
+    assert prompts.get(base) == "base prompt"
+    assert store.blob_reads == 0
@@ -0,0 +1,70 @@
+"""Shared resource registry."""
+
+import threading
+
+from backend import resources
+from backend.resources import _get_or_create, clear_shared_resources, get_background_executor, get_dense_executor
+
+
+def test_slow_factory_does_not_block_other_resources(config):
+    building = threading.Event()
+    release = threading.Event()
+
+    def slow_factory():
+        building.set()
+        release.wait(5)
+        return "slow"
+
+    thread = threading.Thread(target=_get_or_create, args=("slow", slow_factory))
+    thread.start()
+    assert building.wait(5)
+
+    # Built while the slow factory is still running
+    assert _get_or_create("fast", lambda: "fast") == "fast"
+
+    release.set()
+    thread.join(5)
+    assert _get_or_create("slow", lambda: "other") == "slow"
+
+
+def test_concurrent_callers_share_one_instance(config):
+    calls = []
+    start = threading.Barrier(8)
+
+    def factory():
+        calls.append(1)
+        return object()
+
+    results = []
+
+    def get():
+        start.wait(5)
+        results.append(_get_or_create("shared", factory))
+
+    threads = [threading.Thread(target=get) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(5)
+
+    assert len(calls) == 1
+    assert len({id(result) for result in results}) == 1
+
+
+def test_background_executor_uses_configured_workers(config, monkeypatch):
+    monkeypatch.setattr(config, "background_workers", 2)
+    executor = get_background_executor()
+    assert executor._max_workers == 2
+
+    clear_shared_resources()
+    assert resources._resources == {}
+    assert executor._shutdown
+
+
+def test_clear_shuts_down_the_dense_search_pool(config):
+    executor = get_dense_executor()
+    assert get_dense_executor() is executor
+
+    clear_shared_resources()
+    assert executor._shutdown
+    assert get_dense_executor() is not executor
@@ -0,0 +1,41 @@
+"""Bucketing template values for metadata retrieval."""
+
+import pytest
+
+from backend.scenario_metadata import age_bucket, diagnosis_family, setting_bucket
+
+
+@pytest.mark.parametrize("setting, bucket", [
+    ("hospital ward", "hospital"),
+    ("hospitalized in internal medicine", "hospital"),
+    ("psychiatric day unit", "psychiatric"),
+    ("home visits", "home"),
+    ("ביקור בבית המטופל", "home"),
+    ("בית הספר היסודי", "school"),
+    ("outreach toward the family", None),
+    ("awkward seating in the office", None),
+    ("homework club", None),
+])
+def test_setting_keywords_match_whole_words(setting, bucket):
+    assert setting_bucket(setting) == bucket
+
+
+@pytest.mark.parametrize("diagnosis, family", [
+    ("ASD", "neurodevelopmental"),
+    ("autistic traits", "neurodevelopmental"),
+    ("OCD", "mental_health"),
+    ("moderate TBI", "neurological"),
+    ("Parkinson's disease", "neurological"),
+    ("depression", "mental_health"),
+    ("immigrated from Tbilisi", "other"),
+    ("headaches, takes Vasdil", "other"),
+])
+def test_abbreviations_do_not_match_inside_words(diagnosis, family):
+    assert diagnosis_family(diagnosis) == family
+
+
+def test_age_words():
+    assert age_bucket("teenager") == "adolescent"
+    assert age_bucket("kids") == "child"
+    assert age_bucket("בן 16") == "adolescent"
+    assert age_bucket("unknown") is None
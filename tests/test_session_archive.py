@@ -0,0 +1,94 @@
+"""Archiving cold sessions into compressed bundles and restoring them."""
+
+import hashlib
+
+import pytest
+from langchain_core.messages import AIMessage, HumanMessage
+
+from backend.conversation_manager import ConversationManager
+from backend.resources import get_session_archive, get_session_store
+from backend.session_archive import SessionArchive
+from backend.session_store import FileSessionStore, SQLiteSessionStore
+
+PROMPT = "You are an OT mentor."
+DIGEST = hashlib.sha256(PROMPT.encode("utf-8")).hexdigest()
+
+
+def open_store(backend, tmp_path):
+    if backend == "sqlite":
+        return SQLiteSessionStore(str(tmp_path / "sessions.sqlite3"))
+    return FileSessionStore(str(tmp_path / "sessions"), str(tmp_path / "blobs"))
+
+
+def save_session(store, session_id="s1"):
+    store.create_session(session_id)
+    store.write_blob(DIGEST, PROMPT)
+    store.write_template(session_id, {"patient_age": "7", "diagnosis": "DCD"})
+    store.write_scenarios(session_id, [{"id": "sc1", "title": "Handwriting", "similarity_score": 0.4}])
+    store.write_conversation(session_id, {
+        "session_id": session_id,
+        "created_at": "2026-01-01T10:00:00",
+        "phase_transition_at": "2026-01-01T10:20:00",
+        "model": "gemini",
+        "messages": [{"role": "system", "ref": {"hash": DIGEST}}],
+    })
+    store.append_conversation(session_id, [
+        {"op": "message", "role": "user", "content": "He is 7"},
+        {"op": "message", "role": "assistant", "content": "What does his handwriting look like?"},
+    ])
+
+
+def session_artifacts(store, session_id="s1"):
+    conversation, _ = store.read_conversation(session_id)
+    return {
+        "template": store.read_template(session_id),
+        "scenarios": store.read_scenarios(session_id),
+        "conversation": conversation,
+    }
+
+
+@pytest.mark.parametrize("backend", ["files", "sqlite"])
+def test_archive_and_restore_round_trip(tmp_path, backend):
+    store = open_store(backend, tmp_path)
+    save_session(store)
+    expected = session_artifacts(store)
+    archive = SessionArchive(str(tmp_path / "archive"), codec="gzip")
+
+    raw_size, compressed_size = archive.archive(store, "s1")
+    assert compressed_size < raw_size
+    assert not store.session_exists("s1")
+    assert archive.list_sessions() == ["s1"]
+    assert archive.read("s1")["blobs"] == {DIGEST: PROMPT}
+
+    assert archive.restore(store, "s1")
+    assert session_artifacts(store) == expected
+    assert not archive.contains("s1")
+    assert not archive.restore(store, "s1")
+
+
+def test_bundle_restores_into_a_store_without_the_prompt_blobs(tmp_path):
+    source = open_store("files", tmp_path / "source")
+    save_session(source)
+    archive = SessionArchive(str(tmp_path / "archive"), codec="gzip")
+    archive.archive(source, "s1")
+
+    target = open_store("sqlite", tmp_path)
+    archive.restore(target, "s1")
+    assert target.read_blob(DIGEST) == PROMPT
+    assert session_artifacts(target)["conversation"]["messages"][0] == {"role": "system", "ref": {"hash": DIGEST}}
+
+
+def test_resuming_an_archived_session_restores_it(config):
+    manager = ConversationManager()
+    manager.messages.append(HumanMessage(content="He is 7"))
+    manager.messages.append(AIMessage(content="What does his handwriting look like?"))
+    manager._save_state()
+    session_id = manager.get_session_id()
+
+    get_session_archive().archive(get_session_store(), session_id)
+    assert not get_session_store().session_exists(session_id)
+
+    resumed = ConversationManager(session_id)
+    assert [msg.content for msg in resumed.messages] == [msg.content for msg in manager.messages]
+    assert get_session_store().session_exists(session_id)
+    assert not get_session_archive().contains(session_id)
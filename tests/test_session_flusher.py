@@ -0,0 +1,53 @@
+"""Write-behind flushing: reads must see writes the background thread is still flushing."""
+
+import threading
+
+from backend.persistence import SessionFlusher
+
+
+class SlowSession:
+    """Session manager stand-in whose flush blocks until released."""
+
+    session_id = "s1"
+
+    def __init__(self):
+        self.flush_lock = threading.Lock()  # Serializes flushes, like SessionManager
+        self.flush_started = threading.Event()
+        self.release = threading.Event()
+        self.pending = True
+        self.written = False
+
+    def flush(self):
+        with self.flush_lock:
+            if not self.pending:
+                return
+            self.pending = False
+            self.flush_started.set()
+            self.release.wait(5)
+            self.written = True
+
+
+def test_flush_session_waits_for_running_background_flush():
+    flusher = SessionFlusher(interval=3600)
+    session = SlowSession()
+    flusher.mark_dirty(session)
+
+    background = threading.Thread(target=flusher.flush)
+    background.start()
+    assert session.flush_started.wait(5)
+
+    reader = threading.Thread(target=flusher.flush_session, args=("s1",))
+    reader.start()
+    reader.join(0.1)
+    assert reader.is_alive()  # Still waiting for the running flush
+
+    session.release.set()
+    reader.join(5)
+    background.join(5)
+    assert session.written
+    assert flusher._flushing == {}
+
+
+def test_flush_session_without_pending_writes_returns():
+    flusher = SessionFlusher(interval=3600)
+    flusher.flush_session("unknown")
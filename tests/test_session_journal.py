@@ -0,0 +1,89 @@
+"""Crash recovery of the files backend's conversation journal."""
+
+from backend.persistence import append_jsonl
+from backend.session_store import FileSessionStore
+
+
+def message(i):
+    return {"op": "message", "role": "user", "content": f"message {i}"}
+
+
+def make_store(tmp_path):
+    store = FileSessionStore(str(tmp_path / "sessions"), str(tmp_path / "blobs"))
+    store.create_session("s1")
+    return store
+
+
+def test_append_after_torn_tail_keeps_later_messages(tmp_path):
+    store = make_store(tmp_path)
+    journal_path = store.session_dir("s1") / "conversation.jsonl"
+    store.append_conversation("s1", [message(i) for i in range(5)])
+
+    # Crash in the middle of writing the sixth entry
+    with open(journal_path, "ab") as f:
+        f.write(b'{"op": "message", "role": "us')
+
+    store.append_conversation("s1", [message(i) for i in range(5, 9)])
+
+    conversation, replayed = store.read_conversation("s1")
+    assert [m["content"] for m in conversation["messages"]] == [f"message {i}" for i in range(9)]
+    assert replayed == 9
+    assert journal_path.read_bytes().endswith(b"\n")
+
+
+def test_torn_multibyte_character_is_cut_off(tmp_path):
+    journal_path = tmp_path / "journal.jsonl"
+    append_jsonl(journal_path, [{"content": "שלום"}])
+    with open(journal_path, "ab") as f:
+        f.write('{"content": "של'.encode("utf-8")[:-1])
+
+    append_jsonl(journal_path, [{"content": "עוד"}])
+
+    lines = journal_path.read_text(encoding="utf-8").splitlines()
+    assert lines == ['{"content": "שלום"}', '{"content": "עוד"}']
+
+
+def test_reader_skips_only_the_undecodable_line(tmp_path):
+    store = make_store(tmp_path)
+    journal_path = store.session_dir("s1") / "conversation.jsonl"
+    with open(journal_path, "wb") as f:
+        f.write(b'{"op": "message", "role": "user", "content": "message 0"}\n')
+        f.write(b'{"op": "message", "ro{"op": "message", "role": "user", "content": "lost"}\n')
+        f.write(b'{"op": "message", "role": "user", "content": "message 2"}\n')
+
+    conversation, _ = store.read_conversation("s1")
+    assert [m["content"] for m in conversation["messages"]] == ["message 0", "message 2"]
+
+
+def test_journal_left_by_interrupted_compaction_is_not_replayed(tmp_path):
+    store = make_store(tmp_path)
+    journal_path = store.session_dir("s1") / "conversation.jsonl"
+    store.write_conversation("s1", {"session_id": "s1", "created_at": "t", "messages": []})
+    store.append_conversation("s1", [message(i) for i in range(5)])
+
+    # Compaction writes the snapshot, then the process dies before the
+    # journal is deleted
+    conversation, _ = store.read_conversation("s1")
+    journal = journal_path.read_bytes()
+    store.write_conversation("s1", conversation)
+    journal_path.write_bytes(journal)
+
+    conversation, replayed = store.read_conversation("s1")
+    assert [m["content"] for m in conversation["messages"]] == [f"message {i}" for i in range(5)]
+    assert replayed == 0
+    assert "folded_journal" not in conversation
+
+    store.append_conversation("s1", [message(5)])
+    conversation, replayed = store.read_conversation("s1")
+    assert len(conversation["messages"]) == 6
+    assert replayed == 1
+
+
+def test_journal_without_header_is_replayed(tmp_path):
+    store = make_store(tmp_path)
+    store.write_conversation("s1", {"session_id": "s1", "created_at": "t", "messages": [message(0)]})
+    append_jsonl(store.session_dir("s1") / "conversation.jsonl", [message(1)])
+
+    conversation, replayed = store.read_conversation("s1")
+    assert len(conversation["messages"]) == 2
+    assert replayed == 1
@@ -0,0 +1,87 @@
+"""Resuming a session from its state snapshot plus the conversation journal."""
+
+from langchain_core.messages import AIMessage, HumanMessage
+
+from backend.conversation_manager import ConversationManager
+from backend.resources import get_session_store
+from backend.session_manager import SessionManager
+from backend.state_snapshot import decode_state
+
+
+def save_turns(manager, first, count):
+    for i in range(first, first + count):
+        manager.messages.append(HumanMessage(content=f"question {i}"))
+        manager.messages.append(AIMessage(content=f"answer {i}"))
+    manager._save_state()
+
+
+def contents(manager):
+    return [msg.content for msg in manager.messages if isinstance(msg, (HumanMessage, AIMessage))]
+
+
+def test_snapshot_holds_no_messages(config):
+    manager = ConversationManager()
+    save_turns(manager, 0, 3)
+
+    state = decode_state(get_session_store().read_state_snapshot(manager.get_session_id()))
+    assert "messages" not in state
+    assert state["message_count"] == len(manager.messages)
+
+
+def test_resume_rebuilds_messages_from_journal(config):
+    manager = ConversationManager()
+    save_turns(manager, 0, 3)
+    manager.template.patient_age = "7"
+    save_turns(manager, 3, 2)
+    assert SessionManager(manager.get_session_id()).load_state_snapshot() is not None
+
+    resumed = ConversationManager(manager.get_session_id())
+    assert contents(resumed) == contents(manager)
+    assert resumed.template.patient_age == "7"
+    assert resumed._extracted_upto == manager._extracted_upto
+
+
+def test_snapshot_at_another_journal_position_is_ignored(config):
+    manager = ConversationManager()
+    save_turns(manager, 0, 2)
+    store = get_session_store()
+    old_snapshot = store.read_state_snapshot(manager.get_session_id())
+    save_turns(manager, 2, 2)
+
+    # A snapshot left behind from an earlier flush describes fewer messages
+    store.write_state_snapshot(manager.get_session_id(), old_snapshot)
+    assert SessionManager(manager.get_session_id()).load_state_snapshot() is None
+
+    resumed = ConversationManager(manager.get_session_id())
+    assert contents(resumed) == contents(manager)
+
+
+class FakeSummaryModel:
+    def invoke(self, messages):
+        return AIMessage(content="summary")
+
+
+def test_summary_scheduling_materializes_only_folded_messages(config, monkeypatch):
+    monkeypatch.setattr(config, "context_window_exchanges", 2)
+    monkeypatch.setattr(config, "summary_batch_exchanges", 2)
+    monkeypatch.setattr(ConversationManager, "model", FakeSummaryModel())
+    manager = ConversationManager()
+    manager.phase = "MENTORING"
+    manager.session_manager.mark_phase_transition()
+    save_turns(manager, 0, 3)
+
+    # Too few exchanges outside the window - nothing is read back
+    resumed = ConversationManager(manager.get_session_id())
+    assert resumed.phase == "MENTORING"
+    resumed._schedule_summary_update()
+    assert resumed._pending_summary is None
+    assert resumed.messages.materialized_count() == 0
+
+    save_turns(manager, 3, 5)
+    resumed = ConversationManager(manager.get_session_id())
+    resumed._schedule_summary_update()
+    resumed._wait_for_summary()
+    assert resumed._context_summary == "summary"
+    # The verbatim window stays unmaterialized
+    assert resumed.messages.materialized_count() == resumed._summarized_upto
+    assert resumed._summarized_upto == len(resumed.messages) - 4
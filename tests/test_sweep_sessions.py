@@ -0,0 +1,44 @@
+"""Finding abandoned empty sessions."""
+
+import os
+import time
+from datetime import datetime, timedelta
+
+from backend.session_store import FileSessionStore
+from sweep_sessions import find_empty_sessions
+
+
+def age_files(store, session_id, hours):
+    timestamp = time.time() - hours * 3600
+    session_dir = store.session_dir(session_id)
+    for path in [session_dir, *session_dir.iterdir()]:
+        os.utime(path, (timestamp, timestamp))
+
+
+def test_sessions_without_conversation_are_aged_by_their_last_write(tmp_path):
+    store = FileSessionStore(str(tmp_path / "sessions"), str(tmp_path / "blobs"))
+    for session_id in ("new", "old", "new-empty-dir", "old-empty-dir"):
+        store.create_session(session_id)
+    store.write_template("new", {})
+    store.write_template("old", {})
+    age_files(store, "old", 48)
+    age_files(store, "old-empty-dir", 48)
+
+    assert sorted(find_empty_sessions(store, timedelta(hours=24))) == ["old", "old-empty-dir"]
+
+
+def test_sessions_with_user_messages_or_recent_creation_are_kept(tmp_path):
+    store = FileSessionStore(str(tmp_path / "sessions"), str(tmp_path / "blobs"))
+    old = (datetime.now() - timedelta(hours=48)).isoformat()
+    for session_id, created_at, messages in [
+        ("talked", old, [{"role": "user", "content": "hi"}]),
+        ("recent", datetime.now().isoformat(), []),
+        ("abandoned", old, []),
+    ]:
+        store.create_session(session_id)
+        store.write_conversation(session_id, {
+            "session_id": session_id, "created_at": created_at, "phase_transition_at": None,
+            "model": None, "messages": messages,
+        })
+
+    assert find_empty_sessions(store, timedelta(hours=24)) == ["abandoned"]
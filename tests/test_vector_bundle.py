@@ -0,0 +1,100 @@
+"""Exporting and loading portable scenario bundles."""
+
+import numpy as np
+import pytest
+
+from backend import vector_index
+from backend.vector_index import NumpyVectorIndex, bundle_exists, read_bundle_manifest
+
+MODEL = "models/text-embedding-004"
+
+
+def make_index(count, dimension=8, seed=0, space="cosine"):
+    vectors = np.random.default_rng(seed).normal(size=(count, dimension)).astype(np.float32)
+    documents = [
+        {"id": f"s{i}", "title": f"Scenario {i}", "content": f"text {i}", "metadata": {"id": f"s{i}"}}
+        for i in range(count)
+    ]
+    return NumpyVectorIndex(vectors, documents, space)
+
+
+def test_bundle_round_trip(tmp_path):
+    index = make_index(20)
+    manifest = index.export_bundle(str(tmp_path / "bundle"), MODEL)
+    assert manifest["count"] == 20 and manifest["dimension"] == 8 and manifest["space"] == "cosine"
+
+    loaded = NumpyVectorIndex.from_bundle(str(tmp_path / "bundle"), MODEL)
+    assert not loaded.vectors.flags.writeable  # Read-only memory map, not a copy
+    assert loaded.documents == index.documents
+    queries = index.vectors[:3] + 0.01
+    assert loaded.search(queries, 5) == index.search(queries, 5)
+
+
+def test_bundle_with_another_embedding_model_is_rejected(tmp_path):
+    make_index(5).export_bundle(str(tmp_path / "bundle"), MODEL)
+    with pytest.raises(ValueError):
+        NumpyVectorIndex.from_bundle(str(tmp_path / "bundle"), "another-model")
+
+
+def test_re_export_replaces_the_whole_bundle(tmp_path):
+    bundle_dir = tmp_path / "bundle"
+    make_index(20).export_bundle(str(bundle_dir), MODEL)
+    manifest = make_index(7, dimension=4, seed=1).export_bundle(str(bundle_dir), MODEL)
+
+    assert read_bundle_manifest(str(bundle_dir)) == manifest
+    loaded = NumpyVectorIndex.from_bundle(str(bundle_dir), MODEL)
+    assert loaded.vectors.shape == (7, 4)
+    # No temporary or old bundle directories are left next to it
+    assert [p.name for p in tmp_path.iterdir()] == ["bundle"]
+
+
+def test_failed_export_keeps_the_old_bundle(tmp_path, monkeypatch):
+    bundle_dir = tmp_path / "bundle"
+    old_manifest = make_index(20).export_bundle(str(bundle_dir), MODEL)
+
+    def fail(path, array):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(np, "save", fail)
+    with pytest.raises(OSError):
+        make_index(7, seed=1).export_bundle(str(bundle_dir), MODEL)
+
+    assert read_bundle_manifest(str(bundle_dir)) == old_manifest
+    assert len(NumpyVectorIndex.from_bundle(str(bundle_dir), MODEL)) == 20
+    assert [p.name for p in tmp_path.iterdir()] == ["bundle"]
+
+
+def test_export_refuses_to_replace_a_non_bundle_directory(tmp_path):
+    (tmp_path / "data").mkdir()
+    (tmp_path / "data" / "notes.txt").write_text("keep me")
+    with pytest.raises(ValueError):
+        make_index(3).export_bundle(str(tmp_path / "data"), MODEL)
+    assert not bundle_exists(str(tmp_path / "data"))
+    assert (tmp_path / "data" / "notes.txt").exists()
+
+
+def test_load_retries_when_bundle_is_swapped_after_manifest_read(tmp_path, monkeypatch):
+    bundle_dir = tmp_path / "bundle"
+    make_index(20).export_bundle(str(bundle_dir), MODEL)
+    reads = []
+
+    def read_then_swap(path):
+        manifest = read_bundle_manifest(path)
+        reads.append(manifest)
+        if len(reads) == 1:
+            # Re-export lands between the manifest read and the file load
+            make_index(7, dimension=4, seed=1).export_bundle(str(bundle_dir), MODEL)
+        return manifest
+
+    monkeypatch.setattr(vector_index, "read_bundle_manifest", read_then_swap)
+    loaded = NumpyVectorIndex.from_bundle(str(bundle_dir), MODEL)
+    assert loaded.vectors.shape == (7, 4)
+    assert len(reads) > 2
+
+
+def test_invalid_bundle_is_not_retried_forever(tmp_path):
+    bundle_dir = tmp_path / "bundle"
+    make_index(5).export_bundle(str(bundle_dir), MODEL)
+    np.save(bundle_dir / "vectors.npy", np.zeros((3, 8), dtype=np.float32))
+    with pytest.raises(ValueError, match="does not match its manifest"):
+        NumpyVectorIndex.from_bundle(str(bundle_dir), MODEL)
@@ -0,0 +1,45 @@
+"""NumPy index scores and order against Chroma's distance functions."""
+
+import math
+
+import numpy as np
+import pytest
+
+from backend.vector_index import NumpyVectorIndex
+
+# d3 duplicates d0, so every space has a tie broken by ingestion order
+VECTORS = [[1.0, 0.0], [0.0, 2.0], [1.0, 1.0], [1.0, 0.0]]
+QUERY = [2.0, 0.0]
+
+# Chroma (hnswlib) distances: l2 is the squared distance, cosine is
+# 1 - cosine similarity, ip is 1 - dot product
+EXPECTED = {
+    "l2": [(0, 1.0), (3, 1.0), (2, 2.0), (1, 8.0)],
+    "cosine": [(0, 0.0), (3, 0.0), (2, 1.0 - 1.0 / math.sqrt(2)), (1, 1.0)],
+    "ip": [(0, -1.0), (2, -1.0), (3, -1.0), (1, 1.0)],
+}
+
+
+def assert_results(results, expected):
+    assert [row for row, _ in results] == [row for row, _ in expected]
+    assert [score for _, score in results] == pytest.approx([score for _, score in expected], abs=1e-6)
+
+
+def make_index(space):
+    documents = [{"id": f"d{i}", "title": f"D{i}", "content": "", "metadata": {}} for i in range(len(VECTORS))]
+    return NumpyVectorIndex(np.asarray(VECTORS, dtype=np.float32), documents, space)
+
+
+@pytest.mark.parametrize("space", sorted(EXPECTED))
+def test_scores_and_order_match_chroma(space):
+    assert_results(make_index(space).search([QUERY], 4)[0], EXPECTED[space])
+
+
+@pytest.mark.parametrize("space", sorted(EXPECTED))
+def test_top_k_and_row_filter_keep_chroma_order(space):
+    index = make_index(space)
+    assert_results(index.search([QUERY], 2)[0], EXPECTED[space][:2])
+
+    allowed = [3, 1, 2]
+    expected = [(row, score) for row, score in EXPECTED[space] if row in allowed]
+    assert_results(index.search([QUERY], 3, rows=allowed)[0], expected)